@@ -0,0 +1,175 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Background renewal of authentication tokens ahead of expiry."""
+
+import datetime
+import os
+import threading
+
+from openstack import _log
+
+#: Default number of seconds before expiry at which tokens are renewed. This
+#: must be larger than the window in which keystoneauth itself considers a
+#: token as expiring, so that requests never have to re-authenticate.
+DEFAULT_REFRESH_WINDOW = 300
+#: Seconds to wait before retrying after a failed renewal, or before checking
+#: again when no token has been fetched yet.
+RETRY_INTERVAL = 10
+
+
+class TokenRefresher:
+    """Renew the token of an auth plugin in a background thread.
+
+    A single refresher is shared by all connections using the same session,
+    so that only one thread ever renews a given token. Connections register
+    with :meth:`acquire` and unregister with :meth:`release`; the thread
+    stops once no connection uses it anymore.
+
+    :param auth: The keystoneauth plugin holding the token.
+    :param renew: Callable fetching a new token and installing it in
+        ``auth`` without invalidating the current one first.
+    :param int window: Seconds before expiry at which to renew the token.
+        Tokens are renewed half way through their lifetime at the latest, so
+        that short-lived tokens are not renewed continuously.
+    """
+
+    def __init__(self, auth, renew, window=DEFAULT_REFRESH_WINDOW):
+        self.log = _log.setup_logging('openstack')
+        self._auth = auth
+        self._renew = renew
+        self.window = int(window)
+        self._lock = threading.Lock()
+        self._users = 0
+        self._stopped = threading.Event()
+        self._thread = None
+        self._pid = os.getpid()
+
+    def acquire(self):
+        """Register a user of the refresher, starting it if needed."""
+        with self._lock:
+            self._users += 1
+            if self._thread is None:
+                self._start()
+
+    def _start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='openstacksdk-token-refresh',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def reset_after_fork(self):
+        """Restart the refresher in a forked child process.
+
+        The refresher thread does not survive a fork, so a new one is
+        started if the refresher was in use. Connections sharing the
+        refresher may all call this; it only acts once per process.
+        """
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        if self._users:
+            self._start()
+
+    def release(self):
+        """Unregister a user of the refresher, stopping it if unused."""
+        with self._lock:
+            self._users = max(self._users - 1, 0)
+            if self._users or self._thread is None:
+                return
+            self._stopped.set()
+            thread, self._thread = self._thread, None
+        if thread is not threading.current_thread():
+            thread.join()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def next_refresh_delay(self):
+        """Return the number of seconds until the token should be renewed."""
+        auth_ref = getattr(self._auth, 'auth_ref', None)
+        if auth_ref is None or auth_ref.expires is None:
+            # Nothing to renew until the first request authenticates.
+            return RETRY_INTERVAL
+        window = self.window
+        issued = getattr(auth_ref, 'issued', None)
+        if issued is not None:
+            # A token living no longer than the window would be renewed
+            # again as soon as it is fetched.
+            lifetime = (auth_ref.expires - issued).total_seconds()
+            window = min(window, lifetime / 2)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        remaining = (auth_ref.expires - now).total_seconds()
+        return max(remaining - window, 0)
+
+    def refresh(self):
+        """Renew the token if it is within the refresh window.
+
+        :returns: True if the token was renewed.
+        """
+        if self.next_refresh_delay() > 0:
+            return False
+        auth_ref = getattr(self._auth, 'auth_ref', None)
+        if auth_ref is None or auth_ref.expires is None:
+            return False
+        self.log.debug('Renewing token ahead of its expiry')
+        self._renew()
+        return True
+
+    def _run(self):
+        delay = self.next_refresh_delay()
+        while not self._stopped.wait(delay):
+            try:
+                self.refresh()
+            except Exception:
+                self.log.exception('Failed to renew token, will retry')
+                delay = RETRY_INTERVAL
+            else:
+                delay = max(self.next_refresh_delay(), RETRY_INTERVAL)
+
+
+_registry_lock = threading.Lock()
+
+
+def _reset_registry_lock():
+    global _registry_lock
+    _registry_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_registry_lock)
+
+
+def get_token_refresher(session, renew, window=None):
+    """Return the refresher shared by all users of ``session``.
+
+    :param session: The keystoneauth session whose token should be renewed.
+    :param renew: Callable renewing the token, used if a new refresher has
+        to be created.
+    :param int window: Refresh window, used if a new refresher has to be
+        created. Defaults to :data:`DEFAULT_REFRESH_WINDOW`.
+    """
+    with _registry_lock:
+        refresher = getattr(session, '_sdk_token_refresher', None)
+        if refresher is None:
+            refresher = TokenRefresher(
+                session.auth, renew, window or DEFAULT_REFRESH_WINDOW
+            )
+            session._sdk_token_refresher = refresher
+        return refresher
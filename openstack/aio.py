@@ -0,0 +1,783 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Native asyncio access to OpenStack services.
+
+An :class:`AsyncProxy` wraps a regular service proxy, such as
+``conn.compute``, and sends requests with an asynchronous HTTP client instead
+of keystoneauth and ``requests``. It reuses the auth plugin, the service
+discovery results and the negotiated microversions of the wrapped proxy, so
+only the very first request, and token renewals, run in a thread.
+
+The module level coroutines mirror the corresponding
+:class:`~openstack.resource.Resource` methods and work with the same
+resource classes:
+
+.. code-block:: python
+
+    from openstack import aio
+    from openstack.compute.v2 import server as _server
+
+    async with aio.AsyncProxy(conn.compute) as compute:
+        async for server in aio.list(compute, _server.Server):
+            print(server.name)
+        server = await aio.fetch(compute, _server.Server(id=server_id))
+        await aio.wait_for_status(compute, server, 'ACTIVE')
+
+The default HTTP client requires the ``httpx`` package. Any other client can
+be used by passing an object implementing :class:`AsyncHTTPClient`.
+"""
+
+import asyncio
+import datetime
+import functools
+import time
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from keystoneauth1.identity import base as ks_identity
+from keystoneauth1 import session as ks_session
+import requests
+import requests.structures
+
+from openstack import _log
+from openstack import exceptions
+from openstack import resource as _resource
+
+LOG = _log.setup_logging(__name__)
+
+__all__ = [
+    'AsyncHTTPClient',
+    'AsyncProxy',
+    'HTTPXClient',
+    'create',
+    'commit',
+    'delete',
+    'fetch',
+    'list',
+    'wait_for_status',
+]
+
+#: Delay before the first retry of a request which failed with one of the
+#: retriable status codes of the proxy. It doubles with every retry.
+STATUS_CODE_RETRY_DELAY = 0.5
+#: Maximum delay between two retries of a request.
+MAX_RETRY_DELAY = 60.0
+
+
+class AsyncHTTPClient:
+    """Interface of the HTTP clients used by :class:`AsyncProxy`.
+
+    Clients receive fully prepared requests, with URL, query string, body and
+    headers already computed, and return a :class:`requests.Response` so that
+    responses can be processed exactly like those of synchronous calls.
+    """
+
+    async def send(self, request):
+        """Send a request.
+
+        :param request: A :class:`requests.PreparedRequest`.
+        :returns: A :class:`requests.Response`.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Release all resources held by the client."""
+
+
+class HTTPXClient(AsyncHTTPClient):
+    """Send requests with an ``httpx.AsyncClient``.
+
+    TLS settings and the timeout are taken from the keystoneauth session.
+
+    :param session: The :class:`~keystoneauth1.session.Session` to take
+        settings from.
+    :param int max_connections: Maximum number of concurrent connections.
+    """
+
+    def __init__(self, session, max_connections=None):
+        if httpx is None:
+            raise exceptions.SDKException(
+                "The httpx library is required for asyncio support"
+            )
+        kwargs = {
+            'verify': session.verify,
+            'timeout': session.timeout,
+            'limits': httpx.Limits(max_connections=max_connections),
+        }
+        if session.cert:
+            kwargs['cert'] = session.cert
+        self._client = httpx.AsyncClient(**kwargs)
+
+    async def send(self, request):
+        start = time.monotonic()
+        result = await self._client.request(
+            request.method,
+            request.url,
+            headers=dict(request.headers),
+            content=request.body,
+        )
+        return make_response(
+            request,
+            result.status_code,
+            result.headers,
+            result.content,
+            reason=result.reason_phrase,
+            elapsed=time.monotonic() - start,
+        )
+
+    async def close(self):
+        await self._client.aclose()
+
+
+def make_response(
+    request, status_code, headers, content, reason=None, elapsed=0
+):
+    """Build a :class:`requests.Response` from the parts of a response.
+
+    :param request: The :class:`requests.PreparedRequest` that was sent.
+    :param int status_code: HTTP status code.
+    :param headers: A mapping of response headers.
+    :param bytes content: The response body.
+    :param str reason: HTTP reason phrase.
+    :param float elapsed: Duration of the request in seconds.
+    """
+    response = requests.Response()
+    response.request = request
+    response.url = request.url
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response._content = content
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    return response
+
+
+class AsyncProxy:
+    """Asynchronous access to the service of a proxy.
+
+    :param proxy: The :class:`~openstack.proxy.Proxy` to wrap.
+    :param client: An :class:`AsyncHTTPClient`. Defaults to a new
+        :class:`HTTPXClient`, which is closed with the proxy.
+    :param int max_concurrency: Maximum number of requests in flight at once.
+        Unlimited by default.
+    """
+
+    def __init__(self, proxy, client=None, max_concurrency=None):
+        self._proxy = proxy
+        self._client = client
+        self._owns_client = client is None
+        self._endpoint = None
+        self._microversions = {}
+        self._semaphore = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        )
+
+    @property
+    def proxy(self):
+        """The wrapped synchronous proxy."""
+        return self._proxy
+
+    @property
+    def service_type(self):
+        return self._proxy.service_type
+
+    @property
+    def default_microversion(self):
+        return self._proxy.default_microversion
+
+    @property
+    def retriable_status_codes(self):
+        return self._proxy.retriable_status_codes
+
+    def _get_connection(self):
+        return self._proxy._get_connection()
+
+    def _get_client(self):
+        if self._client is None:
+            self._client = HTTPXClient(self._proxy.session)
+        return self._client
+
+    async def _run_sync(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_endpoint(self):
+        """Return the endpoint of the service, discovering it if needed."""
+        if self._endpoint is None:
+            self._endpoint = await self._run_sync(self._proxy.get_endpoint)
+        return self._endpoint
+
+    async def get_microversion(self, resource_type, action):
+        """Return the microversion to use for an action on a resource type.
+
+        The result of :meth:`~openstack.resource.Resource._get_microversion`
+        is cached, since it may require version discovery.
+        """
+        if self.default_microversion:
+            return self.default_microversion
+        key = (resource_type, action)
+        if key not in self._microversions:
+            self._microversions[key] = await self._run_sync(
+                resource_type._get_microversion, self._proxy, action=action
+            )
+        return self._microversions[key]
+
+    def _auth_is_valid(self):
+        auth = self._proxy.auth or self._proxy.session.auth
+        auth_ref = getattr(auth, 'auth_ref', None)
+        return auth_ref is not None and not auth_ref.will_expire_soon(
+            ks_identity.BaseIdentityPlugin.MIN_TOKEN_LIFE_SECONDS
+        )
+
+    async def _get_auth_headers(self, invalidate=False):
+        if invalidate:
+            auth = self._proxy.auth or self._proxy.session.auth
+            await self._run_sync(auth.invalidate)
+        elif self._auth_is_valid():
+            # The token is cached by the plugin, no I/O needed
+            return self._proxy.get_auth_headers() or {}
+        return await self._run_sync(self._proxy.get_auth_headers) or {}
+
+    def _get_user_agent(self):
+        return (
+            self._proxy.user_agent
+            or self._proxy.session.user_agent
+            or ks_session.DEFAULT_USER_AGENT
+        )
+
+    async def _prepare(
+        self,
+        url,
+        method,
+        json=None,
+        data=None,
+        headers=None,
+        params=None,
+        microversion=None,
+        global_request_id=None,
+    ):
+        if not url.startswith(('http://', 'https://')):
+            endpoint = await self.get_endpoint()
+            url = '{}/{}'.format(endpoint.rstrip('/'), url.lstrip('/'))
+
+        final_headers = dict(self._proxy.session.additional_headers or {})
+        final_headers.update(self._proxy.additional_headers)
+        final_headers.update(headers or {})
+        final_headers.setdefault('User-Agent', self._get_user_agent())
+        final_headers.setdefault('Accept', 'application/json')
+        if microversion is None:
+            microversion = self.default_microversion
+        if microversion:
+            ks_session.Session._set_microversion_headers(
+                final_headers, microversion, self.service_type, None
+            )
+        if not global_request_id:
+            global_request_id = (
+                self._proxy.global_request_id
+                or self._get_connection()._global_request_id
+            )
+        if global_request_id:
+            final_headers[ks_session._REQUEST_ID_HEADER] = global_request_id
+
+        return requests.Request(
+            method,
+            url,
+            headers=final_headers,
+            json=json,
+            data=data,
+            params=params,
+        ).prepare()
+
+    async def request(
+        self,
+        url,
+        method,
+        *,
+        json=None,
+        data=None,
+        headers=None,
+        params=None,
+        microversion=None,
+        error_message=None,
+        raise_exc=False,
+        retriable_status_codes=None,
+        global_request_id=None,
+    ):
+        """Send an HTTP request to the service.
+
+        This mirrors :meth:`openstack.proxy.Proxy.request`: relative URLs
+        are joined to the service endpoint, statistics are reported and
+        cached responses of the service are invalidated by modifying
+        requests. Responses of ``GET`` requests are never served from the
+        API cache.
+
+        :param str url: URL relative to the service endpoint, or absolute.
+        :param str method: HTTP method.
+        :param json: Body to send serialized as JSON.
+        :param data: Raw body to send.
+        :param dict headers: Additional headers.
+        :param dict params: Query parameters.
+        :param str microversion: Microversion to request.
+        :param str error_message: Message of the exception raised on error
+            when ``raise_exc`` is set.
+        :param bool raise_exc: Raise an
+            :class:`~openstack.exceptions.HttpException` on error responses.
+        :param retriable_status_codes: Status codes to retry on. Defaults to
+            those of the wrapped proxy.
+        :param str global_request_id: Value of the global request ID header.
+        :returns: A :class:`requests.Response`.
+        """
+        request = await self._prepare(
+            url,
+            method,
+            json=json,
+            data=data,
+            headers=headers,
+            params=params,
+            microversion=microversion,
+            global_request_id=global_request_id,
+        )
+
+        if retriable_status_codes is None:
+            retriable_status_codes = self.retriable_status_codes
+        retriable_status_codes = set(retriable_status_codes or ())
+        retries = self._proxy.status_code_retries or 0
+        delay = self._proxy.status_code_retry_delay or STATUS_CODE_RETRY_DELAY
+        reauthenticated = False
+
+        try:
+            while True:
+                request.headers.update(
+                    await self._get_auth_headers(invalidate=reauthenticated)
+                )
+                if self._semaphore is not None:
+                    async with self._semaphore:
+                        response = await self._get_client().send(request)
+                else:
+                    response = await self._get_client().send(request)
+
+                if response.status_code == 401 and not reauthenticated:
+                    # The token may have been revoked, authenticate again
+                    reauthenticated = True
+                    continue
+                reauthenticated = False
+                if response.status_code in retriable_status_codes and retries:
+                    retries -= 1
+                    LOG.debug(
+                        'Retrying %s %s after status %s in %s seconds',
+                        method,
+                        request.url,
+                        response.status_code,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, MAX_RETRY_DELAY)
+                    continue
+                break
+        except Exception as e:
+            self._proxy._report_stats(None, url, method, e)
+            raise
+
+        conn = self._get_connection()
+        if method != 'GET' and conn.cache_enabled:
+            # Responses cached by synchronous calls are now outdated
+            self._proxy._invalidate_cache(
+                conn, self._proxy._get_cache_key_prefix(url)
+            )
+        self._proxy._report_stats(response)
+        if raise_exc:
+            exceptions.raise_from_response(
+                response, error_message=error_message
+            )
+        return response
+
+    async def get(self, url, **kwargs):
+        return await self.request(url, 'GET', **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request(url, 'HEAD', **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request(url, 'POST', **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request(url, 'PUT', **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request(url, 'PATCH', **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request(url, 'DELETE', **kwargs)
+
+    async def close(self):
+        """Close the HTTP client if it was created by this proxy."""
+        if self._owns_client and self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+async def create(
+    session,
+    resource,
+    prepend_key=True,
+    base_path=None,
+    *,
+    resource_request_key=None,
+    resource_response_key=None,
+    microversion=None,
+    **params,
+):
+    """Create a remote resource, see :meth:`Resource.create`.
+
+    :param session: The :class:`AsyncProxy` to use for the request.
+    :param resource: The :class:`~openstack.resource.Resource` to create.
+    :returns: The updated ``resource``.
+    """
+    if not resource.allow_create:
+        raise exceptions.MethodNotSupported(resource, 'create')
+
+    if microversion is None:
+        microversion = await session.get_microversion(type(resource), 'create')
+    requires_id = (
+        resource.create_requires_id
+        if resource.create_requires_id is not None
+        else resource.create_method == 'PUT'
+    )
+    if resource.create_method not in ('PUT', 'POST'):
+        raise exceptions.ResourceFailure(
+            f"Invalid create method: {resource.create_method}"
+        )
+
+    request_kwargs = {
+        "requires_id": requires_id,
+        "prepend_key": prepend_key,
+        "base_path": base_path,
+    }
+    if resource_request_key is not None:
+        request_kwargs['resource_request_key'] = resource_request_key
+
+    if resource.create_exclude_id_from_body:
+        resource._body._dirty.discard("id")
+
+    request = resource._prepare_request(**request_kwargs)
+    response = await session.request(
+        request.url,
+        resource.create_method,
+        json=request.body,
+        headers=request.headers,
+        microversion=microversion,
+        params=params,
+    )
+
+    has_body = (
+        resource.has_body
+        if resource.create_returns_body is None
+        else resource.create_returns_body
+    )
+    resource.microversion = microversion
+    resource._translate_response(
+        response,
+        has_body=has_body,
+        resource_response_key=resource_response_key,
+    )
+    # direct comparision to False since we need to rule out None
+    if resource.has_body and resource.create_returns_body is False:
+        # fetch the body if it's required but not returned by create
+        return await fetch(
+            session, resource, resource_response_key=resource_response_key
+        )
+    return resource
+
+
+async def fetch(
+    session,
+    resource,
+    requires_id=True,
+    base_path=None,
+    error_message=None,
+    *,
+    resource_response_key=None,
+    microversion=None,
+    **params,
+):
+    """Fetch a remote resource, see :meth:`Resource.fetch`.
+
+    :param session: The :class:`AsyncProxy` to use for the request.
+    :param resource: The :class:`~openstack.resource.Resource` to fetch.
+    :returns: The updated ``resource``.
+    """
+    if not resource.allow_fetch:
+        raise exceptions.MethodNotSupported(resource, 'fetch')
+
+    request = resource._prepare_request(
+        requires_id=requires_id,
+        base_path=base_path,
+    )
+    if microversion is None:
+        microversion = await session.get_microversion(type(resource), 'fetch')
+    resource.microversion = microversion
+
+    response = await session.get(
+        request.url,
+        microversion=microversion,
+        params=params,
+    )
+    resource._translate_response(
+        response,
+        error_message=error_message,
+        resource_response_key=resource_response_key,
+    )
+    return resource
+
+
+async def commit(
+    session,
+    resource,
+    prepend_key=True,
+    has_body=True,
+    retry_on_conflict=None,
+    base_path=None,
+    *,
+    microversion=None,
+    **kwargs,
+):
+    """Commit a resource, see :meth:`Resource.commit`.
+
+    :param session: The :class:`AsyncProxy` to use for the request.
+    :param resource: The :class:`~openstack.resource.Resource` to commit.
+    :returns: The updated ``resource``.
+    """
+    if not resource.allow_commit:
+        raise exceptions.MethodNotSupported(resource, 'commit')
+
+    # The id cannot be dirty for an commit
+    resource._body._dirty.discard("id")
+
+    # Only try to update if we actually have anything to commit.
+    if not resource.requires_commit:
+        return resource
+
+    if resource.commit_jsonpatch:
+        kwargs['patch'] = True
+
+    request = resource._prepare_request(
+        prepend_key=prepend_key,
+        base_path=base_path,
+        **kwargs,
+    )
+    if microversion is None:
+        microversion = await session.get_microversion(type(resource), 'commit')
+
+    retriable_status_codes = set(session.retriable_status_codes or ())
+    if retry_on_conflict:
+        retriable_status_codes |= {409}
+    elif retry_on_conflict is not None:
+        retriable_status_codes -= {409}
+
+    method = resource.commit_method
+    if method not in ('PUT', 'POST', 'PATCH'):
+        raise exceptions.ResourceFailure(f"Invalid commit method: {method}")
+
+    response = await session.request(
+        request.url,
+        method,
+        json=request.body,
+        headers=request.headers,
+        microversion=microversion,
+        retriable_status_codes=retriable_status_codes,
+    )
+    resource.microversion = microversion
+    resource._translate_response(response, has_body=has_body)
+    return resource
+
+
+async def delete(
+    session, resource, error_message=None, *, microversion=None, **kwargs
+):
+    """Delete a remote resource, see :meth:`Resource.delete`.
+
+    :param session: The :class:`AsyncProxy` to use for the request.
+    :param resource: The :class:`~openstack.resource.Resource` to delete.
+    :returns: The ``resource``.
+    """
+    if not resource.allow_delete:
+        raise exceptions.MethodNotSupported(resource, 'delete')
+
+    request = resource._prepare_request(**kwargs)
+    if microversion is None:
+        microversion = await session.get_microversion(type(resource), 'delete')
+
+    response = await session.delete(
+        request.url,
+        headers=request.headers,
+        microversion=microversion,
+    )
+    resource._translate_response(
+        response, has_body=False, error_message=error_message
+    )
+    return resource
+
+
+async def list(
+    session,
+    resource_type,
+    paginated=True,
+    base_path=None,
+    *,
+    microversion=None,
+    headers=None,
+    **params,
+):
+    """List remote resources, see :meth:`Resource.list`.
+
+    This is an asynchronous generator, fetching pages as they are consumed.
+
+    :param session: The :class:`AsyncProxy` to use for the requests.
+    :param resource_type: The :class:`~openstack.resource.Resource` subclass
+        to list.
+    :returns: An asynchronous generator of ``resource_type`` instances.
+    """
+    if not resource_type.allow_list:
+        raise exceptions.MethodNotSupported(resource_type, 'list')
+
+    if microversion is None:
+        microversion = await session.get_microversion(resource_type, 'list')
+
+    uri, query_params, client_filters, uri_params = (
+        resource_type._prepare_list(base_path, params)
+    )
+    limit = query_params.get('limit')
+
+    headers_final = {"Accept": "application/json"}
+    if headers:
+        headers_final = {**headers_final, **headers}
+
+    total_yielded = 0
+    while uri:
+        response = await session.get(
+            uri,
+            headers=headers_final,
+            params=query_params.copy(),
+            microversion=microversion,
+        )
+        page = resource_type._process_list_page(
+            session,
+            response,
+            uri,
+            query_params,
+            microversion=microversion,
+            client_filters=client_filters,
+            uri_params=uri_params,
+            limit=limit,
+            paginated=paginated,
+            total_yielded=total_yielded,
+        )
+        while True:
+            try:
+                value = next(page)
+            except StopIteration as e:
+                uri, total_yielded = e.value
+                break
+            yield value
+
+
+async def wait_for_status(
+    session,
+    resource,
+    status,
+    failures=None,
+    interval=2,
+    wait=None,
+    attribute='status',
+    callback=None,
+):
+    """Wait for a resource to be in a particular status.
+
+    This is the asynchronous version of
+    :func:`openstack.resource.wait_for_status`, sleeping with
+    :func:`asyncio.sleep` between checks so that any number of resources can
+    be waited for concurrently.
+
+    :param session: The :class:`AsyncProxy` to use for the requests.
+    :param resource: The resource to wait on to reach the status.
+    :param status: Desired status of the resource.
+    :param failures: Statuses that would indicate the transition
+        failed such as 'ERROR'. Defaults to ['ERROR'].
+    :param interval: Number of seconds to wait between checks. Set to ``None``
+        to use the default interval.
+    :param wait: Maximum number of seconds to wait for transition.
+        Set to ``None`` to wait forever.
+    :param attribute: Name of the resource attribute that contains the status.
+    :param callback: A callback function. This will be called with a single
+        value, progress.
+    :return: The updated resource.
+    :raises: :class:`~openstack.exceptions.ResourceTimeout` if the transition
+        to status failed to occur in ``wait`` seconds.
+    :raises: :class:`~openstack.exceptions.ResourceFailure` if the resource
+        transitioned to one of the states in ``failures``.
+    """
+    current_status = getattr(resource, attribute)
+    if _resource._normalize_status(current_status) == (
+        _resource._normalize_status(status)
+    ):
+        return resource
+
+    if failures is None:
+        failures = ['ERROR']
+    failures = [f.lower() for f in failures]
+    if interval is None:
+        interval = 2
+    name = f"{resource.__class__.__name__}:{resource.id}"
+
+    loop = asyncio.get_running_loop()
+    deadline = None if wait is None else loop.time() + wait
+    while deadline is None or loop.time() < deadline:
+        resource = await fetch(session, resource)
+
+        new_status = getattr(resource, attribute)
+        normalized_status = _resource._normalize_status(new_status)
+        if normalized_status == _resource._normalize_status(status):
+            return resource
+        elif normalized_status in failures:
+            raise exceptions.ResourceFailure(
+                f"{name} transitioned to failure state {new_status}"
+            )
+
+        LOG.debug(
+            'Still waiting for resource %s to reach state %s, '
+            'current state is %s',
+            name,
+            status,
+            new_status,
+        )
+        if callback:
+            progress = getattr(resource, 'progress', None) or 0
+            callback(progress)
+
+        await asyncio.sleep(interval)
+
+    raise exceptions.ResourceTimeout(
+        f"Timeout waiting for {name} to transition to {status}"
+    )
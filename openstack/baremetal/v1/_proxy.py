@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
 import typing as ty
 
 import requests
@@ -538,6 +539,7 @@ class Proxy(proxy.Proxy):
         timeout=None,
         abort_on_failed_state=True,
         fail=True,
+        interval=None,
     ):
         """Wait for the nodes to reach the expected state.
 
@@ -553,6 +555,10 @@ class Proxy(proxy.Proxy):
             ``manageable`` transition is ``enroll`` again.
         :param fail: If set to ``False`` this call will not raise on timeouts
             and provisioning failures.
+        :param interval: Number of seconds to wait between checks, or a
+            :class:`~openstack.utils.WaitSchedule` such as
+            :class:`~openstack.utils.ExponentialBackoff`. Defaults to 2
+            seconds.
 
         :return: If `fail` is ``True`` (the default), the list of
             :class:`~openstack.baremetal.v1.node.Node` instances that reached
@@ -574,6 +580,10 @@ class Proxy(proxy.Proxy):
                 timeout,
                 f"Timeout waiting for nodes {log_nodes} to reach "
                 f"target state '{expected_state}'",
+                wait=interval,
+                stats=functools.partial(
+                    self._report_wait_stats, 'node.provision_state'
+                ),
             ):
                 nodes = [self.get_node(n) for n in remaining]
                 remaining = []
@@ -22,6 +22,7 @@ class Volume(resource.Resource, metadata.MetadataMixin):
     resource_key = "volume"
     resources_key = "volumes"
     base_path = "/volumes"
+    _details_base_path = "/volumes/detail"
 
     _query_mapping = resource.QueryParameters(
         'name',
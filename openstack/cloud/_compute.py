@@ -11,19 +11,26 @@
 # limitations under the License.
 
 import base64
+import collections
+import concurrent.futures
 import operator
 import time
+import typing as ty
 import warnings
 
 import iso8601
 
+from openstack.cloud import _image
 from openstack.cloud import _network_common
+from openstack.cloud import _reference_cache
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack.cloud import meta
 from openstack.compute.v2 import server as _server
 from openstack import exceptions
+from openstack import proxy
 from openstack import resource
+from openstack import scheduler
 from openstack import utils
 from openstack import warnings as os_warnings
 
@@ -49,6 +56,18 @@ _SERVER_FIELDS = (
     'tags',
 )
 
+# Arguments of create_servers entries used by the post-boot steps
+_POST_BOOT_ARGS = frozenset(
+    {
+        'auto_ip',
+        'ips',
+        'ip_pool',
+        'reuse_ips',
+        'nat_destination',
+        'attach_volumes',
+    }
+)
+
 
 def _to_bool(value):
     if isinstance(value, str):
@@ -70,6 +89,20 @@ def _pop_or_get(resource, key, default, strict):
         return resource.get(key, default)
 
 
+def _attach_volumes(cloud, server, volumes, deadline):
+    for volume in volumes:
+        if not isinstance(volume, dict):
+            volume = cloud.block_storage.find_volume(
+                volume, ignore_missing=False
+            )
+        cloud.attach_volume(
+            server,
+            volume,
+            wait=True,
+            timeout=max(deadline - time.time(), 1),
+        )
+
+
 class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
     @property
     def _compute_region(self):
@@ -183,6 +216,36 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         )
         return _utils._filter_list(servers, name_or_id, filters)
 
+    def iter_search_servers(
+        self,
+        name_or_id=None,
+        filters=None,
+        detailed=False,
+        all_projects=False,
+        bare=False,
+    ):
+        """Search servers, yielding them as they are listed
+
+        This is the generator version of :meth:`search_servers`. Pages of
+        servers are only requested, and servers only expanded, as the
+        generator is consumed.
+
+        :param name_or_id: Name or unique ID of the server(s).
+        :param filters: A dictionary of meta data to use for further filtering.
+            Elements of this dictionary may, themselves, be dictionaries.
+        :param detailed:
+        :param all_projects:
+        :param bare:
+
+        :returns: A generator of compute ``Server`` objects matching the
+            search criteria.
+        """
+        servers = (
+            self._expand_server(server, detailed, bare)
+            for server in self.compute.servers(all_projects=all_projects)
+        )
+        return _utils._iter_filter(servers, name_or_id, filters)
+
     def search_server_groups(self, name_or_id=None, filters=None):
         """Search server groups.
 
@@ -245,8 +308,22 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
             clouds.yaml by setting openstack.cloud.get_extra_specs to False.
         :returns: A list of compute ``Flavor`` objects.
         """
-        return list(
-            self.compute.flavors(details=True, get_extra_specs=get_extra)
+        flavors = self._reference_cache.get(
+            _reference_cache.FLAVORS,
+            get_extra,
+            lambda: _utils.IndexedList(
+                self.compute.flavors(details=True, get_extra_specs=get_extra),
+                index_keys=('is_public', 'ram', 'vcpus'),
+            ),
+        )
+        # Callers may modify the list, but not the cached one
+        return flavors.copy()
+
+    def _get_cached_flavor(self, name_or_id, get_extra):
+        if not self._reference_cache.enabled(_reference_cache.FLAVORS):
+            return None
+        return _utils._cached_match(
+            self.list_flavors(get_extra=get_extra), name_or_id
         )
 
     def list_server_security_groups(self, server):
@@ -387,13 +464,17 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         if not filters:
             filters = {}
 
-        return [
-            self._expand_server(server, detailed, bare)
-            for server in self.compute.servers(
-                all_projects=all_projects,
-                **filters,
-            )
-        ]
+        servers = self.compute.servers(
+            all_projects=all_projects,
+            **filters,
+        )
+        # Join the details of all servers at once rather than querying
+        # them for every server
+        if bare:
+            return list(servers)
+        elif detailed:
+            return meta.get_hostvars_from_servers(self, servers)
+        return meta.add_servers_interfaces(self, servers)
 
     def list_server_groups(self):
         """List all available server groups.
@@ -483,6 +564,9 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
             )
 
         if not filters:
+            flavor = self._get_cached_flavor(name_or_id, get_extra)
+            if flavor:
+                return flavor
             filters = {}
         return self.compute.find_flavor(
             name_or_id,
@@ -571,22 +655,16 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
                 "'search_servers' instead",
                 os_warnings.RemovedInSDK60Warning,
             )
-            entities = self.search_servers(
+            server = _utils._single_match(
+                self.iter_search_servers(
+                    name_or_id,
+                    filters,
+                    detailed=detailed,
+                    bare=True,
+                    all_projects=all_projects,
+                ),
                 name_or_id,
-                filters,
-                detailed=detailed,
-                bare=True,
-                all_projects=all_projects,
             )
-            if not entities:
-                return None
-
-            if len(entities) > 1:
-                raise exceptions.SDKException(
-                    f"Multiple matches found for {name_or_id}",
-                )
-
-            server = entities[0]
             return self._expand_server(server, detailed, bare)
 
         server = self.compute.find_server(
@@ -727,6 +805,9 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         image = self.compute.create_server_image(
             server, name=name, metadata=metadata, wait=wait, timeout=timeout
         )
+        # The image is created by the compute service, not through the image
+        # API which invalidates the cached images
+        self._reference_cache.invalidate(_reference_cache.IMAGES)
         return image
 
     def get_server_id(self, name_or_id):
@@ -889,6 +970,258 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         :raises: :class:`~openstack.exceptions.SDKException` on operation
             error.
         """
+        kwargs = self._get_server_create_kwargs(
+            name,
+            image=image,
+            flavor=flavor,
+            root_volume=root_volume,
+            terminate_volume=terminate_volume,
+            network=network,
+            boot_from_volume=boot_from_volume,
+            volume_size=volume_size,
+            boot_volume=boot_volume,
+            volumes=volumes,
+            group=group,
+            **kwargs,
+        )
+
+        server = self.compute.create_server(**kwargs)
+        # TODO(mordred) We're only testing this in functional tests. We need
+        # to add unit tests for this too.
+        admin_pass = server.admin_password or kwargs.get('admin_pass')
+        if not wait:
+            server = self.compute.get_server(server.id)
+            if server['status'] == 'ERROR':
+                if (
+                    'fault' in server
+                    and server['fault'] is not None
+                    and 'message' in server['fault']
+                ):
+                    raise exceptions.SDKException(
+                        "Error in creating the server. "
+                        "Compute service reports fault: {reason}".format(
+                            reason=server['fault']['message']
+                        ),
+                        extra_data=dict(server=server),
+                    )
+
+                raise exceptions.SDKException(
+                    "Error in creating the server "
+                    "(no further information available)",
+                    extra_data=dict(server=server),
+                )
+
+            server = meta.add_server_interfaces(self, server)
+
+        else:
+            server = self.wait_for_server(
+                server,
+                auto_ip=auto_ip,
+                ips=ips,
+                ip_pool=ip_pool,
+                reuse=reuse_ips,
+                timeout=timeout,
+                nat_destination=nat_destination,
+            )
+
+        server.admin_password = admin_pass
+        return server
+
+    def create_servers(
+        self,
+        servers,
+        wait=True,
+        timeout=180,
+        create_concurrency=10,
+        post_boot_concurrency=5,
+        interval=5,
+    ):
+        """Create many servers, streaming the outcome for each of them.
+
+        Provisioning runs as a pipeline. Servers are created concurrently,
+        and while others are still being created, all booting servers are
+        polled together with as few requests as possible, see
+        :meth:`~openstack.compute.v2._proxy.Proxy.wait_for_status_many`.
+        Every server reaching ``ACTIVE`` goes on to the post-boot steps
+        while the others are still booting: getting an IP address as
+        :meth:`create_server` does, then attaching volumes with
+        :meth:`attach_volume`.
+
+        :param servers: An iterable of dicts, each holding the arguments of
+            :meth:`create_server` for one server, except ``wait`` and
+            ``timeout``. A dict may also hold ``attach_volumes``, a list of
+            volume dicts, names or IDs to attach once the server is active.
+        :param wait: Whether to wait for the servers to become active and to
+            run the post-boot steps. If ``False``, servers are yielded as
+            soon as they are created.
+        :param timeout: Seconds to wait for all servers, including the
+            post-boot steps.
+        :param create_concurrency: Maximum number of servers being created
+            at once.
+        :param post_boot_concurrency: Maximum number of servers going
+            through the post-boot steps at once.
+        :param interval: Seconds to wait between two polls of the booting
+            servers.
+
+        :returns: A generator of :class:`~openstack.proxy.BulkResult`, one
+            per server, in completion order. ``item`` is the dict given for
+            the server and ``error`` the exception raised while provisioning
+            it, if any. ``result`` is the compute ``Server`` object, which is
+            also set if provisioning failed after the server was created so
+            that it can be cleaned up.
+        """
+        deadline = time.time() + timeout
+        specs = iter(servers)
+
+        def create(spec):
+            kwargs = {
+                k: v for k, v in spec.items() if k not in _POST_BOOT_ARGS
+            }
+            return self.compute.create_server(
+                **self._get_server_create_kwargs(**kwargs)
+            )
+
+        def finish(spec, server, admin_pass):
+            remaining = max(deadline - time.time(), 1)
+            result = self.get_active_server(
+                server=self._expand_server(server, detailed=False, bare=False),
+                auto_ip=spec.get('auto_ip', True),
+                ips=spec.get('ips'),
+                ip_pool=spec.get('ip_pool'),
+                reuse=spec.get('reuse_ips', True),
+                wait=True,
+                timeout=remaining,
+                nat_destination=spec.get('nat_destination'),
+            )
+            _attach_volumes(
+                self, result, spec.get('attach_volumes') or [], deadline
+            )
+            result.admin_password = admin_pass
+            return result
+
+        # Work goes through the scheduler of the connection. Only as many
+        # tasks as allowed are submitted at once, the others wait in these
+        # queues so that the scheduler can interleave other work.
+        creating: dict[concurrent.futures.Future[ty.Any], dict] = {}
+        finishing: dict[concurrent.futures.Future[ty.Any], tuple] = {}
+        ready: collections.deque[tuple] = collections.deque()
+
+        def submit_creates():
+            while len(creating) < max(create_concurrency, 1):
+                spec = next(specs, None)
+                if spec is None:
+                    return
+                future = self._submit_task(scheduler.USER, create, spec)
+                creating[future] = spec
+
+        def submit_finishes():
+            while ready and len(finishing) < max(post_boot_concurrency, 1):
+                spec, server, admin_pass = ready.popleft()
+                future = self._submit_task(
+                    scheduler.USER, finish, spec, server, admin_pass
+                )
+                finishing[future] = (spec, server)
+
+        def drain(block):
+            while finishing:
+                done, _ = concurrent.futures.wait(
+                    list(finishing),
+                    timeout=None if block else 0,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    return
+                for future in done:
+                    spec, server = finishing.pop(future)
+                    try:
+                        yield proxy.BulkResult(spec, future.result(), None)
+                    except Exception as e:
+                        yield proxy.BulkResult(spec, server, e)
+                submit_finishes()
+
+        # Servers still booting, with their spec, the server returned by
+        # the creation and the server as last polled
+        booting: dict[str, tuple] = {}
+        try:
+            submit_creates()
+            while creating or booting:
+                if creating:
+                    # Polls wait between rounds, creations are only waited
+                    # for while there is nothing to poll
+                    done, _ = concurrent.futures.wait(
+                        list(creating),
+                        timeout=0 if booting else None,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        spec = creating.pop(future)
+                        try:
+                            server = future.result()
+                        except Exception as e:
+                            yield proxy.BulkResult(spec, None, e)
+                            continue
+                        if wait:
+                            booting[server.id] = (spec, server, server)
+                        else:
+                            yield proxy.BulkResult(spec, server, None)
+                    submit_creates()
+                if not booting:
+                    continue
+
+                # While servers are being created, poll once per round so
+                # that the servers created meanwhile join the next one
+                remaining = max(deadline - time.time(), 0)
+                final = not creating or not remaining
+                for server, error in self.compute.wait_for_status_many(
+                    [polled for _, _, polled in booting.values()],
+                    'ACTIVE',
+                    failures=['ERROR'],
+                    interval=interval,
+                    wait=remaining if final else min(interval, remaining),
+                ):
+                    spec, orig, _ = booting.pop(server.id)
+                    if not final and isinstance(
+                        error, exceptions.ResourceTimeout
+                    ):
+                        booting[server.id] = (spec, orig, server)
+                        continue
+                    if error is None:
+                        ready.append((spec, server, orig.admin_password))
+                        submit_finishes()
+                    else:
+                        if server.status == 'ERROR':
+                            try:
+                                # Raises with the fault reported by Nova
+                                self.get_active_server(server)
+                            except exceptions.SDKException as e:
+                                error = e
+                        yield proxy.BulkResult(spec, server, error)
+                    yield from drain(block=False)
+            yield from drain(block=True)
+        finally:
+            for future in list(creating) + list(finishing):
+                future.cancel()
+
+    def _get_server_create_kwargs(
+        self,
+        name,
+        image=None,
+        flavor=None,
+        root_volume=None,
+        terminate_volume=False,
+        network=None,
+        boot_from_volume=False,
+        volume_size='50',
+        boot_volume=None,
+        volumes=None,
+        group=None,
+        **kwargs,
+    ):
+        """Translate the arguments of create_server for the compute API.
+
+        :returns: The keyword arguments for
+            :meth:`~openstack.compute.v2._proxy.Proxy.create_server`.
+        """
         # TODO(shade) Image is optional but flavor is not - yet flavor comes
         # after image in the argument list. Doh.
         if not flavor:
@@ -1038,7 +1371,9 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
                     )
                 kwargs['imageRef'] = image['id']
             else:
-                image_obj = self.image.find_image(image, ignore_missing=False)
+                image_obj = _image._get_cached_image(
+                    self, image
+                ) or self.image.find_image(image, ignore_missing=False)
                 kwargs['imageRef'] = image_obj.id
 
         if isinstance(flavor, dict):
@@ -1071,48 +1406,7 @@ class ComputeCloudMixin(_network_common.NetworkCommonCloudMixin):
         )
 
         kwargs['name'] = name
-
-        server = self.compute.create_server(**kwargs)
-        # TODO(mordred) We're only testing this in functional tests. We need
-        # to add unit tests for this too.
-        admin_pass = server.admin_password or kwargs.get('admin_pass')
-        if not wait:
-            server = self.compute.get_server(server.id)
-            if server['status'] == 'ERROR':
-                if (
-                    'fault' in server
-                    and server['fault'] is not None
-                    and 'message' in server['fault']
-                ):
-                    raise exceptions.SDKException(
-                        "Error in creating the server. "
-                        "Compute service reports fault: {reason}".format(
-                            reason=server['fault']['message']
-                        ),
-                        extra_data=dict(server=server),
-                    )
-
-                raise exceptions.SDKException(
-                    "Error in creating the server "
-                    "(no further information available)",
-                    extra_data=dict(server=server),
-                )
-
-            server = meta.add_server_interfaces(self, server)
-
-        else:
-            server = self.wait_for_server(
-                server,
-                auto_ip=auto_ip,
-                ips=ips,
-                ip_pool=ip_pool,
-                reuse=reuse_ips,
-                timeout=timeout,
-                nat_destination=nat_destination,
-            )
-
-        server.admin_password = admin_pass
-        return server
+        return kwargs
 
     def _get_boot_from_volume_kwargs(
         self,
@@ -12,6 +12,7 @@
 
 import warnings
 
+from openstack.cloud import _reference_cache
 from openstack.cloud import _utils
 from openstack.cloud import openstackcloud
 from openstack import exceptions
@@ -19,6 +20,17 @@ from openstack import utils
 from openstack import warnings as os_warnings
 
 
+def _get_cached_image(cloud, name_or_id):
+    """Find an image in the cached listing of images of a cloud.
+
+    :returns: The image, or ``None`` if images are not cached or there is no
+        single match.
+    """
+    if not cloud._reference_cache.enabled(_reference_cache.IMAGES):
+        return None
+    return _utils._cached_match(cloud.list_images(), name_or_id)
+
+
 class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -41,6 +53,15 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
         """
         if show_all:
             filter_deleted = False
+        images = self._reference_cache.get(
+            _reference_cache.IMAGES,
+            (filter_deleted, show_all),
+            lambda: self._list_images(filter_deleted, show_all),
+        )
+        # Callers may modify the list, but not the cached one
+        return images.copy()
+
+    def _list_images(self, filter_deleted, show_all):
         # First, try to actually get images from glance, it's more efficient
         images = []
         params = {}
@@ -57,7 +78,7 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
                 images.append(image)
             elif image.status.lower() != 'deleted':
                 images.append(image)
-        return images
+        return _utils.IndexedList(images, index_keys=('status', 'visibility'))
 
     def get_image(self, name_or_id, filters=None):
         """Get an image by name or ID.
@@ -91,7 +112,9 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
 
             return entities[0]
 
-        return self.image.find_image(name_or_id)
+        return _get_cached_image(self, name_or_id) or self.image.find_image(
+            name_or_id
+        )
 
     def get_image_by_id(self, id):
         """Get a image by ID
@@ -173,7 +196,7 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
         for count in utils.iterate_timeout(
             timeout, "Timeout waiting for image to snapshot"
         ):
-            image = self.get_image(image_id)
+            image = self.image.find_image(image_id)
             if not image:
                 continue
             if image['status'] == 'active':
@@ -225,7 +248,7 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
             for count in utils.iterate_timeout(
                 timeout, "Timeout waiting for the image to be deleted."
             ):
-                if self.get_image(image.id) is None:
+                if self.image.find_image(image.id) is None:
                     break
         return True
 
@@ -332,7 +355,7 @@ class ImageCloudMixin(openstackcloud._OpenStackCloudMixin):
             for count in utils.iterate_timeout(
                 timeout, "Timeout waiting for the image to finish."
             ):
-                image_obj = self.get_image(image.id)
+                image_obj = self.image.find_image(image.id)
                 if image_obj and image_obj.status not in ('queued', 'saving'):
                     return image_obj
         except exceptions.ResourceTimeout:
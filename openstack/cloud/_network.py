@@ -10,7 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import typing as ty
+
 from openstack.cloud import _network_common
+from openstack.cloud import _reference_cache
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack import exceptions
@@ -39,12 +42,26 @@ class NetworkCloudMixin(_network_common.NetworkCommonCloudMixin):
         :raises: :class:`~openstack.exceptions.SDKException` if something goes
             wrong during the OpenStack API call.
         """
+        return list(self.iter_search_networks(name_or_id, filters))
+
+    def iter_search_networks(self, name_or_id=None, filters=None):
+        """Search networks, yielding them as they are listed
+
+        This is the generator version of :meth:`search_networks`.
+
+        :param name_or_id: Name or ID of the desired network.
+        :param filters: A dict containing additional filters to use. e.g.
+            {'router:external': True}
+
+        :returns: A generator of network ``Network`` objects matching the
+            search criteria.
+        """
         query = {}
         if name_or_id:
             query['name'] = name_or_id
         if filters:
             query.update(filters)
-        return list(self.network.networks(**query))
+        return self.network.networks(**query)
 
     # TODO(stephenfin): Deprecate this in favour of the 'list' function
     def search_routers(self, name_or_id=None, filters=None):
@@ -99,15 +116,35 @@ class NetworkCloudMixin(_network_common.NetworkCommonCloudMixin):
         :raises: :class:`~openstack.exceptions.SDKException` if something goes
             wrong during the OpenStack API call.
         """
+        return list(self.iter_search_ports(name_or_id, filters))
+
+    def iter_search_ports(self, name_or_id=None, filters=None):
+        """Search ports, yielding them as they are listed
+
+        This is the generator version of :meth:`search_ports`. Pages of ports
+        are only requested as the generator is consumed.
+
+        :param name_or_id: Name or ID of the desired port.
+        :param filters: A dict containing additional filters to use. e.g.
+            {'device_id': '2711c67a-b4a7-43dd-ace7-6187b791c3f0'}
+
+        :returns: A generator of network ``Port`` objects matching the search
+            criteria.
+        """
+        # If the cloud is running nova-network, there are no ports.
+        if not self.has_service('network'):
+            return
         # If the filter is a string, do not push the filter down to neutron;
         # get all the ports and filter locally.
         # TODO(stephenfin): '_filter_list' can handle a dict - pass it down
+        pushdown_filters: dict[str, ty.Any]
         if isinstance(filters, str):
-            pushdown_filters = None
+            pushdown_filters = {}
         else:
-            pushdown_filters = filters
-        ports = self.list_ports(pushdown_filters)
-        return _utils._filter_list(ports, name_or_id, filters)
+            pushdown_filters = filters or {}
+        yield from _utils._iter_filter(
+            self.network.ports(**pushdown_filters), name_or_id, filters
+        )
 
     def list_networks(self, filters=None):
         """List all available networks.
@@ -119,9 +156,17 @@ class NetworkCloudMixin(_network_common.NetworkCommonCloudMixin):
         if not self.has_service('network'):
             return []
 
-        # Translate None from search interface to empty {} for kwargs below
         if not filters:
-            filters = {}
+            networks = self._reference_cache.get(
+                _reference_cache.NETWORKS,
+                None,
+                lambda: _utils.IndexedList(
+                    self.network.networks(),
+                    index_keys=_network_common._NETWORK_INDEX_KEYS,
+                ),
+            )
+            # Callers may modify the list, but not the cached one
+            return networks.copy()
         return list(self.network.networks(**filters))
 
     def list_routers(self, filters=None):
@@ -10,20 +10,54 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import ipaddress
 import threading
 import time
+import typing as ty
 import warnings
 
+from openstack.cloud import _reference_cache
 from openstack.cloud import _utils
 from openstack.cloud import exc
 from openstack.cloud import meta
 from openstack.cloud import openstackcloud
 from openstack import exceptions
 from openstack import proxy
+from openstack import scheduler
 from openstack import utils
 from openstack import warnings as os_warnings
 
+# Keys the cached networks are frequently searched on
+_NETWORK_INDEX_KEYS = ('is_router_external', 'is_shared', 'project_id')
+
+
+# Classification of the networks of a cloud, replaced as a whole whenever
+# networks are classified again so that readers never see a mix of two
+# classifications.
+_NetworkClassification = collections.namedtuple(
+    '_NetworkClassification',
+    [
+        'external_ipv4',
+        'external_ipv4_floating',
+        'internal_ipv4',
+        'external_ipv6',
+        'internal_ipv6',
+        'nat_destination',
+        'nat_source',
+        'default',
+        'summary',
+    ],
+)
+
+
+def _network_summary(networks):
+    # Neutron bumps the revision of a network whenever it or its subnets
+    # change, so this identifies a state of the networks
+    return frozenset(
+        (network['id'], network.get('revision_number')) for network in networks
+    )
+
 
 class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
     """Shared networking functions used by Network and Compute classes."""
@@ -47,6 +81,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         )
 
         self._networks_lock = threading.Lock()
+        self._networks_refreshing = False
         self._reset_network_caches()
 
         self.private = self.config.config.get('private', False)
@@ -60,6 +95,11 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
 
         self.secgroup_source = self.config.config['secgroup_source']
 
+    def _after_fork(self):
+        super()._after_fork()
+        self._networks_lock = threading.Lock()
+        self._networks_refreshing = False
+
     # networks
 
     def use_external_network(self):
@@ -72,18 +112,15 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         # Variables to prevent us from going through the network finding
         # logic again if we've done it once. This is different from just
         # the cached value, since "None" is a valid value to find.
+        # _network_list_stamp is the time networks were last classified, or
+        # None if they never were.
         with self._networks_lock:
-            self._external_ipv4_networks = []
-            self._external_ipv4_floating_networks = []
-            self._internal_ipv4_networks = []
-            self._external_ipv6_networks = []
-            self._internal_ipv6_networks = []
-            self._nat_destination_network = None
-            self._nat_source_network = None
-            self._default_network_network = None
-            self._network_list_stamp = False
-
-    def _set_interesting_networks(self):
+            self._networks = _NetworkClassification(
+                [], [], [], [], [], None, None, None, None
+            )
+            self._network_list_stamp: ty.Optional[float] = None
+
+    def _set_interesting_networks(self, all_networks=None):
         external_ipv4_networks = []
         external_ipv4_floating_networks = []
         internal_ipv4_networks = []
@@ -104,12 +141,20 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
             # this search_networks can just totally fail. If it does
             # though, that's fine, clearly the neutron introspection is
             # not going to work.
-            if self.has_service('network'):
-                all_networks = list(self.network.networks())
-            else:
-                all_networks = []
+            if all_networks is None:
+                if self.has_service('network'):
+                    all_networks = self._reference_cache.get(
+                        _reference_cache.NETWORKS,
+                        None,
+                        lambda: _utils.IndexedList(
+                            self.network.networks(),
+                            index_keys=_NETWORK_INDEX_KEYS,
+                        ),
+                    )
+                else:
+                    all_networks = []
         except exceptions.SDKException:
-            self._network_list_stamp = True
+            self._network_list_stamp = time.monotonic()
             return
 
         for network in all_networks:
@@ -289,32 +334,85 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
                 'found'
             )
 
-        self._external_ipv4_networks = external_ipv4_networks
-        self._external_ipv4_floating_networks = external_ipv4_floating_networks
-        self._internal_ipv4_networks = internal_ipv4_networks
-        self._external_ipv6_networks = external_ipv6_networks
-        self._internal_ipv6_networks = internal_ipv6_networks
-        self._nat_destination_network = nat_destination
-        self._nat_source_network = nat_source
-        self._default_network_network = default_network
+        self._networks = _NetworkClassification(
+            external_ipv4_networks,
+            external_ipv4_floating_networks,
+            internal_ipv4_networks,
+            external_ipv6_networks,
+            internal_ipv6_networks,
+            nat_destination,
+            nat_source,
+            default_network,
+            _network_summary(all_networks),
+        )
 
     def _find_interesting_networks(self):
-        if self._networks_lock.acquire():
-            try:
-                if self._network_list_stamp:
-                    return
+        if not self._use_external_network and not self._use_internal_network:
+            # Both have been flagged as skip - don't do a list
+            return
+        # Once classified, networks are read without waiting for the lock,
+        # so that readers keep the previous classification while it is
+        # being refreshed.
+        stamp = self._network_list_stamp
+        if stamp is not None:
+            self._schedule_networks_refresh(stamp)
+            return
+        with self._networks_lock:
+            if self._network_list_stamp is not None:
+                return
+            if not self.has_service('network'):
+                return
+            self._set_interesting_networks()
+            self._network_list_stamp = time.monotonic()
+
+    def _networks_ttl(self):
+        # Networks are classified again as often as the cached list of
+        # networks expires, or never if it is not cached.
+        return self._reference_cache.ttls.get(_reference_cache.NETWORKS, 0)
+
+    def _schedule_networks_refresh(self, stamp):
+        ttl = self._networks_ttl()
+        if (
+            ttl <= 0
+            or time.monotonic() - stamp < ttl
+            or self._networks_refreshing
+        ):
+            return
+        self._networks_refreshing = True
+        try:
+            self._submit_task(
+                scheduler.PREFETCH, self._refresh_interesting_networks
+            )
+        except Exception:
+            self.log.debug(
+                "Could not schedule the refresh of networks", exc_info=True
+            )
+            self._networks_refreshing = False
+
+    def _refresh_interesting_networks(self):
+        try:
+            with self._networks_lock:
+                stamp = self._network_list_stamp
+                # Networks may have been reset or refreshed meanwhile
                 if (
-                    not self._use_external_network
-                    and not self._use_internal_network
+                    stamp is None
+                    or time.monotonic() - stamp < self._networks_ttl()
                 ):
-                    # Both have been flagged as skip - don't do a list
-                    return
-                if not self.has_service('network'):
                     return
-                self._set_interesting_networks()
-                self._network_list_stamp = True
-            finally:
-                self._networks_lock.release()
+                try:
+                    networks = list(self.network.networks())
+                    # Subnets are only listed again if networks changed
+                    if _network_summary(networks) != self._networks.summary:
+                        self._set_interesting_networks(networks)
+                except exceptions.SDKException:
+                    self.log.warning(
+                        "Failed to refresh networks, using the previous "
+                        "ones until the next refresh",
+                        exc_info=True,
+                    )
+                self._network_list_stamp = time.monotonic()
+        finally:
+            self._networks_refreshing = False
 
     def get_nat_destination(self):
         """Return the network that is configured to be the NAT destination.
@@ -322,7 +420,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A network ``Network`` object if one is found
         """
         self._find_interesting_networks()
-        return self._nat_destination_network
+        return self._networks.nat_destination
 
     def get_nat_source(self):
         """Return the network that is configured to be the NAT destination.
@@ -330,7 +428,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A network ``Network`` object if one is found
         """
         self._find_interesting_networks()
-        return self._nat_source_network
+        return self._networks.nat_source
 
     def get_default_network(self):
         """Return the network that is configured to be the default interface.
@@ -338,7 +436,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A network ``Network`` object if one is found
         """
         self._find_interesting_networks()
-        return self._default_network_network
+        return self._networks.default
 
     def get_external_networks(self):
         """Return the networks that are configured to route northbound.
@@ -349,9 +447,8 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return list(self._external_ipv4_networks) + list(
-            self._external_ipv6_networks
-        )
+        networks = self._networks
+        return list(networks.external_ipv4) + list(networks.external_ipv6)
 
     def get_internal_networks(self):
         """Return the networks that are configured to not route northbound.
@@ -362,9 +459,8 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return list(self._internal_ipv4_networks) + list(
-            self._internal_ipv6_networks
-        )
+        networks = self._networks
+        return list(networks.internal_ipv4) + list(networks.internal_ipv6)
 
     def get_external_ipv4_networks(self):
         """Return the networks that are configured to route northbound.
@@ -372,7 +468,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return self._external_ipv4_networks
+        return self._networks.external_ipv4
 
     def get_external_ipv4_floating_networks(self):
         """Return the networks that are configured to route northbound.
@@ -380,7 +476,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return self._external_ipv4_floating_networks
+        return self._networks.external_ipv4_floating
 
     def get_internal_ipv4_networks(self):
         """Return the networks that are configured to not route northbound.
@@ -388,7 +484,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return self._internal_ipv4_networks
+        return self._networks.internal_ipv4
 
     def get_external_ipv6_networks(self):
         """Return the networks that are configured to route northbound.
@@ -396,7 +492,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return self._external_ipv6_networks
+        return self._networks.external_ipv6
 
     def get_internal_ipv6_networks(self):
         """Return the networks that are configured to not route northbound.
@@ -404,7 +500,7 @@ class NetworkCommonCloudMixin(openstackcloud._OpenStackCloudMixin):
         :returns: A list of network ``Network`` objects if any are found
         """
         self._find_interesting_networks()
-        return self._internal_ipv6_networks
+        return self._networks.internal_ipv6
 
     # floating IPs
 
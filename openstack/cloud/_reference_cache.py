@@ -0,0 +1,165 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Cache of slowly changing reference data of the cloud layer."""
+
+import collections
+import math
+import threading
+import time
+import typing as ty
+
+from openstack import _log
+
+FLAVORS = 'flavors'
+IMAGES = 'images'
+NETWORKS = 'networks'
+
+#: Prefixes of the cache keys of the API calls changing each kind of data,
+#: as computed by :meth:`openstack.proxy.Proxy._get_cache_key_prefix`.
+KEY_PREFIXES = {
+    FLAVORS: 'compute.flavor',
+    IMAGES: 'image.image',
+    NETWORKS: 'network.network',
+}
+#: Seconds to wait before retrying after a failed background refresh.
+RETRY_INTERVAL = 10
+
+
+class _Entry:
+    __slots__ = ('value', 'expires', 'refreshing')
+
+    def __init__(self, value, expires):
+        self.value = value
+        self.expires = expires
+        self.refreshing = False
+
+
+class ReferenceCache:
+    """Cache of reference data, such as flavors, images and networks.
+
+    Unlike the cache of API responses, this keeps the lists built by the
+    cloud layer, so that names are resolved without any API call or
+    conversion. Each kind of data is kept for its own TTL. Once expired,
+    the cached list is still returned while it is refreshed in the
+    background, so that only the first use waits for the API. Changes made
+    through the SDK invalidate the affected kind, which is then loaded again
+    on next use.
+
+    :param dict ttls: Seconds to keep each kind of data, ``-1`` to keep it
+        until invalidated. Kinds without a TTL, or with a TTL of ``0``, are
+        not cached.
+    :param submit: Callable running a function in the background, such as
+        ``executor.submit``. Expired data is loaded in the foreground
+        without it.
+    """
+
+    def __init__(self, ttls=None, submit=None):
+        self.log = _log.setup_logging('openstack')
+        self.ttls = {kind: float(ttl) for kind, ttl in (ttls or {}).items()}
+        self._submit = submit
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, ty.Hashable], _Entry] = {}
+        self._generations: collections.Counter[str] = collections.Counter()
+
+    def enabled(self, kind):
+        """Whether data of the given kind is cached."""
+        return self.ttls.get(kind, 0) != 0
+
+    def get(self, kind, key, loader):
+        """Return cached data, loading it if needed.
+
+        :param str kind: The kind of data.
+        :param key: Hashable arguments the data depends on, such as whether
+            flavors have their extra specs.
+        :param loader: Callable returning the data.
+        :returns: The cached data, or that returned by ``loader`` if the
+            kind is not cached.
+        """
+        if not self.enabled(kind):
+            return loader()
+        with self._lock:
+            generation = self._generations[kind]
+            entry = self._entries.get((kind, key))
+            expired = refresh = False
+            if entry is not None and time.monotonic() >= entry.expires:
+                expired = True
+                if self._submit and not entry.refreshing:
+                    entry.refreshing = refresh = True
+
+        if entry is None or (expired and not self._submit):
+            value = loader()
+            self._store(kind, key, value, generation)
+            return value
+        if refresh:
+            try:
+                self._submit(self._refresh, kind, key, loader, generation)
+            except Exception:
+                self.log.debug(
+                    "Could not schedule the refresh of cached %s",
+                    kind,
+                    exc_info=True,
+                )
+                entry.refreshing = False
+        return entry.value
+
+    def invalidate(self, kind=None):
+        """Drop cached data, of all kinds if ``kind`` is not given.
+
+        Refreshes running at the same time are discarded as well, since they
+        may have loaded the data before it changed.
+        """
+        with self._lock:
+            kinds = [kind] if kind else list(self.ttls)
+            for name in kinds:
+                self._generations[name] += 1
+            for entry_key in list(self._entries):
+                if entry_key[0] in kinds:
+                    del self._entries[entry_key]
+
+    def invalidate_for(self, key_prefix):
+        """Drop the data changed by a request with the given key prefix."""
+        for kind, prefix in KEY_PREFIXES.items():
+            if key_prefix.startswith(prefix) and self.enabled(kind):
+                self.invalidate(kind)
+
+    def reset_after_fork(self):
+        """Reset the state of refreshes, which do not survive a fork."""
+        self._lock = threading.Lock()
+        for entry in self._entries.values():
+            entry.refreshing = False
+
+    def _store(self, kind, key, value, generation):
+        ttl = self.ttls[kind]
+        expires = math.inf if ttl < 0 else time.monotonic() + ttl
+        with self._lock:
+            if self._generations[kind] == generation:
+                self._entries[(kind, key)] = _Entry(value, expires)
+
+    def _refresh(self, kind, key, loader, generation):
+        try:
+            value = loader()
+        except Exception:
+            self.log.warning(
+                "Failed to refresh cached %s, using them for another %s "
+                "seconds",
+                kind,
+                RETRY_INTERVAL,
+                exc_info=True,
+            )
+            with self._lock:
+                entry = self._entries.get((kind, key))
+                if entry is not None:
+                    entry.refreshing = False
+                    entry.expires = time.monotonic() + RETRY_INTERVAL
+        else:
+            self._store(kind, key, value, generation)
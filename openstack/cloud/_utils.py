@@ -12,12 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import contextlib
 import fnmatch
+import functools
 import inspect
 import ipaddress
+import operator
 import re
 import socket
+import typing as ty
 import uuid
 import warnings
 
@@ -40,12 +44,191 @@ def _dictify_resource(resource):
             return resource
 
 
+# Characters which make fnmatch match anything else than the pattern itself
+_GLOB_CHARS = frozenset('*?[')
+
+
+class IndexedList(list):
+    """A list of entities indexed for :func:`_filter_list`.
+
+    Entities are indexed by ``id`` and ``name`` the first time the list is
+    searched, and by every key of ``index_keys`` the first time it is
+    filtered on, so that lists which are never searched cost nothing more.
+    Searching the list for an exact name or ID, or for values of indexed
+    keys, then only checks the matching entities instead of scanning the
+    whole list. Glob patterns and other filters are still applied to every
+    remaining entity, so results are the same as those of a plain list.
+
+    Integer keys searched by :class:`RangeQuery` are sorted the first time
+    they are searched, so that range searches only check the entities in
+    range.
+
+    The indexes are rebuilt when the list is modified, but not when one of
+    its entities is, so entities should not be changed once in the list.
+
+    :param iterable data: The entities.
+    :param index_keys: Keys of the entities, other than ``id`` and ``name``,
+        which are frequently filtered on.
+    """
+
+    def __init__(self, data=(), index_keys=()):
+        super().__init__(data)
+        self.index_keys = frozenset(index_keys)
+        self._reset()
+
+    def _reset(self):
+        self._names: ty.Optional[dict[str, list[int]]] = None
+        self._key_indexes: dict[str, ty.Optional[dict[ty.Any, list[int]]]] = {}
+        self._present: dict[str, bool] = {}
+        self._range_indexes: dict[
+            str, ty.Optional[tuple[list[int], list[int]]]
+        ] = {}
+
+    def copy(self):
+        """Return a shallow copy, sharing the indexes built so far.
+
+        The copy builds its own indexes once it is modified.
+        """
+        copy = type(self)(self, self.index_keys)
+        copy._names = self._names
+        copy._key_indexes = self._key_indexes
+        copy._present = self._present
+        copy._range_indexes = self._range_indexes
+        return copy
+
+    def _index_names(self):
+        if self._names is None:
+            names: dict[str, list[int]] = {}
+            for position, entity in enumerate(self):
+                # Index the values the way _iter_filter compares them
+                keys = {
+                    str(entity.get('id', None)),
+                    str(entity.get('name', None)),
+                }
+                for key in keys:
+                    names.setdefault(key, []).append(position)
+            self._names = names
+        return self._names
+
+    def _has_key(self, key):
+        # _iter_filter raises if an entity misses a filtered key, which only
+        # a full scan can reproduce.
+        if key not in self._present:
+            self._present[key] = all(key in entity for entity in self)
+        return self._present[key]
+
+    def _index_key(self, key):
+        if key not in self._key_indexes:
+            index: dict[ty.Any, list[int]] = {}
+            try:
+                for position, entity in enumerate(self):
+                    index.setdefault(entity.get(key), []).append(position)
+            except TypeError:
+                # Unhashable values, such as lists or dicts
+                self._key_indexes[key] = None
+            else:
+                self._key_indexes[key] = index
+        return self._key_indexes[key]
+
+    def _range_index(self, key):
+        """Return the integer values of a key and their positions, sorted.
+
+        Entities without the key, or with a ``None`` value, are left out.
+
+        :returns: A tuple of the sorted values and of the positions of the
+            entities with each value, or None if some value is not an integer.
+        """
+        if key not in self._range_indexes:
+            pairs = []
+            try:
+                for position, entity in enumerate(self):
+                    value = entity.get(key)
+                    if value is not None:
+                        pairs.append((int(value), position))
+            except (TypeError, ValueError):
+                index = None
+            else:
+                pairs.sort()
+                index = (
+                    [value for value, _ in pairs],
+                    [position for _, position in pairs],
+                )
+            self._range_indexes[key] = index
+        return self._range_indexes[key]
+
+    def _candidates(self, name_or_id, filters):
+        """Return the sorted positions of the entities which may match.
+
+        :returns: A list of positions, or None if the whole list needs to be
+            scanned.
+        """
+        matches: list[ty.Collection[int]] = []
+        if name_or_id:
+            name_or_id = str(name_or_id)
+            if not _GLOB_CHARS.intersection(name_or_id):
+                matches.append(self._index_names().get(name_or_id, ()))
+        if (
+            filters
+            and isinstance(filters, dict)
+            and not any(isinstance(value, dict) for value in filters.values())
+            and all(self._has_key(key) for key in filters)
+        ):
+            for key, value in filters.items():
+                if key not in self.index_keys:
+                    continue
+                index = self._index_key(key)
+                if index is None:
+                    continue
+                try:
+                    matches.append(index.get(value, ()))
+                except TypeError:
+                    # Unhashable filter value
+                    continue
+        if not matches:
+            return None
+        smallest = min(matches, key=len)
+        positions = set(smallest)
+        for match in matches:
+            positions.intersection_update(match)
+        return sorted(positions)
+
+
+def _reset_indexes(method):
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._reset()
+        return result
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _method in (
+    '__delitem__',
+    '__iadd__',
+    '__imul__',
+    '__setitem__',
+    'append',
+    'clear',
+    'extend',
+    'insert',
+    'pop',
+    'remove',
+    'reverse',
+    'sort',
+):
+    setattr(IndexedList, _method, _reset_indexes(getattr(list, _method)))
+del _method
+
+
 def _filter_list(data, name_or_id, filters):
     """Filter a list by name/ID and arbitrary meta data.
 
     :param list data: The list of dictionary data to filter. It is expected
         that each dictionary contains an 'id' and 'name' key if a value for
-        name_or_id is given.
+        name_or_id is given. An :class:`IndexedList` is searched without
+        scanning it whenever possible.
     :param string name_or_id: The name or ID of the entity being filtered. Can
         be a glob pattern, such as 'nb01*'.
     :param filters: A dictionary of meta data to use for further filtering.
@@ -58,15 +241,72 @@ def _filter_list(data, name_or_id, filters):
         A string containing a jmespath expression for further filtering.
         Invalid filters will be ignored.
     """
+    if isinstance(filters, str):
+        return _jmespath_filter(
+            list(_iter_filter(data, name_or_id, None)), filters
+        )
+    return list(_iter_filter(data, name_or_id, filters))
+
+
+def _jmespath_filter(data, filters):
+    warnings.warn(
+        'Support for jmespath-style filters is deprecated and will be '
+        'removed in a future release. Consider using dictionary-style '
+        'filters instead.',
+        os_warnings.RemovedInSDK60Warning,
+    )
+    return jmespath.search(filters, data)
+
+
+def _iter_filter(data, name_or_id, filters):
+    """Lazily filter an iterable by name/ID and arbitrary meta data.
+
+    This is the generator version of :func:`_filter_list`, consuming ``data``
+    only as far as the caller consumes the result. jmespath filters need the
+    whole data set, so it is consumed at once if ``filters`` is a string.
+    """
+    if isinstance(filters, str):
+        yield from _filter_list(data, name_or_id, filters) or []
+        return
+
     # The logger is openstack.cloud.fmmatch to allow a user/operator to
     # configure logging not to communicate about fnmatch misses
     # (they shouldn't be too spammy, but one never knows)
     log = _log.setup_logging('openstack.fnmatch')
+
+    if isinstance(data, IndexedList):
+        candidates = data._candidates(name_or_id, filters)
+        if candidates is not None:
+            data = [data[position] for position in candidates]
+
+    def _dict_filter(f, d):
+        if not d:
+            return False
+        for key in f.keys():
+            if key not in d:
+                log.warning(
+                    "Invalid filter: %s is not an attribute of %s.%s",
+                    key,
+                    e.__class__.__module__,
+                    e.__class__.__qualname__,
+                )
+                # we intentionally skip this since the user was trying to
+                # filter on _something_, but we don't know what that
+                # _something_ was
+                raise AttributeError(key)
+            if isinstance(f[key], dict):
+                if not _dict_filter(f[key], d.get(key, None)):
+                    return False
+            elif d.get(key, None) != f[key]:
+                return False
+        return True
+
+    fn_reg = None
+    bad_pattern = False
+    matched = False
     if name_or_id:
         # name_or_id might already be unicode
         name_or_id = str(name_or_id)
-        identifier_matches = []
-        bad_pattern = False
         try:
             fn_reg = re.compile(fnmatch.translate(name_or_id))
         except re.error:
@@ -75,68 +315,76 @@ def _filter_list(data, name_or_id, filters):
             # it poorly and wants to know what went wrong with their
             # search
             fn_reg = None
-        for e in data:
+
+    for e in data:
+        if name_or_id:
             e_id = str(e.get('id', None))
             e_name = str(e.get('name', None))
 
-            if (e_id and e_id == name_or_id) or (
-                e_name and e_name == name_or_id
+            if not (
+                (e_id and e_id == name_or_id)
+                or (e_name and e_name == name_or_id)
             ):
-                identifier_matches.append(e)
-            else:
                 # Only try fnmatch if we don't match exactly
                 if not fn_reg:
                     # If we don't have a pattern, skip this, but set the flag
                     # so that we log the bad pattern
                     bad_pattern = True
                     continue
-                if (e_id and fn_reg.match(e_id)) or (
-                    e_name and fn_reg.match(e_name)
+                if not (
+                    (e_id and fn_reg.match(e_id))
+                    or (e_name and fn_reg.match(e_name))
                 ):
-                    identifier_matches.append(e)
-        if not identifier_matches and bad_pattern:
-            log.debug("Bad pattern passed to fnmatch", exc_info=True)
-        data = identifier_matches
+                    continue
+            matched = True
 
-    if not filters:
-        return data
+        if not filters or _dict_filter(filters, e):
+            yield e
 
-    if isinstance(filters, str):
-        warnings.warn(
-            'Support for jmespath-style filters is deprecated and will be '
-            'removed in a future release. Consider using dictionary-style '
-            'filters instead.',
-            os_warnings.RemovedInSDK60Warning,
-        )
-        return jmespath.search(filters, data)
+    if name_or_id and not matched and bad_pattern:
+        log.debug("Bad pattern passed to fnmatch", exc_info=True)
 
-    def _dict_filter(f, d):
-        if not d:
-            return False
-        for key in f.keys():
-            if key not in d:
-                log.warning(
-                    "Invalid filter: %s is not an attribute of %s.%s",
-                    key,
-                    e.__class__.__module__,
-                    e.__class__.__qualname__,
-                )
-                # we intentionally skip this since the user was trying to
-                # filter on _something_, but we don't know what that
-                # _something_ was
-                raise AttributeError(key)
-            if isinstance(f[key], dict):
-                if not _dict_filter(f[key], d.get(key, None)):
-                    return False
-            elif d.get(key, None) != f[key]:
-                return False
-        return True
 
-    filtered = []
-    for e in data:
-        if _dict_filter(filters, e):
-            filtered.append(e)
-    return filtered
+def _cached_match(entities, name_or_id):
+    """Return the only entity of a cached list with the given name or ID.
+
+    :returns: The entity, or None if there is none or more than one, in which
+        case the caller should look it up in the API instead.
+    """
+    name_or_id = str(name_or_id)
+    if _GLOB_CHARS.intersection(name_or_id):
+        return None
+    entities = _filter_list(entities, name_or_id, None)
+    if len(entities) == 1:
+        return entities[0]
+    return None
+
+
+def _single_match(entities, name_or_id):
+    """Return the only entity of an iterable of search results.
+
+    An entity whose ID is ``name_or_id`` is returned as soon as it is found,
+    whatever other entities match, since IDs are unique. Otherwise results
+    are consumed until the end.
+
+    :returns: The entity, or None if there is none.
+    :raises: :class:`~openstack.exceptions.SDKException` if there is more
+        than one and none of them has ``name_or_id`` as ID.
+    """
+    found = None
+    multiple = False
+    for entity in entities or ():
+        if name_or_id and str(entity.get('id', None)) == str(name_or_id):
+            return entity
+        if found is None:
+            found = entity
+        else:
+            multiple = True
+    if multiple:
+        raise exceptions.SDKException(
+            f"Multiple matches found for {name_or_id}"
+        )
+    return found
 
 
 def _get_entity(cloud, resource, name_or_id, filters, **kwargs):
@@ -173,19 +421,15 @@ def _get_entity(cloud, resource, name_or_id, filters, **kwargs):
         if get_resource:
             return get_resource(name_or_id)
 
-    search = (
-        resource
-        if callable(resource)
-        else getattr(cloud, f'search_{resource}s', None)
-    )
+    if callable(resource):
+        search = resource
+    else:
+        # Prefer streaming search results to stop as soon as possible
+        search = getattr(cloud, f'iter_search_{resource}s', None) or getattr(
+            cloud, f'search_{resource}s', None
+        )
     if search:
-        entities = search(name_or_id, filters, **kwargs)
-        if entities:
-            if len(entities) > 1:
-                raise exceptions.SDKException(
-                    f"Multiple matches found for {name_or_id}"
-                )
-            return entities[0]
+        return _single_match(search(name_or_id, filters, **kwargs), name_or_id)
     return None
 
 
@@ -368,58 +612,180 @@ def range_filter(data, key, range_exp):
     :raises: :class:`~openstack.exceptions.SDKException` on invalid range
         expressions.
     """
+    return compile_range_query({key: range_exp}).search(data)
+
+
+_RANGE_OPERATORS = {
+    None: operator.eq,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+
+def _range_bounds(values, op, number):
+    """Return the slice of sorted values matching a range."""
+    if op is None:
+        return (
+            bisect.bisect_left(values, number),
+            bisect.bisect_right(values, number),
+        )
+    if op == '<':
+        return 0, bisect.bisect_left(values, number)
+    if op == '<=':
+        return 0, bisect.bisect_right(values, number)
+    if op == '>':
+        return bisect.bisect_right(values, number), len(values)
+    return bisect.bisect_left(values, number), len(values)
+
+
+class RangeQuery:
+    """A compiled set of integer range searches.
+
+    Range expressions are parsed once, when the query is created, and all of
+    them are then evaluated together by :meth:`search`: the data is scanned
+    once to find the minimum and maximum values of keys searched with
+    ``MIN`` or ``MAX``, if any, and once to check every range. When the data
+    is an :class:`IndexedList`, the entities in range are found in sorted
+    indexes of the searched keys instead of scanning the list.
+
+    Entities without a searched key, or with a ``None`` value for it, do not
+    match.
+
+    :param dict filters: Range expressions by key, as accepted by
+        :meth:`~openstack.cloud.openstackcloud._OpenStackCloudMixin.range_search`.
+    :raises: :class:`~openstack.exceptions.SDKException` on invalid range
+        expressions.
+    """
+
+    def __init__(self, filters):
+        self.ranges: list[tuple[str, ty.Optional[str], ty.Optional[int]]] = []
+        for key, range_exp in filters.items():
+            range_exp = str(range_exp).upper()
+            if range_exp in ('MIN', 'MAX'):
+                self.ranges.append((key, range_exp, None))
+                continue
+            val_range = parse_range(range_exp)
+            # If parsing the range fails, it must be a bad value.
+            if val_range is None:
+                raise exceptions.SDKException(
+                    f"Invalid range value: {range_exp}"
+                )
+            self.ranges.append((key, val_range[0], val_range[1]))
+
+    def search(self, data):
+        """Return the entities matching all ranges.
+
+        :param list data: List of dictionaries to be searched.
+        :returns: A list subset of the data set, in the same order.
+        :raises: :class:`~openstack.exceptions.SDKException` if a searched
+            value is not an integer.
+        """
+        if isinstance(data, IndexedList):
+            indexes = [data._range_index(key) for key, _, _ in self.ranges]
+            if None not in indexes:
+                return self._search_indexes(data, indexes)
+        return self._search_scan(data)
+
+    def _search_indexes(self, data, indexes):
+        checks = []
+        narrowest: ty.Optional[tuple[list[int], int, int]] = None
+        for (key, op, number), (values, positions) in zip(
+            self.ranges, indexes
+        ):
+            if op in ('MIN', 'MAX'):
+                if not values:
+                    return []
+                op, number = None, values[0 if op == 'MIN' else -1]
+            checks.append((key, _RANGE_OPERATORS[op], number))
+            lo, hi = _range_bounds(values, op, number)
+            if narrowest is None or hi - lo < narrowest[2] - narrowest[1]:
+                narrowest = (positions, lo, hi)
+        if narrowest is None:
+            # There are no ranges
+            return list(data)
+        # Only check the other ranges on the entities in the narrowest one
+        positions, lo, hi = narrowest
+        return _check_ranges(
+            (data[position] for position in sorted(positions[lo:hi])),
+            checks,
+        )
+
+    def _search_scan(self, data):
+        # Find all minimum and maximum values in one pass
+        bounds: dict[tuple[str, ty.Optional[str]], int] = {}
+        extremes = [
+            (key, op) for key, op, _ in self.ranges if op in ('MIN', 'MAX')
+        ]
+        if extremes:
+            for d in data:
+                for key, extreme in extremes:
+                    value = d.get(key)
+                    if value is None:
+                        continue
+                    value = _range_value(key, value)
+                    bound = bounds.get((key, extreme))
+                    if (
+                        bound is None
+                        or (extreme == 'MIN' and value < bound)
+                        or (extreme == 'MAX' and value > bound)
+                    ):
+                        bounds[key, extreme] = value
+
+        checks = []
+        for key, op, number in self.ranges:
+            if op in ('MIN', 'MAX'):
+                number = bounds.get((key, op))
+                if number is None:
+                    return []
+                op = None
+            checks.append((key, _RANGE_OPERATORS[op], number))
+        return _check_ranges(data, checks)
+
+
+def _range_value(key, value):
+    try:
+        return int(value)
+    except ValueError:
+        raise exceptions.SDKException(
+            f"Range search failed. Value for {key} is not an integer: {value}"
+        )
+
+
+def _check_ranges(data, checks):
+    """Return the entities of which all values pass the checks."""
     filtered = []
-    range_exp = str(range_exp).upper()
-
-    if range_exp == "MIN":
-        key_min = safe_dict_min(key, data)
-        if key_min is None:
-            return []
-        for d in data:
-            if int(d[key]) == key_min:
-                filtered.append(d)
-        return filtered
-    elif range_exp == "MAX":
-        key_max = safe_dict_max(key, data)
-        if key_max is None:
-            return []
-        for d in data:
-            if int(d[key]) == key_max:
-                filtered.append(d)
-        return filtered
-
-    # Not looking for a min or max, so a range or exact value must
-    # have been supplied.
-    val_range = parse_range(range_exp)
-
-    # If parsing the range fails, it must be a bad value.
-    if val_range is None:
-        raise exceptions.SDKException(f"Invalid range value: {range_exp}")
-
-    op = val_range[0]
-    if op:
-        # Range matching
-        for d in data:
-            d_val = int(d[key])
-            if op == '<':
-                if d_val < val_range[1]:
-                    filtered.append(d)
-            elif op == '>':
-                if d_val > val_range[1]:
-                    filtered.append(d)
-            elif op == '<=':
-                if d_val <= val_range[1]:
-                    filtered.append(d)
-            elif op == '>=':
-                if d_val >= val_range[1]:
-                    filtered.append(d)
-        return filtered
-    else:
-        # Exact number match
-        for d in data:
-            if int(d[key]) == val_range[1]:
-                filtered.append(d)
-        return filtered
+    for d in data:
+        for key, compare, number in checks:
+            value = d.get(key)
+            if value is None or not compare(_range_value(key, value), number):
+                break
+        else:
+            filtered.append(d)
+    return filtered
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_range_query(items):
+    return RangeQuery(dict(items))
+
+
+def compile_range_query(filters):
+    """Return the :class:`RangeQuery` of range expressions.
+
+    Queries are cached, so that searching repeatedly with the same ranges
+    only parses them once.
+
+    :param dict filters: Range expressions by key.
+    :raises: :class:`~openstack.exceptions.SDKException` on invalid range
+        expressions.
+    """
+    try:
+        return _compile_range_query(tuple(filters.items()))
+    except TypeError:
+        # Unhashable keys or range expressions
+        return RangeQuery(filters)
 
 
 def generate_patches_from_kwargs(operation, **kwargs):
@@ -14,21 +14,178 @@
 # limitations under the License.
 
 import argparse
+import collections
 import json
 import sys
+import textwrap
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper  # type: ignore[assignment]
+
 import openstack.cloud
 import openstack.cloud.inventory
+from openstack.cloud import meta
 from openstack import exceptions
 
 
-def output_format_dict(data, use_yaml):
+class _Dumper(_BaseDumper):
+    """Safe YAML dumper, using libyaml when available."""
+
+
+# Hosts are munches and resources, which are dicts too
+_Dumper.add_multi_representer(dict, yaml.SafeDumper.represent_dict)
+
+
+def _dump_yaml(data):
+    return yaml.dump(data, Dumper=_Dumper, default_flow_style=False)
+
+
+def _dump_json(data, compact):
+    if compact:
+        return json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return json.dumps(data, sort_keys=True, indent=2)
+
+
+def output_format_dict(data, use_yaml, compact=False):
+    if use_yaml:
+        return _dump_yaml(data)
+    else:
+        return _dump_json(data, compact)
+
+
+def write_hosts(hosts, stream, use_yaml=False, compact=False):
+    """Write a list of hosts, one host at a time.
+
+    The output is the same as that of :func:`output_format_dict` for the
+    whole list, without holding all of it in memory.
+
+    :param hosts: An iterable of hosts.
+    :param stream: The file to write to.
+    :param bool use_yaml: Whether to write YAML rather than JSON.
+    :param bool compact: Whether to write JSON without whitespace.
+    """
     if use_yaml:
-        return yaml.safe_dump(data, default_flow_style=False)
+        empty = True
+        for host in hosts:
+            stream.write(_dump_yaml([host]))
+            empty = False
+        if empty:
+            stream.write(_dump_yaml([]))
+        return
+
+    separator = ',' if compact else ',\n'
+    first = True
+    for host in hosts:
+        if first:
+            stream.write('[' if compact else '[\n')
+            first = False
+        else:
+            stream.write(separator)
+        data = _dump_json(host, compact)
+        stream.write(data if compact else textwrap.indent(data, '  '))
+    if first:
+        stream.write('[]\n')
     else:
-        return json.dumps(data, sort_keys=True, indent=2)
+        stream.write(']\n' if compact else '\n]\n')
+
+
+def write_ansible_inventory(
+    inventory, hosts, stream, use_yaml=False, compact=False
+):
+    """Write hosts as an Ansible dynamic inventory, one host at a time.
+
+    The hostvars of every host are written under ``_meta.hostvars`` as they
+    are produced. Only the names of the hosts of every group are kept, to
+    write the groups at the end. Hosts are named after their server, or its
+    ID if the name was already used.
+
+    :param inventory: The
+        :class:`~openstack.cloud.inventory.OpenStackInventory` the hosts
+        come from.
+    :param hosts: An iterable of hosts.
+    :param stream: The file to write to.
+    :param bool use_yaml: Whether to write YAML rather than JSON.
+    :param bool compact: Whether to write JSON without whitespace.
+    """
+    clouds = {
+        (cloud.name, cloud.config.get_region_name('compute')): cloud
+        for cloud in inventory.clouds
+    }
+    groups = collections.defaultdict(list)
+    names = set()
+
+    if use_yaml:
+        stream.write('_meta:\n  hostvars:')
+    else:
+        stream.write('{"_meta":{"hostvars":{' if compact else '{\n')
+        if not compact:
+            stream.write('  "_meta": {\n    "hostvars": {')
+
+    first = True
+    for host in hosts:
+        name = host['name']
+        if not name or name in names:
+            name = host['id']
+        names.add(name)
+        location = host['location']
+        cloud = clouds.get((location['cloud'], location['region_name']))
+        if cloud is not None:
+            for group in meta.get_groups_from_server(cloud, host, host):
+                groups[group].append(name)
+
+        if use_yaml:
+            stream.write('\n' if first else '')
+            stream.write(textwrap.indent(_dump_yaml({name: host}), '    '))
+        elif compact:
+            stream.write('' if first else ',')
+            stream.write(
+                _dump_json(name, compact) + ':' + _dump_json(host, compact)
+            )
+        else:
+            stream.write('\n' if first else ',\n')
+            stream.write(
+                textwrap.indent(
+                    _dump_json(name, compact)
+                    + ': '
+                    + _dump_json(host, compact),
+                    '      ',
+                )
+            )
+        first = False
+
+    if use_yaml:
+        stream.write(' {}\n' if first else '')
+        if groups:
+            stream.write(
+                _dump_yaml(
+                    {
+                        group: {'hosts': members}
+                        for group, members in groups.items()
+                    }
+                )
+            )
+        return
+
+    if compact:
+        stream.write('}}')
+        for group in sorted(groups):
+            stream.write(
+                f',{_dump_json(group, compact)}:'
+                f'{_dump_json({"hosts": groups[group]}, compact)}'
+            )
+        stream.write('}\n')
+        return
+
+    stream.write('\n    }\n  }' if not first else '}\n  }')
+    for group in sorted(groups):
+        data = _dump_json({group: {'hosts': groups[group]}}, compact)
+        # Strip the braces of the object holding the group
+        stream.write(',\n' + data[2:-2])
+    stream.write('\n}\n')
 
 
 def parse_args():
@@ -41,6 +198,15 @@ def parse_args():
         '--list', action='store_true', help='List active servers'
     )
     group.add_argument('--host', help='List details about the specific host')
+    parser.add_argument(
+        '--snapshot',
+        metavar='PATH',
+        default=None,
+        help=(
+            'Keep the inventory in a snapshot file, and only refresh the '
+            'servers changed since it was saved'
+        ),
+    )
     parser.add_argument(
         '--private',
         action='store_true',
@@ -56,6 +222,21 @@ def parse_args():
         default=False,
         help='Output data in nicely readable yaml',
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        default=False,
+        help='Output data as JSON without whitespace',
+    )
+    parser.add_argument(
+        '--ansible',
+        action='store_true',
+        default=False,
+        help=(
+            'Output the list of servers as an Ansible dynamic inventory, '
+            'with hostvars and groups'
+        ),
+    )
     parser.add_argument(
         '--debug',
         action='store_true',
@@ -73,10 +254,19 @@ def main():
             refresh=args.refresh, private=args.private, cloud=args.cloud
         )
         if args.list:
-            output = inventory.list_hosts()
+            if args.snapshot:
+                hosts = inventory.refresh_hosts(args.snapshot)
+            else:
+                hosts = inventory.iter_hosts()
+            if args.ansible:
+                write_ansible_inventory(
+                    inventory, hosts, sys.stdout, args.yaml, args.compact
+                )
+            else:
+                write_hosts(hosts, sys.stdout, args.yaml, args.compact)
         elif args.host:
             output = inventory.get_host(args.host)
-        print(output_format_dict(output, args.yaml))
+            print(output_format_dict(output, args.yaml, args.compact))
     except exceptions.SDKException as e:
         sys.stderr.write(e.message + '\n')
         sys.exit(1)
@@ -12,20 +12,127 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import concurrent.futures
+import contextlib
 import functools
+import gzip
+import json
+import os
+import tempfile
+import time
 
+from openstack import _log
 from openstack.cloud import _utils
+from openstack.cloud import meta
 from openstack.config import loader
 from openstack import connection
 from openstack import exceptions
+from openstack import utils
 
-__all__ = ['OpenStackInventory']
+__all__ = ['CloudTiming', 'InventorySnapshot', 'OpenStackInventory']
+
+#: Default maximum age, in seconds, of the full listing a snapshot is built
+#: on. Deleted servers eventually disappear from the changes of nova, so
+#: snapshots are rebuilt from scratch from time to time.
+DEFAULT_SNAPSHOT_MAX_AGE = 3600
+
+
+class CloudTiming(
+    collections.namedtuple(
+        'CloudTiming', ['cloud', 'duration', 'count', 'error']
+    )
+):
+    """Time spent listing the hosts of one cloud region.
+
+    :ivar ~.cloud: The :class:`~openstack.connection.Connection` to the region.
+    :ivar ~.duration: Number of seconds spent listing its servers.
+    :ivar ~.count: Number of hosts found, or ``None`` if listing failed.
+    :ivar ~.error: The exception raised while listing, if any.
+    """
+
+
+class InventorySnapshot:
+    """Hosts of every cloud region, as of the last inventory refresh.
+
+    Snapshots are stored as gzipped JSON. For every region, identified by
+    ``<cloud>:<region>``, they hold the hosts by server ID, the latest
+    ``updated`` time of its servers, which is the ``changes-since`` of the
+    next refresh, and the time of the last full listing.
+
+    :param dict regions: The snapshot of every region.
+    """
+
+    VERSION = 1
+
+    def __init__(self, regions=None):
+        self.log = _log.setup_logging('openstack')
+        self.regions = regions or {}
+
+    @classmethod
+    def load(cls, path):
+        """Load a snapshot.
+
+        :param str path: The file the snapshot was saved to.
+        :returns: The snapshot, which is empty if the file does not exist or
+            cannot be read.
+        """
+        snapshot = cls()
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return snapshot
+        except (OSError, ValueError):
+            snapshot.log.warning(
+                "Ignoring unreadable inventory snapshot %s", path
+            )
+            return snapshot
+        if data.get('version') != cls.VERSION:
+            snapshot.log.debug(
+                "Ignoring inventory snapshot %s of version %s",
+                path,
+                data.get('version'),
+            )
+            return snapshot
+        snapshot.regions = data['regions']
+        return snapshot
+
+    def save(self, path):
+        """Save the snapshot, replacing the file atomically.
+
+        :param str path: The file to save the snapshot to.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_name = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                with gzip.open(tmp, 'wt', encoding='utf-8') as f:
+                    json.dump(
+                        dict(version=self.VERSION, regions=self.regions),
+                        f,
+                        separators=(',', ':'),
+                    )
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+
+
+def _region_key(cloud):
+    return f'{cloud.name}:{cloud.config.region_name}'
 
 
 class OpenStackInventory:
     # Put this here so the capability can be detected with hasattr on the class
     extra_config = None
 
+    #: :class:`CloudTiming` of every cloud region, in order of completion, for
+    #: the last call to :meth:`list_hosts`, :meth:`iter_hosts` or
+    #: :meth:`refresh_hosts`.
+    cloud_timings: list[CloudTiming]
+
     def __init__(
         self,
         config_files=None,
@@ -36,6 +143,8 @@ class OpenStackInventory:
         cloud=None,
         use_direct_get=False,
     ):
+        self.log = _log.setup_logging('openstack')
+        self.cloud_timings = []
         if config_files is None:
             config_files = []
         config = loader.OpenStackConfig(
@@ -63,23 +172,294 @@ class OpenStackInventory:
                 cloud._cache.invalidate()
 
     def list_hosts(
-        self, expand=True, fail_on_cloud_config=True, all_projects=False
+        self,
+        expand=True,
+        fail_on_cloud_config=True,
+        all_projects=False,
+        timeout=None,
+        max_workers=None,
+    ):
+        """List the servers of all cloud regions.
+
+        See :meth:`iter_hosts` for the parameters. The hosts are returned in
+        the order their region completed.
+
+        :returns: A list of servers.
+        """
+        return _utils.IndexedList(
+            self.iter_hosts(
+                expand=expand,
+                fail_on_cloud_config=fail_on_cloud_config,
+                all_projects=all_projects,
+                timeout=timeout,
+                max_workers=max_workers,
+            ),
+            index_keys=('status',),
+        )
+
+    def iter_hosts(
+        self,
+        expand=True,
+        fail_on_cloud_config=True,
+        all_projects=False,
+        timeout=None,
+        max_workers=None,
+    ):
+        """Iterate over the servers of all cloud regions.
+
+        Regions are listed concurrently, and the servers of each region are
+        yielded as soon as it completes. The time spent on every region is
+        recorded in :attr:`cloud_timings`.
+
+        :param expand: Whether to list detailed servers.
+        :param fail_on_cloud_config: Whether to raise the error of a failed or
+            timed out region. Otherwise it is logged and the servers of the
+            other regions are still returned.
+        :param all_projects: Whether to list the servers of all projects.
+        :param timeout: Maximum number of seconds to wait for each region, or
+            ``None`` to wait as long as needed.
+        :param max_workers: Maximum number of regions listed at once. Defaults
+            to all of them.
+        :returns: A generator of servers.
+        :raises: :class:`~openstack.exceptions.ResourceTimeout` if a region
+            does not complete within ``timeout`` and ``fail_on_cloud_config``
+            is set.
+        """
+        list_cloud = functools.partial(
+            self._list_cloud_hosts, expand=expand, all_projects=all_projects
+        )
+        for hosts in self._fan_out(
+            list_cloud, fail_on_cloud_config, timeout, max_workers
+        ):
+            yield from hosts
+
+    def refresh_hosts(
+        self,
+        snapshot_path,
+        expand=True,
+        fail_on_cloud_config=True,
+        all_projects=False,
+        timeout=None,
+        max_workers=None,
+        max_age=DEFAULT_SNAPSHOT_MAX_AGE,
     ):
-        hostvars = []
-
-        for cloud in self.clouds:
-            try:
-                # Cycle on servers
-                for server in cloud.list_servers(
-                    detailed=expand, all_projects=all_projects
-                ):
-                    hostvars.append(server)
-            except exceptions.SDKException:
-                # Don't fail on one particular cloud as others may work
-                if fail_on_cloud_config:
-                    raise
-
-        return hostvars
+        """List the servers of all cloud regions, incrementally.
+
+        The hosts are kept in a snapshot file between calls. Regions found in
+        the snapshot only list the servers changed since it was saved,
+        including deleted ones, and only those are expanded again. Other
+        regions, and those whose last full listing is older than
+        ``max_age``, are listed in full.
+
+        Hosts taken from the snapshot are returned as munch dicts. See
+        :meth:`iter_hosts` for the other parameters.
+
+        :param str snapshot_path: The file to read the snapshot from and save
+            the updated one to.
+        :param int max_age: Maximum age, in seconds, of the full listing of a
+            region before it is listed in full again.
+        :returns: A list of servers.
+        """
+        snapshot = InventorySnapshot.load(snapshot_path)
+        regions = {}
+
+        def refresh_cloud(cloud):
+            key = _region_key(cloud)
+            region = self._refresh_cloud_hosts(
+                cloud, snapshot.regions.get(key), expand, all_projects, max_age
+            )
+            regions[key] = region
+            return list(region['hosts'].values())
+
+        hosts = []
+        for cloud_hosts in self._fan_out(
+            refresh_cloud, fail_on_cloud_config, timeout, max_workers
+        ):
+            hosts.extend(cloud_hosts)
+
+        # Keep the snapshot of failed regions for the next refresh
+        keys = {_region_key(cloud) for cloud in self.clouds}
+        snapshot.regions = {
+            key: region
+            for key, region in snapshot.regions.items()
+            if key in keys
+        }
+        snapshot.regions.update(regions)
+        snapshot.save(snapshot_path)
+        return hosts
+
+    def _refresh_cloud_hosts(self, cloud, region, expand, all_projects, age):
+        now = time.time()
+        if (
+            region is None
+            or region['since'] is None
+            or region['expand'] != expand
+            or region['all_projects'] != all_projects
+            or now - region['listed_at'] >= age
+        ):
+            servers = list(cloud.compute.servers(all_projects=all_projects))
+            region = dict(
+                hosts={},
+                since=None,
+                listed_at=now,
+                expand=expand,
+                all_projects=all_projects,
+            )
+            changed = servers
+        else:
+            servers = list(
+                cloud.compute.servers(
+                    all_projects=all_projects, changes_since=region['since']
+                )
+            )
+            region = dict(
+                region,
+                hosts={
+                    server_id: utils.Munch(host)
+                    for server_id, host in region['hosts'].items()
+                },
+            )
+            changed = []
+            for server in servers:
+                if server.status == 'DELETED':
+                    region['hosts'].pop(server.id, None)
+                else:
+                    changed.append(server)
+
+        # Use the time of the cloud rather than ours, in case they differ
+        updates = [s.updated_at for s in servers if s.updated_at]
+        if region['since']:
+            updates.append(region['since'])
+        region['since'] = max(updates, default=None)
+
+        if expand:
+            changed = meta.get_hostvars_from_servers(cloud, changed)
+        else:
+            changed = meta.add_servers_interfaces(cloud, changed)
+        for host in changed:
+            region['hosts'][host['id']] = host
+        self.log.debug(
+            "Refreshed %s of %s hosts of cloud %s in region %s",
+            len(changed),
+            len(region['hosts']),
+            cloud.name,
+            cloud.config.region_name,
+        )
+        return region
+
+    def _fan_out(self, func, fail_on_cloud_config, timeout, max_workers):
+        """Call ``func`` with every cloud concurrently.
+
+        :returns: A generator of the lists returned by ``func``, as they
+            complete.
+        """
+        self.cloud_timings = []
+        if not self.clouds:
+            return
+
+        started: dict[int, float] = {}
+        durations: dict[int, float] = {}
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or len(self.clouds),
+            thread_name_prefix='openstacksdk-inventory',
+        )
+        try:
+            pending = {
+                executor.submit(
+                    self._timed, index, func, cloud, started, durations
+                ): index
+                for index, cloud in enumerate(self.clouds)
+            }
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=self._next_deadline(pending, started, timeout),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = pending.pop(future)
+                    cloud = self.clouds[index]
+                    duration = durations[index]
+                    try:
+                        hosts = future.result()
+                    except exceptions.SDKException as e:
+                        self._record_failure(
+                            cloud, duration, e, fail_on_cloud_config
+                        )
+                        continue
+                    self._record(
+                        CloudTiming(cloud, duration, len(hosts), None)
+                    )
+                    yield hosts
+
+                if timeout is None:
+                    continue
+                now = time.monotonic()
+                for future, index in list(pending.items()):
+                    start = started.get(index)
+                    if start is None or now - start < timeout:
+                        continue
+                    # The listing cannot be interrupted, just stop waiting
+                    del pending[future]
+                    future.cancel()
+                    cloud = self.clouds[index]
+                    self._record_failure(
+                        cloud,
+                        now - start,
+                        exceptions.ResourceTimeout(
+                            f"Timeout waiting for the servers of cloud "
+                            f"{cloud.name} in region "
+                            f"{cloud.config.region_name}"
+                        ),
+                        fail_on_cloud_config,
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _timed(index, func, cloud, started, durations):
+        started[index] = time.monotonic()
+        try:
+            return func(cloud)
+        finally:
+            durations[index] = time.monotonic() - started[index]
+
+    @staticmethod
+    def _list_cloud_hosts(cloud, expand, all_projects):
+        return list(
+            cloud.list_servers(detailed=expand, all_projects=all_projects)
+        )
+
+    @staticmethod
+    def _next_deadline(pending, started, timeout):
+        if timeout is None:
+            return None
+        starts = [started[i] for i in pending.values() if i in started]
+        if not starts:
+            return timeout
+        return max(min(starts) + timeout - time.monotonic(), 0)
+
+    def _record(self, timing):
+        self.cloud_timings.append(timing)
+        self.log.debug(
+            "Listed %s hosts of cloud %s in region %s in %.3f seconds",
+            timing.count,
+            timing.cloud.name,
+            timing.cloud.config.region_name,
+            timing.duration,
+        )
+
+    def _record_failure(self, cloud, duration, error, fail_on_cloud_config):
+        self._record(CloudTiming(cloud, duration, None, error))
+        # Don't fail on one particular cloud as others may work
+        if fail_on_cloud_config:
+            raise error
+        self.log.warning(
+            "Skipping hosts of cloud %s in region %s: %s",
+            cloud.name,
+            cloud.config.region_name,
+            error,
+        )
 
     def search_hosts(self, name_or_id=None, filters=None, expand=True):
         hosts = self.list_hosts(expand=expand)
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import functools
 import ipaddress
 import socket
 
 from openstack import _log
 from openstack import exceptions
+from openstack import fields
+from openstack import resource
 from openstack import utils
 
 
@@ -409,6 +413,19 @@ def _make_address_dict(fip, port):
     return address
 
 
+def _needs_supplemental_addresses(server):
+    # Whether _get_supplemental_addresses would look up the ports of the
+    # server
+    if server['status'] != 'ACTIVE':
+        return False
+    return not any(
+        address.get('OS-EXT-IPS:type') == 'floating'
+        for network in server['addresses'].values()
+        for address in network
+        if address['version'] != 6
+    )
+
+
 def _get_supplemental_addresses(cloud, server):
     fixed_ip_mapping = {}
     for name, network in server['addresses'].items():
@@ -561,6 +578,358 @@ def get_hostvars_from_server(cloud, server, mounts=None):
     return server_vars
 
 
+def _nova_security_group_rule(rule, groups_by_id):
+    # Mirror the conversion nova applies when proxying neutron rules
+    protocol = rule.get('protocol')
+    from_port = rule.get('port_range_min')
+    to_port = rule.get('port_range_max')
+    if protocol in ('tcp', 'udp') and from_port is None:
+        from_port, to_port = 1, 65535
+    elif protocol == 'icmp':
+        from_port = -1 if from_port is None else from_port
+        to_port = -1 if to_port is None else to_port
+    nova_rule = dict(
+        id=rule['id'],
+        parent_group_id=rule.get('security_group_id'),
+        ip_protocol=protocol,
+        from_port=from_port,
+        to_port=to_port,
+        group={},
+        ip_range={},
+    )
+    remote_group_id = rule.get('remote_group_id')
+    if remote_group_id:
+        remote_group = groups_by_id.get(remote_group_id)
+        nova_rule['group'] = dict(
+            name=remote_group['name'] if remote_group else None,
+            tenant_id=rule.get('project_id', rule.get('tenant_id')),
+        )
+    else:
+        nova_rule['ip_range'] = dict(
+            cidr=rule.get('remote_ip_prefix') or '0.0.0.0/0'
+        )
+    return nova_rule
+
+
+def _nova_security_group(group, groups_by_id):
+    return dict(
+        id=group['id'],
+        name=group['name'],
+        description=group['description'] or '',
+        tenant_id=group['project_id'],
+        rules=[
+            _nova_security_group_rule(rule, groups_by_id)
+            for rule in group['security_group_rules'] or []
+            if rule.get('direction', 'ingress') == 'ingress'
+        ],
+    )
+
+
+#: Number of device IDs to filter ports on in a single request.
+_PORTS_FILTER_SIZE = 50
+#: Number of devices beyond which all ports are listed instead.
+_PORTS_FILTER_MAX = 500
+
+
+class _HostvarsIndex:
+    """Answer the per-server lookups of hostvars from indexed listings.
+
+    This wraps a cloud and replaces the calls made for every server by
+    :func:`get_hostvars_from_server` with lookups in reference data listed
+    once, on first use. Any other attribute is taken from the cloud.
+
+    :param cloud: The cloud to wrap.
+    :param device_ids: IDs of the servers whose ports are looked up, if
+        known, so that only their ports are listed.
+    """
+
+    def __init__(self, cloud, device_ids=None):
+        self._cloud = cloud
+        if device_ids is not None:
+            device_ids = list(dict.fromkeys(device_ids))
+            if len(device_ids) > _PORTS_FILTER_MAX:
+                device_ids = None
+        # The list keeps the order to filter ports by chunks, the set is
+        # for lookups
+        self._device_ids = device_ids
+        self._device_id_set = (
+            frozenset(device_ids) if device_ids is not None else None
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._cloud, name)
+
+    def _list(self, func, *args, **kwargs):
+        # Like the per-server calls, a failed listing only means less
+        # information.
+        try:
+            return func(*args, **kwargs)
+        except exceptions.SDKException:
+            self._cloud.log.debug(
+                "Failed to list %s for hostvars", func.__name__, exc_info=True
+            )
+            return []
+
+    @staticmethod
+    def _group(items, key):
+        index = collections.defaultdict(list)
+        for item in items:
+            index[item[key]].append(item)
+        return index
+
+    @functools.cached_property
+    def _flavor_names(self):
+        return {
+            flavor['id']: flavor['name']
+            for flavor in self._list(self._cloud.list_flavors)
+        }
+
+    @functools.cached_property
+    def _image_names(self):
+        return {
+            image['id']: image['name']
+            for image in self._list(self._cloud.list_images)
+        }
+
+    @functools.cached_property
+    def _ports_by_device(self):
+        if not self._cloud.has_service('network'):
+            return {}
+        if self._device_ids is None:
+            return self._group(self._list(self._cloud.list_ports), 'device_id')
+        ports = []
+        for start in range(0, len(self._device_ids), _PORTS_FILTER_SIZE):
+            device_ids = self._device_ids[start : start + _PORTS_FILTER_SIZE]
+            ports.extend(
+                self._list(
+                    self._cloud.list_ports, filters={'device_id': device_ids}
+                )
+            )
+        return self._group(ports, 'device_id')
+
+    @functools.cached_property
+    def _floating_ips_by_port(self):
+        return self._group(
+            self._list(self._cloud.list_floating_ips), 'port_id'
+        )
+
+    @functools.cached_property
+    def _volumes_by_server(self):
+        index = collections.defaultdict(list)
+        for volume in self._list(self._cloud.list_volumes):
+            for attach in volume['attachments']:
+                index[attach['server_id']].append(volume)
+        return index
+
+    @functools.cached_property
+    def _security_groups(self):
+        groups_by_id = {
+            group['id']: group
+            for group in self._list(self._cloud.list_security_groups)
+        }
+        return {
+            group_id: _nova_security_group(group, groups_by_id)
+            for group_id, group in groups_by_id.items()
+        }
+
+    def get_flavor_name(self, flavor_id):
+        name = self._flavor_names.get(flavor_id)
+        if name is None:
+            # Private flavors of other projects are not listed
+            return self._cloud.get_flavor_name(flavor_id)
+        return name
+
+    def get_image_name(self, image_id, exclude=None):
+        name = self._image_names.get(image_id)
+        if name is None or exclude:
+            return self._cloud.get_image_name(image_id, exclude=exclude)
+        return name
+
+    def get_volumes(self, server, cache=None):
+        return list(self._volumes_by_server.get(server['id'], []))
+
+    def search_ports(self, name_or_id=None, filters=None):
+        if (
+            name_or_id
+            or not isinstance(filters, dict)
+            or (set(filters) != {'device_id'})
+            or not isinstance(filters['device_id'], str)
+            or (
+                self._device_id_set is not None
+                and filters['device_id'] not in self._device_id_set
+            )
+        ):
+            return self._cloud.search_ports(name_or_id, filters)
+        return list(self._ports_by_device.get(filters['device_id'], []))
+
+    def search_floating_ips(self, id=None, filters=None):
+        if id or not isinstance(filters, dict) or set(filters) != {'port_id'}:
+            return self._cloud.search_floating_ips(id, filters)
+        return list(self._floating_ips_by_port.get(filters['port_id'], []))
+
+    def list_server_security_groups(self, server):
+        if not self._cloud._has_secgroups():
+            return []
+        if not self._cloud._use_neutron_secgroups():
+            return self._cloud.list_server_security_groups(server)
+        group_ids: dict[str, None] = {}
+        for port in self._ports_by_device.get(server['id'], []):
+            for group_id in port['security_group_ids'] or []:
+                group_ids.setdefault(group_id)
+        return [
+            self._security_groups[group_id]
+            for group_id in group_ids
+            if group_id in self._security_groups
+        ]
+
+
+def get_hostvars_from_servers(cloud, servers, mounts=None):
+    """Expand additional server information for many servers at once.
+
+    This returns the same information as :func:`get_hostvars_from_server`,
+    but flavors, images, ports, floating IPs, volumes and security groups are
+    listed once for all servers and joined to them, instead of being queried
+    for every server.
+
+    :param cloud: The cloud the servers belong to.
+    :param servers: An iterable of servers.
+    :param mounts: Volume mounts, as for :func:`get_hostvars_from_server`.
+    :returns: A list of hostvars, in the order of ``servers``.
+    """
+    servers = list(servers)
+    index = _HostvarsIndex(cloud, [server['id'] for server in servers])
+    return [
+        get_hostvars_from_server(index, server, mounts=mounts)
+        for server in servers
+    ]
+
+
+def add_servers_interfaces(cloud, servers):
+    """Add network interface information to many servers at once.
+
+    This is :func:`add_server_interfaces` for a list of servers. The ports of
+    the active servers are listed in batches and floating IPs are listed once,
+    instead of being searched for every server.
+
+    :param cloud: The cloud the servers belong to.
+    :param servers: An iterable of servers.
+    :returns: A list of the servers, in the order of ``servers``.
+    """
+    servers = list(servers)
+    index = _HostvarsIndex(
+        cloud,
+        [
+            server['id']
+            for server in servers
+            if _needs_supplemental_addresses(server)
+        ],
+    )
+    return [add_server_interfaces(index, server) for server in servers]
+
+
+class _ResourceAttributes:
+    """The attributes of a resource class, as seen by :func:`obj_to_munch`.
+
+    :ivar components: The Body, Header and Computed attributes, with the keys
+        they have in ``to_dict``, in its order.
+    :ivar properties: Names of the attributes computed on access, including
+        URI attributes, which have to be read from every instance.
+    :ivar constants: Class attributes which are the same for all instances.
+    """
+
+    def __init__(self, cls):
+        self.components = []
+        seen = set()
+        for attr, component in cls._attributes_iterator(
+            (fields.Body, fields.Header, fields.Computed)
+        ):
+            # Base classes don't overwrite the keys of subclasses
+            keys = [
+                key
+                for key in filter(None, (attr, component.aka))
+                if key not in seen
+            ]
+            if keys:
+                seen.update(keys)
+                self.components.append((attr, keys))
+
+        self.properties = []
+        self.constants = {}
+        for key in dir(cls):
+            if key.startswith('_'):
+                continue
+            for klass in cls.__mro__:
+                if key in klass.__dict__:
+                    value = klass.__dict__[key]
+                    break
+            else:
+                continue
+            if isinstance(value, fields.URI):
+                self.properties.append(key)
+            elif isinstance(value, fields._BaseComponent):
+                continue
+            elif isinstance(value, NON_CALLABLES):
+                self.constants[key] = value
+            elif hasattr(value, '__get__') and not callable(value):
+                self.properties.append(key)
+
+
+# Called with obj.__class__ rather than type(obj), as mypy does not consider
+# classes to be hashable.
+@functools.cache
+def _resource_attributes(cls):
+    return _ResourceAttributes(cls)
+
+
+def _munch_value(value):
+    # The conversion of Resource._attr_to_dict
+    if isinstance(value, resource.Resource):
+        return _resource_components_to_munch(value)
+    elif isinstance(value, dict):
+        return utils.Munch(value)
+    elif value and isinstance(value, list):
+        return [
+            _resource_components_to_munch(item)
+            if isinstance(item, resource.Resource)
+            else utils.Munch(item)
+            if isinstance(item, dict)
+            else item
+            for item in value
+        ]
+    return value
+
+
+def _resource_components_to_munch(obj):
+    """The equivalent of ``obj.to_dict(_to_munch=True)``."""
+    instance = utils.Munch()
+    if obj._allow_unknown_attrs_in_body:
+        for key in obj._unknown_attrs_in_body:
+            instance[key] = _munch_value(getattr(obj, key, None))
+    for attr, keys in _resource_attributes(obj.__class__).components:
+        value = _munch_value(getattr(obj, attr, None))
+        for key in keys:
+            instance.setdefault(key, value)
+    return instance
+
+
+def _resource_to_munch(obj):
+    attributes = _resource_attributes(obj.__class__)
+    instance = _resource_components_to_munch(obj)
+    for key in attributes.properties:
+        try:
+            value = getattr(obj, key)
+        except AttributeError:
+            continue
+        if isinstance(value, NON_CALLABLES):
+            instance[key] = value
+    for key, value in attributes.constants.items():
+        instance.setdefault(key, value)
+    for key, value in vars(obj).items():
+        if isinstance(value, NON_CALLABLES) and not key.startswith('_'):
+            instance[key] = value
+    return instance
+
+
 def obj_to_munch(obj):
     """Turn an object with attributes into a dict suitable for serializing.
 
@@ -576,7 +945,15 @@ def obj_to_munch(obj):
         # If we obj_to_munch twice, don't fail, just return the munch
         # Also, don't try to modify Mock objects - that way lies madness
         return obj
-    elif isinstance(obj, dict):
+    elif isinstance(obj, resource.Resource):
+        # Resources know their attributes, avoid introspecting every one of
+        # them with dir()
+        return _resource_to_munch(obj)
+    return _object_to_munch(obj)
+
+
+def _object_to_munch(obj):
+    if isinstance(obj, dict):
         # The new request-id tracking spec:
         # https://specs.openstack.org/openstack/nova-specs/specs/juno/approved/log-request-id-mappings.html
         # adds a request-ids attribute to returned objects. It does this even
@@ -11,20 +11,24 @@
 # limitations under the License.
 
 import atexit
-import concurrent.futures
 import copy
 import functools
+import os
 import queue
+import threading
 import warnings
 import weakref
 
 import dogpile.cache
 import keystoneauth1.exceptions
+import requests.adapters
 import requests.models
 import requestsexceptions
 
 from openstack import _log
 from openstack import _services_mixin
+from openstack import _token_refresh
+from openstack.cloud import _reference_cache
 from openstack.cloud import _utils
 from openstack.cloud import meta
 import openstack.config
@@ -32,10 +36,59 @@ import openstack.config.cloud_region
 from openstack import exceptions
 from openstack import proxy
 from openstack import resource
+from openstack import scheduler
 from openstack import utils
 from openstack import warnings as os_warnings
 
 
+# Connections which need their process-local state reset in forked children
+_FORK_REGISTRY: 'weakref.WeakSet[_OpenStackCloudMixin]' = weakref.WeakSet()
+
+
+def _reset_http_session_after_fork(requests_session):
+    """Drop the connection pools a requests session shares with its parent.
+
+    Pooled sockets must not be used by both processes.
+    """
+    for adapter in requests_session.adapters.values():
+        if isinstance(adapter, requests.adapters.HTTPAdapter):
+            # Replace rather than close the pools so that the sockets still
+            # used by the parent are not shut down. HTTPAdapter only keeps
+            # the settings of its pools in private attributes.
+            adapter.proxy_manager = {}
+            adapter.init_poolmanager(
+                adapter._pool_connections,  # type: ignore[attr-defined]
+                adapter._pool_maxsize,  # type: ignore[attr-defined]
+                block=adapter._pool_block,  # type: ignore[attr-defined]
+            )
+
+
+def _reset_session_after_fork(session):
+    """Drop connection pools and locks a session shares with its parent.
+
+    The auth plugin keeps its token and catalog and the discovery cache is
+    left untouched.
+    """
+    requests_session = getattr(session, 'session', None)
+    if requests_session is not None:
+        _reset_http_session_after_fork(requests_session)
+    auth = getattr(session, 'auth', None)
+    if auth is not None and hasattr(auth, '_lock'):
+        auth._lock = threading.Lock()
+
+
+def _after_fork_in_child():
+    for conn in list(_FORK_REGISTRY):
+        try:
+            conn._after_fork()
+        except Exception:
+            conn.log.exception('Failed to reset connection after fork')
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
 class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
     """Represent a connection to an OpenStack Cloud.
 
@@ -201,6 +254,10 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         self._session = None
         self._proxies = {}
         self.__pool_executor = pool_executor
+        # Whether the executor was created by, and is reset with, this
+        # connection rather than given to it
+        self.__owns_pool_executor = False
+        self._shared_pool_executor = False
         self._global_request_id = global_request_id
         self.use_direct_get = use_direct_get or False
         self.strict_mode = strict
@@ -249,12 +306,25 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
 
         self._api_cache_keys = set()
 
+        # Lists of flavors, images and networks used to resolve names,
+        # refreshed in the background once expired
+        self._reference_cache = _reference_cache.ReferenceCache(
+            self.config.config.get('reference_cache'),
+            submit=functools.partial(self._submit_task, scheduler.PREFETCH),
+        )
+
+        self._token_refresher = None
+        token_refresh_window = self.config.config.get('token_refresh_window')
+        if token_refresh_window:
+            self.start_token_refresh(int(token_refresh_window))
+
         self._local_ipv6 = (
             _utils.localhost_supports_ipv6() if not self.force_ipv4 else False
         )
 
         # Register cleanup steps
         atexit.register(self.close)
+        _FORK_REGISTRY.add(self)
 
     @property
     def session(self):
@@ -269,15 +339,93 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
     @property
     def _pool_executor(self):
         if not self.__pool_executor:
-            self.__pool_executor = concurrent.futures.ThreadPoolExecutor(
-                max_workers=5
-            )
+            self.__pool_executor = scheduler.WorkScheduler()
+            self.__owns_pool_executor = True
         return self.__pool_executor
 
+    def _share_pool_executor(self, pool_executor):
+        """Use an executor owned, and shut down, by someone else."""
+        self.__pool_executor = pool_executor
+        self.__owns_pool_executor = False
+        self._shared_pool_executor = True
+
+    def _submit_task(self, category, fn, /, *args, **kwargs):
+        """Run ``fn`` in the executor, in the given category of work.
+
+        See :mod:`openstack.scheduler` for the available categories.
+        """
+        return scheduler.submit(
+            self._pool_executor, category, fn, *args, **kwargs
+        )
+
+    def _after_fork(self):
+        """Reset state which cannot be shared with the parent process.
+
+        Called in the child process after a fork. Connection pools, the
+        executor, proxies and locks are dropped and recreated on demand,
+        while the token, catalog, discovery data and cached API responses
+        are kept so that the child does not need to discover services again.
+        An executor given to the connection is left for its owner to reset.
+        """
+        if self.__owns_pool_executor:
+            # The worker threads of the executor only exist in the parent
+            self.__pool_executor = None
+            self.__owns_pool_executor = False
+        # Proxies hold rate limiting semaphores and are cheap to recreate
+        # from the discovery cache
+        self._proxies = {}
+        if self._session is not None:
+            _reset_session_after_fork(self._session)
+        lock_registry = getattr(self._cache, '_lock_registry', None)
+        if lock_registry is not None:
+            self._cache._lock_registry = type(lock_registry)(
+                self._cache._create_mutex
+            )
+        self._api_cache_keys = set(self._api_cache_keys)
+        self._reference_cache.reset_after_fork()
+        if self._token_refresher is not None:
+            self._token_refresher.reset_after_fork()
+
+    def start_token_refresh(self, window=None):
+        """Renew the auth token in the background ahead of its expiry.
+
+        Without this, the first request made after the token enters its
+        expiry window re-authenticates, blocking every other thread making
+        requests at the same time. With background renewal the current token
+        stays in use until a new one has been fetched, so requests never
+        wait for authentication.
+
+        Connections sharing a session, such as those created by
+        :meth:`global_request`, share a single background thread.
+
+        This is started automatically if ``token_refresh_window`` is set in
+        the cloud configuration.
+
+        :param int window: Seconds before expiry at which to renew the token.
+            Defaults to 300.
+        """
+        if self._token_refresher is not None:
+            return
+        refresher = _token_refresh.get_token_refresher(
+            self.session,
+            functools.partial(self.config.renew_auth, self.session),
+            window=window,
+        )
+        refresher.acquire()
+        self._token_refresher = refresher
+
+    def stop_token_refresh(self):
+        """Stop renewing the auth token in the background."""
+        if self._token_refresher is None:
+            return
+        self._token_refresher.release()
+        self._token_refresher = None
+
     def close(self):
         """Release any resources held open."""
+        self.stop_token_refresh()
         self.config.set_auth_cache()
-        if self.__pool_executor:
+        if self.__pool_executor and not self._shared_pool_executor:
             self.__pool_executor.shutdown()
         atexit.unregister(self.close)
 
@@ -477,6 +625,11 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         operator is not given, exact value matching will be used. Valid
         operators are one of: <,>,<=,>=
 
+        Range expressions are only parsed the first time they are used. Lists
+        returned by the cloud layer, such as those of ``list_flavors``, keep
+        sorted indexes of the searched keys, so that searching them again
+        does not scan them.
+
         :param data: List of dictionaries to be searched.
         :param filters: Dict describing the one or more range searches to
             perform. If more than one search is given, the result will be the
@@ -489,24 +642,9 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         :raises: :class:`~openstack.exceptions.SDKException` on invalid range
             expressions.
         """
-        filtered: list[object] = []
-
-        for key, range_value in filters.items():
-            # We always want to operate on the full data set so that
-            # calculations for minimum and maximum are correct.
-            results = _utils.range_filter(data, key, range_value)
-
-            if not filtered:
-                # First set of results
-                filtered = results
-            else:
-                # The combination of all searches should be the intersection of
-                # all result sets from each search. So adjust the current set
-                # of filtered data by computing its intersection with the
-                # latest result set.
-                filtered = [r for r in results for f in filtered if r == f]
-
-        return filtered
+        if not filters:
+            return []
+        return _utils.compile_range_query(filters).search(data)
 
     def _get_and_munchify(self, key, data):
         """Wrapper around meta.get_and_munchify.
@@ -583,6 +721,44 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
 
         Search resources matching certain conditions
 
+        :param str resource_type: String representation of the expected
+            resource as `service.resource` (i.e. "network.security_group").
+        :param str name_or_id: Name or ID of the resource
+        :param list get_args: Optional args to be passed to the _get call.
+        :param dict get_kwargs: Optional kwargs to be passed to the _get call.
+        :param list list_args: Optional args to be passed to the _list call.
+        :param dict list_kwargs: Optional kwargs to be passed to the _list call
+        :param dict filters: Additional filters to be used for querying
+            resources.
+        """
+        return list(
+            self.iter_search_resources(
+                resource_type,
+                name_or_id,
+                get_args=get_args,
+                get_kwargs=get_kwargs,
+                list_args=list_args,
+                list_kwargs=list_kwargs,
+                **filters,
+            )
+        )
+
+    def iter_search_resources(
+        self,
+        resource_type,
+        name_or_id,
+        get_args=None,
+        get_kwargs=None,
+        list_args=None,
+        list_kwargs=None,
+        **filters,
+    ):
+        """Search resources, yielding them as they are listed
+
+        This is the generator version of :meth:`search_resources`. Pages of
+        results are only requested as the generator is consumed, so callers
+        looking for a single match can stop early.
+
         :param str resource_type: String representation of the expected
             resource as `service.resource` (i.e. "network.security_group").
         :param str name_or_id: Name or ID of the resource
@@ -596,7 +772,7 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
         get_args = get_args or ()
         get_kwargs = get_kwargs or {}
         list_args = list_args or ()
-        list_kwargs = list_kwargs or {}
+        list_kwargs = dict(list_kwargs or {})
 
         # User used string notation. Try to find proper
         # resource
@@ -619,9 +795,11 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
                 resource_by_id = service_proxy._get(
                     resource_type, name_or_id, *get_args, **get_kwargs
                 )
-                return [resource_by_id]
             except exceptions.NotFoundException:
                 pass
+            else:
+                yield resource_by_id
+                return
 
         if not filters:
             filters = {}
@@ -630,8 +808,8 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
             filters["name"] = name_or_id
         list_kwargs.update(filters)
 
-        return list(
-            service_proxy._list(resource_type, *list_args, **list_kwargs)
+        yield from service_proxy._list(
+            resource_type, *list_args, **list_kwargs
         )
 
     def project_cleanup(
@@ -716,8 +894,8 @@ class _OpenStackCloudMixin(_services_mixin.ServicesMixin):
                 # same reason as above
                 pass
             if fn:
-                self._pool_executor.submit(
-                    cleanup_task, dep_graph, service, fn
+                self._submit_task(
+                    scheduler.CLEANUP, cleanup_task, dep_graph, service, fn
                 )
             else:
                 dep_graph.node_done(service)
@@ -0,0 +1,305 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Columnar results keep selected attributes of listed resources in one array
+per attribute instead of one :class:`~openstack.resource.Resource` per
+resource. They are meant for analytics over large listings, where creating
+every resource would cost far more than the few attributes needed.
+
+They are returned by the ``_list`` method of proxies when ``columns`` are
+given:
+
+.. code-block:: python
+
+    servers = conn.compute._list(
+        server.Server, details=True, columns=['id', 'status', 'compute_host']
+    )
+    by_host = servers.group_by('compute_host')
+    errors = servers.filter(status='ERROR')
+    print(errors.to_dict()['id'])
+
+Columns are NumPy arrays when NumPy is installed, lists otherwise. Resources
+are only created, with the selected attributes, when rows are accessed.
+"""
+
+import collections
+import itertools
+import typing as ty
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from openstack import fields
+
+__all__ = ['ColumnarResult']
+
+# Types of the attributes which are stored in typed NumPy arrays. Other
+# attributes are kept in arrays of objects.
+_NUMPY_TYPES = (bool, int, float)
+
+
+def _column_fields(resource_type, columns):
+    found: dict[str, fields._BaseComponent] = {}
+    for attr, component in resource_type._attributes_iterator(
+        (fields.Body, fields.URI)
+    ):
+        found.setdefault(attr, component)
+    unknown = [name for name in columns if name not in found]
+    if unknown:
+        raise ValueError(
+            f'Unknown attributes of {resource_type.__name__}: '
+            f'{", ".join(unknown)}'
+        )
+    return [found[name] for name in columns]
+
+
+def _convert(body, component):
+    # Convert values as the attributes of resources do
+    try:
+        value = body[component.name]
+    except KeyError:
+        return component.default
+    if value is None:
+        return None
+    return fields._convert_type(
+        value, component.data_type, component.list_type
+    )
+
+
+class ColumnarResult:
+    """Selected attributes of listed resources, stored by column.
+
+    :param resource_type: The :class:`~openstack.resource.Resource` subclass
+        of the resources.
+    :param dict columns: Values of every attribute by attribute name, all of
+        the same length.
+    :param connection: The connection set on the resources of the rows.
+    :param bool use_numpy: Whether to store columns in NumPy arrays. Defaults
+        to whether NumPy is installed.
+    """
+
+    def __init__(
+        self, resource_type, columns, connection=None, use_numpy=None
+    ):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ValueError('NumPy is not installed')
+        self.resource_type = resource_type
+        self.use_numpy = use_numpy
+        self._connection = connection
+        self._columns = {}
+        for name, values in columns.items():
+            self._columns[name] = self._array(name, values)
+        lengths = {len(values) for values in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('Columns must all have the same length')
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_bodies(cls, resource_type, bodies, columns, **kwargs):
+        """Build a result from the bodies of listed resources.
+
+        :param resource_type: The :class:`~openstack.resource.Resource`
+            subclass of the resources.
+        :param bodies: Iterable of dicts keyed by the server side names of
+            the attributes, as yielded by ``Resource._list_bodies``.
+        :param list columns: Names of the attributes to keep.
+        :param kwargs: Other arguments of :class:`ColumnarResult`.
+        :raises: ``ValueError`` if a column is not an attribute of the
+            resource type.
+        """
+        components = _column_fields(resource_type, columns)
+        values: list[list[ty.Any]] = [[] for _ in columns]
+        appends = [
+            (column.append, component)
+            for column, component in zip(values, components)
+        ]
+        for body in bodies:
+            for append, component in appends:
+                append(_convert(body, component))
+        return cls(resource_type, dict(zip(columns, values)), **kwargs)
+
+    @classmethod
+    def from_resources(cls, resource_type, resources, columns, **kwargs):
+        """Build a result from resource objects.
+
+        :param resource_type: The :class:`~openstack.resource.Resource`
+            subclass of the resources.
+        :param resources: Iterable of resources.
+        :param list columns: Names of the attributes to keep.
+        :param kwargs: Other arguments of :class:`ColumnarResult`.
+        :raises: ``ValueError`` if a column is not an attribute of the
+            resource type.
+        """
+        _column_fields(resource_type, columns)
+        values: list[list[ty.Any]] = [[] for _ in columns]
+        for value in resources:
+            for column, name in zip(values, columns):
+                column.append(getattr(value, name))
+        return cls(resource_type, dict(zip(columns, values)), **kwargs)
+
+    @property
+    def columns(self):
+        """The names of the columns."""
+        return list(self._columns)
+
+    def column(self, name):
+        """Return the values of an attribute.
+
+        :returns: A NumPy array or a list.
+        :raises: ``KeyError`` if there is no such column.
+        """
+        return self._columns[name]
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return (self.row(index) for index in range(self._length))
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self._columns[index]
+        return self.row(index)
+
+    def __repr__(self):
+        return (
+            f'{type(self).__name__}({self.resource_type.__name__}, '
+            f'columns={self.columns}, rows={self._length})'
+        )
+
+    def row(self, index):
+        """Return a resource with the attributes of a row.
+
+        :param int index: Index of the row, negative from the end.
+        :raises: ``IndexError`` if there is no such row.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('Row index out of range')
+        attrs = {
+            name: self._scalar(values[index])
+            for name, values in self._columns.items()
+        }
+        return self.resource_type.existing(
+            connection=self._connection, **attrs
+        )
+
+    def to_dict(self):
+        """Return the columns as a dict of lists, keyed by attribute name."""
+        return {
+            name: values.tolist() if self.use_numpy else list(values)
+            for name, values in self._columns.items()
+        }
+
+    def filter(self, mask=None, **values):
+        """Return the rows matching all given conditions.
+
+        :param mask: Sequence of booleans, one per row, selecting the rows
+            to keep, such as ``result['ram'] > 1024`` with NumPy columns.
+        :param values: Values of columns to keep rows for. A list, tuple or
+            set matches any of its values.
+        :returns: A new :class:`ColumnarResult`.
+        :raises: ``KeyError`` if there is no such column.
+        """
+        if self.use_numpy:
+            keep = numpy.ones(self._length, dtype=bool)
+            if mask is not None:
+                keep &= numpy.asarray(mask, dtype=bool)
+            for name, value in values.items():
+                column = self._columns[name]
+                if isinstance(value, (list, tuple, set, frozenset)):
+                    keep &= numpy.isin(column, list(value))
+                else:
+                    keep &= column == value
+            return self._take(keep)
+
+        keep = [True] * self._length if mask is None else list(mask)
+        for name, value in values.items():
+            column = self._columns[name]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                value = set(value)
+                matches = (item in value for item in column)
+            else:
+                matches = (item == value for item in column)
+            keep = [k and m for k, m in zip(keep, matches)]
+        return self._take(keep)
+
+    def group_by(self, name):
+        """Split the rows by the value of a column.
+
+        :param str name: Name of the column.
+        :returns: A dict of :class:`ColumnarResult` by column value, in the
+            order values first appear.
+        :raises: ``KeyError`` if there is no such column.
+        """
+        positions = collections.defaultdict(list)
+        for index, value in enumerate(self._columns[name]):
+            positions[self._scalar(value)].append(index)
+        return {
+            value: self._take(indexes, positions=True)
+            for value, indexes in positions.items()
+        }
+
+    def _array(self, name, values):
+        if not self.use_numpy:
+            return values if isinstance(values, list) else list(values)
+        if isinstance(values, numpy.ndarray):
+            return values
+        values = list(values)
+        data_type = getattr(
+            getattr(self.resource_type, name, None), 'data_type', None
+        )
+        if data_type in _NUMPY_TYPES and None not in values:
+            return numpy.array(values, dtype=data_type)
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    def _scalar(self, value):
+        if self.use_numpy and isinstance(value, numpy.generic):
+            return value.item()
+        return value
+
+    def _take(self, selection, positions=False):
+        """Return a result with the selected rows.
+
+        :param selection: Booleans selecting rows, or their positions.
+        """
+        if self.use_numpy:
+            selection = numpy.asarray(
+                selection, dtype=numpy.intp if positions else bool
+            )
+            columns = {
+                name: values[selection]
+                for name, values in self._columns.items()
+            }
+        else:
+            if not positions:
+                selection = list(
+                    itertools.compress(range(self._length), selection)
+                )
+            columns = {
+                name: [values[index] for index in selection]
+                for name, values in self._columns.items()
+            }
+        return type(self)(
+            self.resource_type,
+            columns,
+            connection=self._connection,
+            use_numpy=self.use_numpy,
+        )
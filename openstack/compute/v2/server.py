@@ -44,6 +44,7 @@ class Server(resource.Resource, metadata.MetadataMixin, tag.TagMixin):
     resource_key = 'server'
     resources_key = 'servers'
     base_path = '/servers'
+    _details_base_path = '/servers/detail'
 
     # capabilities
     allow_create = True
@@ -0,0 +1,226 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Backends for caching authentication state between connections.
+
+An auth cache stores the serialized state of a keystoneauth plugin (as
+returned by ``get_auth_state``) keyed by the plugin's cache id, so that
+subsequent connections to the same cloud can skip authentication.
+"""
+
+import contextlib
+import hashlib
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where refreshes are not serialized.
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+from cryptography import fernet
+
+from openstack import _log
+from openstack import exceptions
+
+_logger = _log.setup_logging('openstack.config')
+
+#: Default number of seconds before token expiry at which a cached token is
+#: no longer handed out and a new one is fetched instead.
+DEFAULT_REFRESH_WINDOW = 300
+
+
+class AuthCache:
+    """Base class for auth state cache backends.
+
+    Subclasses must implement :meth:`get` and :meth:`set`. Backends which can
+    serialize authentication across processes should also implement
+    :meth:`lock` and set :attr:`shared` to ``True``.
+    """
+
+    #: Human readable name of the backend, used in log messages.
+    name = 'auth cache'
+    #: Whether the backend supports cross-process locking, allowing a single
+    #: process to authenticate on behalf of all others.
+    shared = False
+    #: Seconds before expiry at which a cached token is considered stale.
+    refresh_window = 0
+
+    def is_available(self):
+        """Whether the backend can be used in the current environment."""
+        return True
+
+    def get(self, cache_id):
+        """Return the cached auth state for ``cache_id`` or None."""
+        raise NotImplementedError
+
+    def set(self, cache_id, state):
+        """Store the auth state for ``cache_id``."""
+        raise NotImplementedError
+
+    def lock(self, cache_id):
+        """Return a context manager serializing refreshes of ``cache_id``."""
+        return contextlib.nullcontext()
+
+
+class KeyringAuthCache(AuthCache):
+    """Store auth state in the system keyring.
+
+    Requires the installation of the python ``keyring`` package.
+    """
+
+    name = 'keyring'
+
+    def is_available(self):
+        return keyring is not None
+
+    def get(self, cache_id):
+        try:
+            return keyring.get_password('openstacksdk', cache_id)
+        except RuntimeError:  # the fail backend raises this
+            _logger.debug('Failed to fetch auth from keyring')
+            return None
+
+    def set(self, cache_id, state):
+        try:
+            keyring.set_password('openstacksdk', cache_id, state)
+        except RuntimeError:  # the fail backend raises this
+            _logger.debug('Failed to set auth into keyring')
+
+
+class FileAuthCache(AuthCache):
+    """Store encrypted auth state in files under a cache directory.
+
+    Each cached token is written atomically to its own file, encrypted with
+    a Fernet key. Unless an explicit ``key`` is given, a key is generated on
+    first use and stored alongside the tokens, readable only by the current
+    user. Refreshes are serialized between processes using file locks so
+    that only one process on the host authenticates at a time.
+
+    :param str path: Directory to store cached tokens in.
+    :param key: A url-safe base64-encoded 32-byte Fernet key. Optional.
+    :param int refresh_window: Seconds before expiry at which a cached token
+        is no longer reused. Defaults to :data:`DEFAULT_REFRESH_WINDOW`.
+    """
+
+    name = 'file'
+    shared = fcntl is not None
+
+    def __init__(self, path, key=None, refresh_window=None):
+        self._path = path
+        self._key = key
+        if refresh_window is None:
+            refresh_window = DEFAULT_REFRESH_WINDOW
+        self.refresh_window = int(refresh_window)
+        self._fernet = None
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            key = self._key or self._load_or_create_key()
+            self._fernet = fernet.Fernet(key)
+        return self._fernet
+
+    def _ensure_path(self):
+        os.makedirs(self._path, mode=0o700, exist_ok=True)
+
+    def _load_or_create_key(self):
+        self._ensure_path()
+        key_file = os.path.join(self._path, 'key')
+        if not os.path.exists(key_file):
+            # Write the key to a temporary file and hard-link it into place
+            # so that concurrent processes never observe a partial key and
+            # exactly one of them wins.
+            fd, tmp_name = tempfile.mkstemp(dir=self._path)
+            try:
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(fernet.Fernet.generate_key())
+                try:
+                    os.link(tmp_name, key_file)
+                except FileExistsError:
+                    pass
+            finally:
+                os.unlink(tmp_name)
+        with open(key_file, 'rb') as f:
+            return f.read().strip()
+
+    def _state_file(self, cache_id):
+        digest = hashlib.sha256(cache_id.encode('utf-8')).hexdigest()
+        return os.path.join(self._path, digest)
+
+    def get(self, cache_id):
+        try:
+            with open(self._state_file(cache_id), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            return self._get_fernet().decrypt(data).decode('utf-8')
+        except fernet.InvalidToken:
+            _logger.debug('Failed to decrypt cached auth, ignoring it')
+            return None
+
+    def set(self, cache_id, state):
+        self._ensure_path()
+        data = self._get_fernet().encrypt(state.encode('utf-8'))
+        fd, tmp_name = tempfile.mkstemp(dir=self._path)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                tmp.write(data)
+            os.replace(tmp_name, self._state_file(cache_id))
+        except OSError:
+            _logger.debug('Failed to write auth into file cache')
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+
+    @contextlib.contextmanager
+    def lock(self, cache_id):
+        if fcntl is None:
+            yield
+            return
+        self._ensure_path()
+        with open(self._state_file(cache_id) + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def get_auth_cache(backend=None, path=None, key=None, refresh_window=None):
+    """Build an auth cache backend from configuration values.
+
+    :param backend: Either the name of a built-in backend (``keyring`` or
+        ``file``) or an :class:`AuthCache` instance. Defaults to ``keyring``.
+    :param str path: Base cache directory, used by the ``file`` backend.
+    :param key: Encryption key, used by the ``file`` backend.
+    :param refresh_window: Refresh window, used by the ``file`` backend.
+    :returns: An :class:`AuthCache` instance.
+    :raises: :class:`~openstack.exceptions.ConfigException` if ``backend``
+        is not a known backend name.
+    """
+    if isinstance(backend, AuthCache):
+        return backend
+    if backend in (None, 'keyring'):
+        return KeyringAuthCache()
+    if backend == 'file':
+        return FileAuthCache(
+            os.path.join(path, 'auth'),
+            key=key,
+            refresh_window=refresh_window,
+        )
+    raise exceptions.ConfigException(f"Unknown auth cache backend: {backend}")
@@ -13,15 +13,12 @@
 # under the License.
 
 import copy
+import json
 import os.path
 from urllib import parse
 import warnings
 
-try:
-    import keyring
-except ImportError:
-    keyring = None
-
+from keystoneauth1 import access
 from keystoneauth1 import discover
 import keystoneauth1.exceptions.catalog
 from keystoneauth1.loading import adapter as ks_load_adap
@@ -44,6 +41,7 @@ except ImportError:
 
 from openstack import _log
 from openstack.config import _util
+from openstack.config import auth_cache as _auth_cache
 from openstack.config import defaults as config_defaults
 from openstack import exceptions
 from openstack import proxy
@@ -65,6 +63,16 @@ SCOPE_KEYS = {
 _ENOENT = object()
 
 
+def _auth_ref_from_state(state):
+    if not state:
+        return None
+    try:
+        data = json.loads(state)
+        return access.create(body=data['body'], auth_token=data['auth_token'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
 def _make_key(key, service_type):
     if not service_type:
         return key
@@ -276,6 +284,7 @@ class CloudRegion:
         influxdb_config=None,
         collector_registry=None,
         cache_auth=False,
+        auth_cache=None,
     ):
         self._name = name
         self.config = _util.normalize_keys(config)
@@ -289,6 +298,7 @@ class CloudRegion:
         self._force_ipv4 = force_ipv4
         self._auth = auth_plugin
         self._cache_auth = cache_auth
+        self._auth_cache = _auth_cache.get_auth_cache(auth_cache)
         self.load_auth_from_cache()
         self._openstack_config = openstack_config
         self._keystone_session = session
@@ -617,12 +627,40 @@ class CloudRegion:
     def force_ipv4(self):
         return self._force_ipv4
 
+    def copy_with_auth(self, auth, auth_plugin, session):
+        """Return a shallow copy of this CloudRegion with different auth.
+
+        The copy shares everything but the auth settings, auth plugin and
+        session with this CloudRegion.
+
+        :param dict auth: The auth settings of the copy.
+        :param auth_plugin: The keystoneauth plugin of the copy.
+        :param session: The keystoneauth session of the copy.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.config = dict(self.config, auth=auth)
+        new._auth = auth_plugin
+        new._keystone_session = session
+        new.load_auth_from_cache()
+        return new
+
     def get_auth(self):
         """Return a keystoneauth plugin from the auth credentials."""
         return self._auth
 
     def skip_auth_cache(self):
-        return not keyring or not self._auth or not self._cache_auth
+        return (
+            not self._auth_cache.is_available()
+            or not self._auth
+            or not self._cache_auth
+        )
+
+    def _auth_is_fresh(self):
+        auth_ref = getattr(self._auth, 'auth_ref', None)
+        if not auth_ref:
+            return False
+        return not auth_ref.will_expire_soon(self._auth_cache.refresh_window)
 
     def load_auth_from_cache(self):
         if self.skip_auth_cache():
@@ -634,14 +672,17 @@ class CloudRegion:
         if not cache_id:
             return
 
-        try:
-            state = keyring.get_password('openstacksdk', cache_id)
-        except RuntimeError:  # the fail backend raises this
-            self.log.debug('Failed to fetch auth from keyring')
+        state = self._auth_cache.get(cache_id)
+        if not state:
             return
 
-        self.log.debug('Reusing authentication from keyring')
+        self.log.debug('Reusing authentication from %s', self._auth_cache.name)
         self._auth.set_auth_state(state)
+        if self._auth_cache.refresh_window and not self._auth_is_fresh():
+            # The cached token is about to expire, drop it so that a new one
+            # is fetched rather than failing mid-operation.
+            self.log.debug('Cached authentication is about to expire')
+            self._auth.set_auth_state(None)
 
     def set_auth_cache(self):
         if self.skip_auth_cache():
@@ -650,14 +691,69 @@ class CloudRegion:
         cache_id = self._auth.get_cache_id()
         state = self._auth.get_auth_state()
 
-        try:
-            if state:
-                # NOTE: under some conditions the method may be invoked when
-                # auth is empty. This may lead to exception in the keyring lib,
-                # thus do nothing.
-                keyring.set_password('openstacksdk', cache_id, state)
-        except RuntimeError:  # the fail backend raises this
-            self.log.debug('Failed to set auth into keyring')
+        # NOTE: under some conditions the method may be invoked when
+        # auth is empty. This may lead to exception in the keyring lib,
+        # thus do nothing.
+        if state:
+            self._auth_cache.set(cache_id, state)
+
+    def authenticate_with_cache(self, session, force=False):
+        """Make sure the auth plugin holds a fresh token, sharing it.
+
+        If the configured auth cache is shared between processes, only one
+        process at a time re-authenticates while the others wait and then
+        reuse the token it stored. Otherwise this simply authenticates and
+        updates the cache.
+
+        :param session: The keystoneauth session used to authenticate.
+        :param bool force: Fetch a new token even if the current one is
+            still fresh, for instance to renew it ahead of expiry.
+        """
+        if self.skip_auth_cache():
+            return
+        cache_id = self._auth.get_cache_id()
+        if not cache_id or (not force and self._auth_is_fresh()):
+            return
+        current = getattr(self._auth, 'auth_ref', None)
+        window = self._auth_cache.refresh_window
+        with self._auth_cache.lock(cache_id):
+            # Another process may have refreshed the token while we were
+            # waiting for the lock.
+            state = self._auth_cache.get(cache_id)
+            cached = _auth_ref_from_state(state)
+            if (
+                cached is not None
+                and not cached.will_expire_soon(window)
+                and (
+                    not force
+                    or current is None
+                    or cached.expires > current.expires
+                )
+            ):
+                self._auth.set_auth_state(state)
+                return
+            self._renew_auth_ref(session)
+            self.set_auth_cache()
+
+    def _renew_auth_ref(self, session):
+        # Fetch the new token before swapping it in so that concurrent
+        # requests keep using the current one in the meantime instead of
+        # waiting for re-authentication.
+        self._auth.auth_ref = self._auth.get_auth_ref(session)
+
+    def renew_auth(self, session):
+        """Fetch a new token ahead of the expiry of the current one.
+
+        The current token stays in use until the new one has been fetched.
+        If auth caching is enabled, the new token is shared through the
+        cache.
+
+        :param session: The keystoneauth session used to authenticate.
+        """
+        if not self.skip_auth_cache() and self._auth.get_cache_id():
+            self.authenticate_with_cache(session, force=True)
+        else:
+            self._renew_auth_ref(session)
 
     def insert_user_agent(self):
         """Set sdk information into the user agent of the Session.
@@ -711,6 +807,8 @@ class CloudRegion:
                 self._keystone_session.app_name = self._app_name
             if hasattr(self._keystone_session, 'app_version'):
                 self._keystone_session.app_version = self._app_version
+            if self._auth_cache.shared:
+                self.authenticate_with_cache(self._keystone_session)
         return self._keystone_session
 
     def get_service_catalog(self):
@@ -31,6 +31,7 @@ import yaml
 
 from openstack import _log
 from openstack.config import _util
+from openstack.config import auth_cache
 from openstack.config import cloud_region
 from openstack.config import defaults
 from openstack.config import vendors
@@ -303,6 +304,7 @@ class OpenStackConfig:
             self.default_cloud = 'defaults'
 
         self._cache_auth = False
+        self._auth_cache = None
         self._cache_expiration_time = 0
         self._cache_path = CACHE_PATH
         self._cache_class = 'dogpile.cache.null'
@@ -341,6 +343,12 @@ class OpenStackConfig:
             self._cache_expirations = cache_settings.get(
                 'expiration', self._cache_expirations
             )
+            self._auth_cache = auth_cache.get_auth_cache(
+                cache_settings.get('auth_backend'),
+                path=self._cache_path,
+                key=cache_settings.get('auth_key'),
+                refresh_window=cache_settings.get('auth_refresh_window'),
+            )
 
         if load_yaml_config:
             metrics_config = self.cloud_config.get('metrics', {})
@@ -1325,6 +1333,7 @@ class OpenStackConfig:
             app_name=self._app_name,
             app_version=self._app_version,
             cache_auth=self._cache_auth,
+            auth_cache=self._auth_cache,
             cache_expiration_time=self._cache_expiration_time,
             cache_expirations=self._cache_expirations,
             cache_path=self._cache_path,
@@ -1440,6 +1449,7 @@ class OpenStackConfig:
             auth_plugin=auth_plugin,
             openstack_config=self,
             cache_auth=self._cache_auth,
+            auth_cache=self._auth_cache,
             cache_expiration_time=self._cache_expiration_time,
             cache_expirations=self._cache_expirations,
             cache_path=self._cache_path,
@@ -271,11 +271,14 @@ Additional information about the services can be found in the
 :ref:`service-proxies` documentation.
 """
 
+import atexit
 import copy
 import importlib.metadata as importlib_metadata
+import typing as ty
 import warnings
 
 import keystoneauth1.exceptions
+from keystoneauth1 import loading as ks_loading
 import requestsexceptions
 
 from openstack import _log
@@ -339,6 +342,39 @@ def from_config(cloud=None, config=None, options=None, **kwargs):
     return Connection(config=config)
 
 
+def _override_auth(auth, overrides):
+    """Apply auth overrides to an auth dict.
+
+    If there are user, project or domain settings in the overrides, both id
+    and name are stripped from ``auth`` so that a user can say::
+
+        cloud.connect_as(project_name='foo')
+
+    and have that work with clouds that have a project_id set in their
+    config.
+
+    :param dict auth: The auth dict to update in place.
+    :param dict overrides: The auth settings to override.
+    :returns: The updated auth dict.
+    """
+
+    def pop_keys(name_key, id_key):
+        if name_key in overrides or id_key in overrides:
+            auth.pop(name_key, None)
+            auth.pop(id_key, None)
+
+    for prefix in ('user', 'project'):
+        if prefix == 'user':
+            name_key = 'username'
+        else:
+            name_key = 'project_name'
+        pop_keys(name_key, f'{prefix}_id')
+        pop_keys(f'{prefix}_domain_name', f'{prefix}_domain_id')
+
+    auth.update(overrides)
+    return auth
+
+
 class Connection(
     _accelerator.AcceleratorCloudMixin,
     _baremetal.BaremetalCloudMixin,
@@ -439,8 +475,10 @@ class Connection(
         :type global_request_id: str
         :param pool_executor:
             A futurist ``Executor`` object to be used for concurrent background
-            activities. Defaults to None in which case a ThreadPoolExecutor
-            will be created if needed.
+            activities. Defaults to None in which case a
+            :class:`~openstack.scheduler.WorkScheduler` will be created if
+            needed. A given executor is not replaced in processes forked
+            after the connection is created, which is left to its owner.
         :type pool_executor: :class:`~futurist.Executor`
         :param kwargs: If a config is not provided, the rest of the parameters
             provided are assumed to be arguments to be passed to the
@@ -598,31 +636,7 @@ class Connection(
         params = copy.deepcopy(self.config.config)
         # Remove profile from current cloud so that overridding works
         params.pop('profile', None)
-
-        # Utility function to help with the stripping below.
-        def pop_keys(params, auth, name_key, id_key):
-            if name_key in auth or id_key in auth:
-                params['auth'].pop(name_key, None)
-                params['auth'].pop(id_key, None)
-
-        # If there are user, project or domain settings in the incoming auth
-        # dict, strip out both id and name so that a user can say:
-        #     cloud.connect_as(project_name='foo')
-        # and have that work with clouds that have a project_id set in their
-        # config.
-        for prefix in ('user', 'project'):
-            if prefix == 'user':
-                name_key = 'username'
-            else:
-                name_key = 'project_name'
-            id_key = f'{prefix}_id'
-            pop_keys(params, kwargs, name_key, id_key)
-            id_key = f'{prefix}_domain_id'
-            name_key = f'{prefix}_domain_name'
-            pop_keys(params, kwargs, name_key, id_key)
-
-        for key, value in kwargs.items():
-            params['auth'][key] = value
+        params['auth'] = _override_auth(params['auth'], kwargs)
 
         cloud_region = config.get_one(**params)
         # Attach the discovery cache from the old session so we won't
@@ -635,7 +649,75 @@ class Connection(
         # a subclass in the case of shade wrapping sdk.
         return self.__class__(config=cloud_region)
 
-    def connect_as_project(self, project):
+    def clone_as(self, token_refresh_window=None, **kwargs):
+        """Make a lightweight Connection object with new auth context.
+
+        This behaves like :meth:`connect_as`, but rather than building a new
+        Connection from scratch, the new object shares the HTTP connection
+        pool, discovery cache, executor and configuration of this one and
+        only gets its own auth plugin, and therefore token. This makes it
+        cheap to create many of them, for instance to act on every project
+        of a cloud.
+
+        .. code-block:: python
+
+            conn = openstack.connect(cloud='example')
+            for project in conn.identity.projects():
+                with conn.clone_as(project_id=project.id) as project_conn:
+                    servers = project_conn.list_servers()
+
+        Clones are not closed at exit, so they must be closed once done
+        with, preferably by using them as context managers as above. Closing
+        a clone does not release the resources it shares with this one. If
+        the configuration cannot be used to build a new auth plugin, for
+        instance because the Connection was created from an existing
+        session, this falls back to :meth:`connect_as`.
+
+        :param int token_refresh_window: Renew the token of the clone in the
+            background, as :meth:`start_token_refresh` does, this many
+            seconds before it expires. Unlike new connections, clones do not
+            use the ``token_refresh_window`` of the configuration, since a
+            background thread per clone does not scale to many projects.
+        :param kwargs: keyword arguments can contain anything that would
+            normally go in an auth dict. They will override the same settings
+            from the parent cloud as appropriate. Entries that do not want to
+            be overridden can be ommitted.
+        """
+        auth_type = self.config.config.get('auth_type')
+        auth = self.config.config.get('auth')
+        if not auth_type or auth is None:
+            return self.connect_as(**kwargs)
+        auth = _override_auth(dict(auth), kwargs)
+        loader: ks_loading.BaseLoader[ty.Any] = ks_loading.get_plugin_loader(
+            auth_type
+        )
+        auth_plugin = loader.load_from_options(**auth)
+
+        # Share the underlying requests session (and so the connection pool)
+        # and the discovery cache, without taking ownership of them.
+        session = copy.copy(self.session)
+        session._session = None
+        session.auth = auth_plugin
+        session._api_times = []
+        for attr in ('_sdk_connection', '_sdk_token_refresher'):
+            session.__dict__.pop(attr, None)
+
+        cloud_region = self.config.copy_with_auth(auth, auth_plugin, session)
+        cloud_region.config['token_refresh_window'] = token_refresh_window
+
+        conn = self.__class__(
+            config=cloud_region,
+            pool_executor=self._pool_executor,
+            strict_proxies=self._strict_proxies,
+            global_request_id=self._global_request_id,
+        )
+        # The clone owns none of the shared resources, so it neither needs
+        # to be closed at exit nor may it shut down the shared executor.
+        conn._shared_pool_executor = True
+        atexit.unregister(conn.close)
+        return conn
+
+    def connect_as_project(self, project, clone=False):
         """Make a new Connection object with a new project.
 
         Take the existing settings from the current cloud and construct a new
@@ -654,6 +736,9 @@ class Connection(
 
         :param project: Either a project name or a project dict as returned by
             ``list_projects``.
+        :param bool clone: Make a lightweight Connection sharing resources
+            with this one using :meth:`clone_as`. It must be closed once
+            done with.
         """
         auth = {}
         if isinstance(project, dict):
@@ -663,6 +748,8 @@ class Connection(
                 auth['project_domain_id'] = project['domain_id']
         else:
             auth['project_name'] = project
+        if clone:
+            return self.clone_as(**auth)
         return self.connect_as(**auth)
 
     def endpoint_for(self, service_type, interface=None, region_name=None):
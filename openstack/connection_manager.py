@@ -0,0 +1,372 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.connection_manager.ConnectionManager` class manages
+connections to many clouds and regions at once. Connections are created
+lazily, the first time they are used, and all of them share:
+
+* a single HTTP connection pool,
+* a single bounded executor for concurrent work,
+* the keystoneauth discovery cache, and
+* the API cache backend, with keys namespaced per cloud region.
+
+Regions of the same cloud using the same credentials additionally share a
+keystoneauth session, and therefore a token.
+
+.. code-block:: python
+
+    from openstack import connection_manager
+
+    manager = connection_manager.ConnectionManager()
+    for conn, server in manager.map(lambda c: c.compute.servers()):
+        print(conn.name, conn.config.region_name, server.name)
+"""
+
+import concurrent.futures
+import functools
+import json
+import os
+import queue
+import threading
+import typing as ty
+import weakref
+
+import dogpile.cache
+from keystoneauth1 import session as ks_session
+import requests
+import requests.adapters
+
+from openstack import _log
+from openstack.cloud import openstackcloud
+from openstack import config as _config
+from openstack import connection
+
+__all__ = ['ConnectionManager']
+
+#: Default number of worker threads shared by all managed connections.
+DEFAULT_MAX_WORKERS = 10
+
+_DONE = object()
+
+# Managers which need their process-local state reset in forked children
+_FORK_REGISTRY: 'weakref.WeakSet[ConnectionManager]' = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for manager in list(_FORK_REGISTRY):
+        try:
+            manager._after_fork()
+        except Exception:
+            manager.log.exception('Failed to reset manager after fork')
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+class ConnectionManager:
+    """Lazily create and share resources between many connections.
+
+    :param cloud_regions: A list of
+        :class:`~openstack.config.cloud_region.CloudRegion` objects to manage.
+        If not given, every region of every cloud known to ``config`` is
+        managed.
+    :param config: An :class:`~openstack.config.loader.OpenStackConfig` used
+        to look up cloud regions. Defaults to a new one loading the usual
+        config files.
+    :param int max_workers: Size of the shared executor and of the HTTP
+        connection pool per host.
+    :param pool_executor: A futurist ``Executor`` to share between all
+        connections instead of creating a ThreadPoolExecutor.
+    :param connection_kwargs: Additional arguments passed to each
+        :class:`~openstack.connection.Connection`.
+    """
+
+    def __init__(
+        self,
+        cloud_regions=None,
+        config=None,
+        max_workers=DEFAULT_MAX_WORKERS,
+        pool_executor=None,
+        **connection_kwargs,
+    ):
+        self.log = _log.setup_logging('openstack')
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._connection_kwargs = connection_kwargs
+        self._connections = {}
+        self._connection_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._sessions = {}
+        self._caches = {}
+        self._discovery_cache = {}
+        self._executor = pool_executor
+        self._owns_executor = False
+        self._http_session = None
+        self._config: ty.Optional[_config.OpenStackConfig]
+
+        if cloud_regions is not None:
+            self._regions = {
+                (region.name, region.region_name): region
+                for region in cloud_regions
+            }
+            self._config = None
+        else:
+            self._config = config or _config.OpenStackConfig()
+            self._regions = {}
+            for cloud in self._config.get_cloud_names():
+                for region in self._config._get_regions(cloud):
+                    if region:
+                        self._regions[(cloud, region['name'])] = None
+
+        _FORK_REGISTRY.add(self)
+
+    @property
+    def region_keys(self):
+        """List of ``(cloud, region_name)`` tuples for managed regions."""
+        return list(self._regions)
+
+    @property
+    def pool_executor(self):
+        """The executor shared between all managed connections."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers
+                )
+                self._owns_executor = True
+            return self._executor
+
+    def _get_http_session(self):
+        if self._http_session is None:
+            self._http_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self._max_workers,
+                pool_maxsize=self._max_workers,
+            )
+            self._http_session.mount('https://', adapter)
+            self._http_session.mount('http://', adapter)
+        return self._http_session
+
+    def _get_cloud_region(self, key):
+        cloud_region = self._regions[key]
+        if cloud_region is None:
+            # Regions are only looked up lazily when loaded from a config
+            if self._config is None:
+                raise KeyError(key)
+            cloud, region_name = key
+            cloud_region = self._config.get_one(cloud, region_name=region_name)
+            self._regions[key] = cloud_region
+        return cloud_region
+
+    @staticmethod
+    def _get_session_key(cloud_region):
+        auth = cloud_region.config.get('auth', {})
+        return (
+            cloud_region.name,
+            cloud_region.config.get('auth_type'),
+            json.dumps(auth, sort_keys=True, default=str),
+        )
+
+    def _make_cache(self, conn, cloud_region):
+        cache_class = cloud_region.get_cache_class()
+        arguments = cloud_region.get_cache_arguments() or {}
+        if cache_class == 'dogpile.cache.memory':
+            arguments['cache_dict'] = self._caches.setdefault(cache_class, {})
+        prefix = f'{cloud_region.name}:{cloud_region.region_name}:'
+        return dogpile.cache.make_region(
+            function_key_generator=conn._make_cache_key,
+            key_mangler=lambda key: prefix + key,
+        ).configure(
+            cache_class,
+            expiration_time=cloud_region.get_cache_expiration_time(),
+            arguments=arguments,
+        )
+
+    def get_connection(self, cloud, region_name=None):
+        """Return the connection for a cloud region, creating it if needed.
+
+        :param str cloud: Name of the cloud.
+        :param str region_name: Name of the region. May be omitted if the
+            cloud has a single region.
+        :returns: A :class:`~openstack.connection.Connection`.
+        :raises: KeyError if the cloud region is not managed.
+        """
+        if region_name is None:
+            matches = [key for key in self._regions if key[0] == cloud]
+            if len(matches) != 1:
+                raise KeyError(
+                    f"Cloud {cloud} has {len(matches)} regions, "
+                    f"region_name is required"
+                )
+            key = matches[0]
+        else:
+            key = (cloud, region_name)
+
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is not None:
+                return conn
+            key_lock = self._connection_locks.setdefault(key, threading.Lock())
+
+        # Connections are built under a lock per region, so that regions
+        # are connected to concurrently but each of them only once.
+        with key_lock:
+            with self._lock:
+                conn = self._connections.get(key)
+                if conn is not None:
+                    return conn
+
+                cloud_region = self._get_cloud_region(key)
+                cloud_region._discovery_cache = self._discovery_cache
+                session_key = self._get_session_key(cloud_region)
+                session = self._sessions.get(session_key)
+                if session is not None:
+                    cloud_region._keystone_session = session
+                elif cloud_region._keystone_session is None:
+                    cloud_region.set_session_constructor(
+                        functools.partial(
+                            ks_session.Session,
+                            session=self._get_http_session(),
+                        )
+                    )
+
+            conn = connection.Connection(
+                config=cloud_region,
+                pool_executor=self.pool_executor,
+                **self._connection_kwargs,
+            )
+            conn._cache = self._make_cache(conn, cloud_region)
+            # The executor is shut down by close, once all connections are
+            # done
+            conn._shared_pool_executor = True
+
+            with self._lock:
+                self._sessions.setdefault(session_key, conn.session)
+                self._connections[key] = conn
+            return conn
+
+    @property
+    def connections(self):
+        """List of connections to all managed regions."""
+        return [self.get_connection(*key) for key in self._regions]
+
+    def map(self, func, keys=None, ignore_errors=False):
+        """Call ``func`` on every connection concurrently.
+
+        ``func`` is called with a connection and may return either a single
+        value or an iterable, such as the generators returned by proxy list
+        calls, which are consumed in a thread per region. These threads are
+        not those of the shared executor, which ``func`` may therefore use.
+        Results are yielded as soon as they are available, in no particular
+        order.
+
+        :param callable func: The function to call for every connection.
+        :param keys: A list of ``(cloud, region_name)`` tuples restricting the
+            connections to call ``func`` on. Defaults to all of them.
+        :param bool ignore_errors: Log and skip the remaining results of a
+            region whose call failed instead of raising the exception.
+        :returns: A generator of ``(connection, result)`` tuples, with one
+            tuple per item if ``func`` returns an iterable.
+        """
+        if keys is None:
+            keys = self.region_keys
+        results: queue.Queue[
+            tuple[connection.Connection, ty.Any, ty.Optional[Exception]]
+        ] = queue.Queue()
+        stopped = threading.Event()
+
+        def worker(conn):
+            try:
+                result = func(conn)
+                if isinstance(result, (str, bytes, dict)) or not hasattr(
+                    result, '__iter__'
+                ):
+                    results.put((conn, result, None))
+                else:
+                    for item in result:
+                        if stopped.is_set():
+                            break
+                        results.put((conn, item, None))
+            except Exception as e:
+                results.put((conn, None, e))
+            finally:
+                results.put((conn, _DONE, None))
+
+        connections = [self.get_connection(*key) for key in keys]
+        # Waiting on the shared executor from its own workers could use up
+        # all of them, so regions are called from threads of their own.
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(len(connections), 1),
+            thread_name_prefix='openstacksdk-map',
+        )
+        for conn in connections:
+            executor.submit(worker, conn)
+        pending = len(connections)
+        try:
+            while pending:
+                conn, item, exc = results.get()
+                if item is _DONE:
+                    pending -= 1
+                elif exc is not None:
+                    if not ignore_errors:
+                        raise exc
+                    self.log.warning(
+                        'Call failed for cloud %s region %s: %s',
+                        conn.name,
+                        conn.config.get_region_name(),
+                        exc,
+                    )
+                else:
+                    yield conn, item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _after_fork(self):
+        """Reset state which cannot be shared with the parent process.
+
+        Called in the child process after a fork. The connections reset
+        their own state, while the HTTP connection pools, the locks and the
+        executor if created by the manager are replaced here.
+        """
+        self._lock = threading.Lock()
+        self._connection_locks = {}
+        if self._http_session is not None:
+            openstackcloud._reset_http_session_after_fork(self._http_session)
+        if self._owns_executor:
+            # The worker threads of the executor only exist in the parent
+            self._executor = None
+            self._owns_executor = False
+            if self._connections:
+                executor = self.pool_executor
+                for conn in self._connections.values():
+                    conn._share_pool_executor(executor)
+
+    def close(self):
+        """Close all connections and release shared resources."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._sessions.clear()
+        for conn in connections:
+            conn.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._http_session is not None:
+            self._http_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
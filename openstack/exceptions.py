@@ -186,6 +186,27 @@ class ResourceFailure(SDKException):
     """General resource failure."""
 
 
+class BulkCreateFailure(SDKException):
+    """Some resources of a bulk creation could not be created.
+
+    :ivar failures: A list of ``(attrs, exception)`` tuples, one for each
+        resource which could not be created.
+    :ivar created: A list of the resources which were created.
+    """
+
+    def __init__(
+        self,
+        message: ty.Optional[str] = None,
+        failures: ty.Optional[
+            list[tuple[dict[str, ty.Any], Exception]]
+        ] = None,
+        created: ty.Optional[list[ty.Any]] = None,
+    ):
+        super().__init__(message)
+        self.failures = failures or []
+        self.created = created or []
+
+
 class InvalidResourceQuery(SDKException):
     """Invalid query params for resource."""
 
@@ -165,7 +165,8 @@ class Proxy(proxy.Proxy):
             Default to ['ERROR'].
         :type failures: :py:class:`list`
         :param interval: Number of seconds to wait between consecutive
-            checks. Defaults to 2.
+            checks, or a :class:`~openstack.utils.WaitSchedule` such as
+            :class:`~openstack.utils.ExponentialBackoff`. Defaults to 2.
         :param wait: Maximum number of seconds to wait before the status
             to be reached. Defaults to 300.
         :returns: The load balancer is returned on success.
@@ -10,6 +10,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import functools
 import typing as ty
 
 from openstack import exceptions
@@ -193,6 +194,41 @@ class Proxy(proxy.Proxy):
         "vpn_service": _vpn_service.VpnService,
     }
 
+    #: Resource types which can be created in bulk with a single request.
+    _bulk_create_types = (
+        _network.Network,
+        _port.Port,
+        _security_group_rule.SecurityGroupRule,
+        _subnet.Subnet,
+    )
+    #: Maximum number of resources created with a single request by
+    #: :meth:`~openstack.proxy.Proxy.bulk`.
+    _bulk_create_chunk_size = 100
+
+    def _bulk_native(
+        self, operation, resource_type, resources, ignore_missing, **attrs
+    ):
+        if (
+            operation != 'create'
+            or not resources
+            or resource_type not in self._bulk_create_types
+            or not all(isinstance(item, dict) for item in resources)
+        ):
+            return None
+
+        def call(chunk):
+            created = self._bulk_create(resource_type, chunk)
+            return [
+                proxy.BulkResult(item, res, None)
+                for item, res in zip(chunk, created)
+            ]
+
+        size = self._bulk_create_chunk_size
+        chunks = [
+            resources[i : i + size] for i in range(0, len(resources), size)
+        ]
+        return [(chunk, functools.partial(call, chunk)) for chunk in chunks]
+
     def _update(
         self,
         resource_type: type[resource.ResourceT],
@@ -2906,16 +2942,28 @@ class Proxy(proxy.Proxy):
         """
         return self._create(_port.Port, **attrs)
 
-    def create_ports(self, data):
+    def create_ports(self, data, chunk_size=None, bisect=False):
         """Create ports from the list of attributes
 
         :param list data: List of dicts of attributes which will be used to
             create a :class:`~openstack.network.v2.port.Port`,
             comprised of the properties on the Port class.
+        :param int chunk_size: Maximum number of ports to create with a single
+            request. Chunks are created concurrently. By default all ports
+            are created with one request.
+        :param bool bisect: When a chunk is rejected, isolate the offending
+            items and create all other ports.
 
         :returns: A generator of port objects
         :rtype: :class:`~openstack.network.v2.port.Port`
+        :raises: :class:`~openstack.exceptions.BulkCreateFailure` after all
+            other ports are returned if ``bisect`` is set and some ports
+            could not be created.
         """
+        if chunk_size:
+            return self._bulk_create(
+                _port.Port, data, chunk_size=chunk_size, bisect=bisect
+            )
         return self._bulk_create(_port.Port, data)
 
     def delete_port(self, port, ignore_missing=True, if_revision=None):
@@ -4885,7 +4933,7 @@ class Proxy(proxy.Proxy):
         """
         return self._create(_security_group_rule.SecurityGroupRule, **attrs)
 
-    def create_security_group_rules(self, data):
+    def create_security_group_rules(self, data, chunk_size=None, bisect=False):
         """Create new security group rules from the list of attributes
 
         :param list data: List of dicts of attributes which will be used to
@@ -4893,11 +4941,26 @@ class Proxy(proxy.Proxy):
             :class:`~openstack.network.v2.security_group_rule.SecurityGroupRule`,
             comprised of the properties on the SecurityGroupRule
             class.
+        :param int chunk_size: Maximum number of rules to create with a single
+            request. Chunks are created concurrently. By default all rules
+            are created with one request.
+        :param bool bisect: When a chunk is rejected, isolate the offending
+            items and create all other rules.
 
         :returns: A generator of security group rule objects
         :rtype:
             :class:`~openstack.network.v2.security_group_rule.SecurityGroupRule`
-        """
+        :raises: :class:`~openstack.exceptions.BulkCreateFailure` after all
+            other rules are returned if ``bisect`` is set and some rules
+            could not be created.
+        """
+        if chunk_size:
+            return self._bulk_create(
+                _security_group_rule.SecurityGroupRule,
+                data,
+                chunk_size=chunk_size,
+                bisect=bisect,
+            )
         return self._bulk_create(_security_group_rule.SecurityGroupRule, data)
 
     def delete_security_group_rule(
@@ -30,6 +30,7 @@ from openstack.object_store.v1 import info as _info
 from openstack.object_store.v1 import obj as _obj
 from openstack import proxy
 from openstack import resource
+from openstack import scheduler
 from openstack import utils
 
 DEFAULT_OBJECT_SEGMENT_SIZE = 1073741824  # 1GB
@@ -640,8 +641,13 @@ class Proxy(proxy.Proxy):
         # Schedule the segments for upload
         for name, segment in segments.items():
             # Async call to put - schedules execution and returns a future
-            segment_future = self._connection._pool_executor.submit(
-                self.put, name, headers=headers, data=segment, raise_exc=False
+            segment_future = self._connection._submit_task(
+                scheduler.UPLOAD,
+                self.put,
+                name,
+                headers=headers,
+                data=segment,
+                raise_exc=False,
             )
             segment_futures.append(segment_future)
             # TODO(mordred) Collect etags from results to add to this manifest
@@ -669,8 +675,8 @@ class Proxy(proxy.Proxy):
             segment = segments[name]
             segment.seek(0)
             # Async call to put - schedules execution and returns a future
-            segment_future = self._connection._pool_executor.submit(
-                self.put, name, headers=headers, data=segment
+            segment_future = self._connection._submit_task(
+                scheduler.UPLOAD, self.put, name, headers=headers, data=segment
             )
             # TODO(mordred) Collect etags from results to add to this manifest
             # dict. Then sort the list of dicts by path.
@@ -1186,6 +1192,57 @@ class Proxy(proxy.Proxy):
         """
         return resource.wait_for_delete(self, res, interval, wait, callback)
 
+    def _bulk_native(
+        self, operation, resource_type, resources, ignore_missing, **attrs
+    ):
+        # Missing objects are only counted by the bulk delete response, so
+        # they can only be told apart when deleted individually
+        if (
+            operation != 'delete'
+            or not ignore_missing
+            or not resources
+            or not all(isinstance(item, _obj.Object) for item in resources)
+        ):
+            return None
+        try:
+            bulk_delete = self.get_info().get("bulk_delete")
+        except exceptions.SDKException:
+            return None
+        if bulk_delete is None:
+            return None
+
+        max_per_request = bulk_delete.get("max_deletes_per_request", 10000)
+        chunks = [
+            resources[i : i + max_per_request]
+            for i in range(0, len(resources), max_per_request)
+        ]
+        return [
+            (chunk, functools.partial(self._bulk_delete_objects, chunk))
+            for chunk in chunks
+        ]
+
+    def _bulk_delete_objects(self, objects):
+        response = self._bulk_delete(
+            [f"{obj.container}/{obj.name}" for obj in objects]
+        )
+        exceptions.raise_from_response(response)
+        # Failures are reported per object in the response body
+        errors = {}
+        for name, status in response.json().get("Errors", []):
+            errors[parse.unquote(name).lstrip('/')] = status
+        results = []
+        for obj in objects:
+            status = errors.get(f"{obj.container}/{obj.name}")
+            if status is None:
+                results.append(proxy.BulkResult(obj, obj, None))
+            else:
+                error = exceptions.SDKException(
+                    f"Failed to delete object {obj.name} in container "
+                    f"{obj.container}: {status}"
+                )
+                results.append(proxy.BulkResult(obj, None, error))
+        return results
+
     # ========== Project Cleanup ==========
     def _get_cleanup_dependencies(self):
         return {'object_store': {'before': []}}
@@ -1263,7 +1320,7 @@ class Proxy(proxy.Proxy):
 
     def _bulk_delete(self, elements):
         data = "\n".join([parse.quote(x) for x in elements])
-        self.delete(
+        return self.delete(
             "?bulk-delete",
             data=data,
             headers={
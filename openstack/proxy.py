@@ -10,7 +10,12 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import concurrent.futures
 import functools
+import inspect
+import random
+import time
 import typing as ty
 import urllib
 from urllib.parse import urlparse
@@ -21,12 +26,13 @@ try:
 
     JSONDecodeError = simplejson.scanner.JSONDecodeError
 except ImportError:
-    JSONDecodeError = ValueError  # type: ignore
+    JSONDecodeError = ValueError
 import iso8601
 import jmespath
 from keystoneauth1 import adapter
 
 from openstack import _log
+from openstack import columnar
 from openstack import exceptions
 from openstack import resource
 from openstack import utils
@@ -34,6 +40,20 @@ from openstack import warnings as os_warnings
 
 if ty.TYPE_CHECKING:
     from openstack import connection
+    from openstack import status_source
+
+
+#: Default number of operations :meth:`Proxy.bulk` runs concurrently.
+DEFAULT_BULK_CONCURRENCY = 10
+#: Default number of times :meth:`Proxy.bulk` retries a failed operation.
+DEFAULT_BULK_RETRIES = 3
+#: HTTP status codes on which :meth:`Proxy.bulk` retries an operation.
+BULK_RETRIABLE_STATUS_CODES = frozenset({409, 503})
+#: Delay in seconds before the first retry of a bulk operation. It doubles
+#: with every retry.
+BULK_RETRY_DELAY = 1.0
+#: Maximum delay in seconds between two retries of a bulk operation.
+BULK_MAX_RETRY_DELAY = 30.0
 
 
 def normalize_metric_name(name):
@@ -42,6 +62,19 @@ def normalize_metric_name(name):
     return name
 
 
+class BulkResult(
+    collections.namedtuple('BulkResult', ['item', 'result', 'error'])
+):
+    """The outcome of one operation run by :meth:`Proxy.bulk`.
+
+    :ivar ~.item: the item the operation was run on, as passed in.
+    :ivar ~.result: the value returned by the operation, usually a
+        :class:`~openstack.resource.Resource`, or ``None`` if it failed.
+    :ivar ~.error: the exception raised by the operation, or ``None`` if it
+        succeeded.
+    """
+
+
 class Proxy(adapter.Adapter):
     """Represents a service."""
 
@@ -60,6 +93,12 @@ class Proxy(adapter.Adapter):
 
     _connection: 'connection.Connection'
 
+    status_source: ty.Optional['status_source.StatusSource'] = None
+    """Source of the state of resources waited for by this proxy.
+
+    Defaults to polling the API. See :mod:`openstack.status_source`.
+    """
+
     def __init__(
         self,
         session,
@@ -182,6 +221,13 @@ class Proxy(adapter.Adapter):
             # generated as well.
             self._report_stats(None, url, method, e)
             raise
+        finally:
+            if method not in ('GET', 'HEAD'):
+                # Drop the lists of flavors, images or networks resolving
+                # names in the cloud layer if they may have changed
+                reference_cache = getattr(conn, '_reference_cache', None)
+                if reference_cache is not None:
+                    reference_cache.invalidate_for(key_prefix)
 
     @functools.lru_cache(maxsize=256)
     def _extract_name(self, url, service_type=None, project_id=None):
@@ -398,6 +444,56 @@ class Proxy(adapter.Adapter):
         except Exception:
             self.log.exception('Error writing statistics to InfluxDB')
 
+    def _report_wait_stats(self, name, polls, duration, timed_out):
+        """Report the outcome of waiting for a resource.
+
+        :param name: Name of the operation waited for, such as ``server``.
+        :param polls: Number of requests made while waiting.
+        :param duration: Number of seconds spent waiting.
+        :param timed_out: Whether the wait timed out.
+        """
+        name = normalize_metric_name(name)
+        result = 'timeout' if timed_out else 'done'
+        duration = int(duration * 1000)
+        if self._statsd_client:
+            key = '.'.join(
+                [
+                    self._statsd_prefix,
+                    normalize_metric_name(self.service_type),
+                    'wait',
+                    name,
+                ]
+            )
+            try:
+                with self._statsd_client.pipeline() as pipe:
+                    pipe.timing(f'{key}.{result}', duration)
+                    pipe.incr(f'{key}.{result}')
+                    pipe.incr(f'{key}.polls', polls)
+            except Exception:
+                self.log.exception("Exception reporting metrics")
+        if self._influxdb_client:
+            tags = dict(name=name, result=result)
+            if self._influxdb_config and (
+                'additional_metric_tags' in self._influxdb_config
+            ):
+                tags.update(self._influxdb_config['additional_metric_tags'])
+            measurement = (
+                self._influxdb_config.get('measurement', 'openstack_api')
+                if self._influxdb_config
+                else 'openstack_api'
+            )
+            data = [
+                dict(
+                    measurement=f'{measurement}.{self.service_type}.wait',
+                    tags=tags,
+                    fields=dict(polls=polls, duration=duration),
+                )
+            ]
+            try:
+                self._influxdb_client.write_points(data)
+            except Exception:
+                self.log.exception('Error writing statistics to InfluxDB')
+
     def _get_connection(self):
         """Get the Connection object associated with this Proxy.
 
@@ -633,6 +729,8 @@ class Proxy(adapter.Adapter):
         resource_type: type[resource.ResourceT],
         data: list[dict[str, ty.Any]],
         base_path: ty.Optional[str] = None,
+        chunk_size: ty.Optional[int] = None,
+        bisect: bool = False,
     ) -> ty.Generator[resource.ResourceT, None, None]:
         """Create a resource from attributes
 
@@ -647,11 +745,21 @@ class Proxy(adapter.Adapter):
         :param str base_path: Base part of the URI for creating resources, if
             different from
             :data:`~openstack.resource.Resource.base_path`.
+        :param int chunk_size: Maximum number of resources to create with a
+            single request. By default all are created at once.
+        :param bool bisect: Whether to isolate the items of a rejected chunk
+            and create all others. See
+            :meth:`~openstack.resource.Resource.bulk_create`.
 
         :returns: A generator of Resource objects.
         :rtype: :class:`~openstack.resource.Resource`
         """
-        return resource_type.bulk_create(self, data, base_path=base_path)
+        kwargs: dict[str, ty.Any] = {}
+        if chunk_size:
+            kwargs.update(chunk_size=chunk_size, bisect=bisect)
+        return resource_type.bulk_create(
+            self, data, base_path=base_path, **kwargs
+        )
 
     def _get(
         self,
@@ -697,14 +805,40 @@ class Proxy(adapter.Adapter):
             error_message=f"No {resource_type.__name__} found for {value}",
         )
 
+    @ty.overload
     def _list(
         self,
         resource_type: type[resource.ResourceT],
         paginated: bool = True,
         base_path: ty.Optional[str] = None,
         jmespath_filters: ty.Optional[str] = None,
+        columns: None = None,
         **attrs: ty.Any,
-    ) -> ty.Generator[resource.ResourceT, None, None]:
+    ) -> ty.Generator[resource.ResourceT, None, None]: ...
+
+    @ty.overload
+    def _list(
+        self,
+        resource_type: type[resource.ResourceT],
+        paginated: bool = True,
+        base_path: ty.Optional[str] = None,
+        jmespath_filters: ty.Optional[str] = None,
+        *,
+        columns: list[str],
+        **attrs: ty.Any,
+    ) -> columnar.ColumnarResult: ...
+
+    def _list(
+        self,
+        resource_type: type[resource.ResourceT],
+        paginated: bool = True,
+        base_path: ty.Optional[str] = None,
+        jmespath_filters: ty.Optional[str] = None,
+        columns: ty.Optional[list[str]] = None,
+        **attrs: ty.Any,
+    ) -> ty.Union[
+        ty.Generator[resource.ResourceT, None, None], columnar.ColumnarResult
+    ]:
         """List a resource
 
         :param resource_type: The type of resource to list. This should
@@ -719,13 +853,18 @@ class Proxy(adapter.Adapter):
             :data:`~openstack.resource.Resource.base_path`.
         :param str jmespath_filters: A string containing a jmespath expression
             for further filtering.
+        :param list columns: Names of attributes to return in a
+            :class:`~openstack.columnar.ColumnarResult` rather than
+            returning resources. The whole listing is then fetched at once.
 
         :param dict attrs: Attributes to be passed onto the
             :meth:`~openstack.resource.Resource.list` method. These should
             correspond to either :class:`~openstack.resource.URI` values
             or appear in :data:`~openstack.resource.Resource._query_mapping`.
 
-        :returns: A generator of Resource objects.
+        :returns: A generator of Resource objects, or a
+            :class:`~openstack.columnar.ColumnarResult` if ``columns`` are
+            given.
         :raises: ``ValueError`` if ``value`` is a
             :class:`~openstack.resource.Resource` that doesn't match
             the ``resource_type``.
@@ -738,6 +877,11 @@ class Proxy(adapter.Adapter):
                 attrs[k] = v
             attrs.pop('__conflicting_attrs')
 
+        if columns is not None:
+            return self._list_columns(
+                resource_type, columns, paginated, base_path, **attrs
+            )
+
         data = resource_type.list(
             self, paginated=paginated, base_path=base_path, **attrs
         )
@@ -752,6 +896,36 @@ class Proxy(adapter.Adapter):
 
         return data
 
+    def _list_columns(
+        self,
+        resource_type: type[resource.ResourceT],
+        columns: list[str],
+        paginated: bool,
+        base_path: ty.Optional[str],
+        **attrs: ty.Any,
+    ) -> columnar.ColumnarResult:
+        # Compare the classmethod objects themselves, since accessing them
+        # binds them to the class
+        list_method = inspect.getattr_static(resource_type, 'list')
+        if list_method is resource.Resource.__dict__['list']:
+            bodies = resource_type._list_bodies(
+                self, paginated=paginated, base_path=base_path, **attrs
+            )
+            return columnar.ColumnarResult.from_bodies(
+                resource_type,
+                bodies,
+                columns,
+                connection=self._get_connection(),
+            )
+        # Resources overriding list may change what is listed, so use the
+        # resources they return
+        data = resource_type.list(
+            self, paginated=paginated, base_path=base_path, **attrs
+        )
+        return columnar.ColumnarResult.from_resources(
+            resource_type, data, columns, connection=self._get_connection()
+        )
+
     def _head(
         self,
         resource_type: type[resource.ResourceT],
@@ -781,6 +955,216 @@ class Proxy(adapter.Adapter):
         res = self._get_resource(resource_type, value, **attrs)
         return res.head(self, base_path=base_path)
 
+    def bulk(
+        self,
+        operation,
+        resources,
+        resource_type=None,
+        concurrency=DEFAULT_BULK_CONCURRENCY,
+        retries=DEFAULT_BULK_RETRIES,
+        ignore_missing=True,
+        **attrs,
+    ):
+        """Run an operation on many resources concurrently.
+
+        Operations run in the connection's executor, at most ``concurrency``
+        at a time, and results are yielded as soon as each operation
+        completes, in no particular order. Requests still go through the
+        rate limiter of the service, if one is configured. Operations which
+        fail with a conflict (409) or an unavailable service (503) are
+        retried with an exponential backoff.
+
+        Services with native bulk APIs, such as bulk creation in the network
+        service or bulk deletion of objects in the object store, use them
+        automatically when possible.
+
+        .. code-block:: python
+
+            for result in conn.block_storage.bulk('delete', volumes):
+                if result.error:
+                    print(f'Failed to delete {result.item}: {result.error}')
+
+        :param operation: One of ``create``, ``update`` or ``delete``, or a
+            callable run with each item as its only argument, for instance to
+            run an action on many resources.
+        :param resources: An iterable of items to run the operation on. For
+            ``create`` these are dicts of attributes or new
+            :class:`~openstack.resource.Resource` instances. For ``update``
+            and ``delete`` these are resources or IDs.
+        :param resource_type: The :class:`~openstack.resource.Resource`
+            subclass of the resources. Required unless all items are
+            resource instances or ``operation`` is a callable.
+        :param int concurrency: Maximum number of operations run at once.
+        :param int retries: Maximum number of retries of each operation.
+        :param bool ignore_missing: When ``operation`` is ``delete``, whether
+            deleting a nonexistent resource is a success or an error.
+        :param dict attrs: For ``update``, attributes to set on every
+            resource.
+
+        :returns: A generator of :class:`BulkResult` objects, one per item.
+        :raises: ``ValueError`` if ``operation`` is not supported, or if
+            ``resource_type`` is required but not given.
+        """
+        if not callable(operation) and operation not in (
+            'create',
+            'update',
+            'delete',
+        ):
+            raise ValueError(f'Invalid bulk operation: {operation}')
+
+        resources = list(resources)
+        calls = None
+        if not callable(operation):
+            if resource_type is None and resources:
+                if not all(
+                    isinstance(item, resource.Resource) for item in resources
+                ):
+                    raise ValueError(
+                        f'resource_type is required to {operation} items '
+                        f'which are not resources'
+                    )
+                resource_type = type(resources[0])
+            calls = self._bulk_native(
+                operation, resource_type, resources, ignore_missing, **attrs
+            )
+        if calls is None:
+            calls = (
+                (
+                    [item],
+                    self._bulk_call(
+                        operation, item, resource_type, ignore_missing, attrs
+                    ),
+                )
+                for item in resources
+            )
+        return self._bulk_execute(calls, concurrency, retries)
+
+    def _bulk_call(
+        self, operation, item, resource_type, ignore_missing, attrs
+    ):
+        if callable(operation):
+            func = functools.partial(operation, item)
+        elif operation == 'create':
+            if isinstance(item, resource.Resource):
+                func = functools.partial(item.create, self)
+            else:
+                func = functools.partial(self._create, resource_type, **item)
+        elif operation == 'update':
+            func = functools.partial(
+                self._update, resource_type or type(item), item, **attrs
+            )
+        else:
+            func = functools.partial(
+                self._delete,
+                resource_type or type(item),
+                item,
+                ignore_missing=ignore_missing,
+            )
+
+        def call():
+            return [BulkResult(item, func(), None)]
+
+        return call
+
+    def _bulk_native(
+        self, operation, resource_type, resources, ignore_missing, **attrs
+    ):
+        """Prepare calls to a native bulk API of the service.
+
+        Proxies of services with bulk APIs override this to group items into
+        single requests. The arguments are those of :meth:`bulk`.
+
+        :returns: ``None`` if the operation cannot use a native bulk API,
+            otherwise an iterable of ``(items, call)`` tuples where ``call``
+            returns a list of :class:`BulkResult` for ``items``.
+        """
+        return None
+
+    def _bulk_retry(self, call, retries):
+        delay = BULK_RETRY_DELAY
+        for attempt in range(retries + 1):
+            try:
+                return call()
+            except exceptions.HttpException as e:
+                if (
+                    attempt == retries
+                    or e.status_code not in BULK_RETRIABLE_STATUS_CODES
+                ):
+                    raise
+                # Spread retries of concurrent operations over time
+                wait = delay * random.uniform(0.5, 1.0)
+                self.log.debug(
+                    'Retrying bulk operation after %s in %.1f seconds',
+                    e.status_code,
+                    wait,
+                )
+                time.sleep(wait)
+                delay = min(delay * 2, BULK_MAX_RETRY_DELAY)
+
+    def _bulk_execute(self, calls, concurrency, retries):
+        executor = self._get_connection()._pool_executor
+        calls = iter(calls)
+        pending = {}
+
+        def submit_next():
+            for items, call in calls:
+                future = executor.submit(self._bulk_retry, call, retries)
+                pending[future] = items
+                return
+
+        for _ in range(max(concurrency, 1)):
+            submit_next()
+
+        try:
+            while pending:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    items = pending.pop(future)
+                    submit_next()
+                    error = future.exception()
+                    if error is not None:
+                        for item in items:
+                            yield BulkResult(item, None, error)
+                    else:
+                        yield from future.result()
+        finally:
+            # The caller stopped consuming results
+            for future in pending:
+                future.cancel()
+
+    def wait_for_status_many(
+        self,
+        resources,
+        status,
+        failures=None,
+        interval=2,
+        wait=None,
+        attribute='status',
+    ):
+        """Wait for many resources to be in a particular status.
+
+        See :func:`openstack.resource.wait_for_status_many`.
+
+        :param resources: The resources to wait on to reach the status.
+        :param status: Desired status of the resources.
+        :param failures: Statuses that would indicate the transition
+            failed such as 'ERROR'. Defaults to ['ERROR'].
+        :param interval: Number of seconds to wait between checks, or a
+            :class:`~openstack.utils.WaitSchedule`.
+        :param wait: Maximum number of seconds to wait for all transitions.
+            Set to ``None`` to wait forever.
+        :param attribute: Name of the resource attribute that contains the
+            status.
+
+        :returns: A generator of ``(resource, error)`` tuples, yielded as
+            soon as each resource reaches the status or fails.
+        """
+        return resource.wait_for_status_many(
+            self, resources, status, failures, interval, wait, attribute
+        )
+
     def _get_cleanup_dependencies(self):
         return None
 
@@ -33,6 +33,8 @@ and then returned to the caller.
 """
 
 import collections
+import concurrent.futures
+import functools
 import inspect
 import itertools
 import operator
@@ -48,11 +50,20 @@ from keystoneauth1 import discover
 from openstack import _log
 from openstack import exceptions
 from openstack import fields
+from openstack import status_source
 from openstack import utils
 from openstack import warnings as os_warnings
 
 LOG = _log.setup_logging(__name__)
 
+# Status codes of bulk creations which are caused by some of the items, and
+# which are therefore isolated by bisecting.
+_BULK_CREATE_ITEM_ERRORS = (400, 409, 422)
+
+# Number of polls after which wait_for_status_many fetches the resources
+# which did not show up in any listing, e.g. since they were deleted.
+_UNLISTED_POLLS = 3
+
 
 # TODO(stephenfin): We should deprecate the 'type' and 'list_type' arguments
 # for all of the below in favour of annotations. To that end, we have stuck
@@ -364,6 +375,10 @@ class Resource(dict):
 
     #: The base part of the URI for this resource.
     base_path: str = ""
+    #: The base part of the URI listing resources with all their attributes,
+    #: if listing from :data:`base_path` only returns some of them, such as
+    #: ``/servers/detail``.
+    _details_base_path: ty.Optional[str] = None
 
     #: Allow create operation for this resource.
     allow_create = False
@@ -419,6 +434,15 @@ class Resource(dict):
     # Placeholder for aliases as dict of {__alias__:__original}
     _attr_aliases: dict[str, str] = {}
 
+    # Attributes by component types, set on every class by
+    # _attributes_iterator
+    _attributes_cache: ty.ClassVar[
+        dict[
+            tuple[type[fields._BaseComponent], ...],
+            tuple[tuple[str, fields._BaseComponent], ...],
+        ]
+    ]
+
     def __init__(self, _synchronized=False, connection=None, **attrs):
         """The base resource
 
@@ -493,13 +517,25 @@ class Resource(dict):
         cls, components=tuple([fields.Body, fields.Header])
     ):
         """Iterator over all Resource attributes"""
-        # isinstance stricly requires this to be a tuple
-        # Since we're looking at class definitions we need to include
-        # subclasses, so check the whole MRO.
-        for klass in cls.__mro__:
-            for attr, component in klass.__dict__.items():
-                if isinstance(component, components):
-                    yield attr, component
+        # Attributes are defined with the class, so only look them up once
+        # per class rather than for every instance.
+        cache = cls.__dict__.get('_attributes_cache')
+        if cache is None:
+            cache = {}
+            cls._attributes_cache = cache
+        try:
+            attributes = cache[components]
+        except KeyError:
+            # isinstance stricly requires this to be a tuple
+            # Since we're looking at class definitions we need to include
+            # subclasses, so check the whole MRO.
+            attributes = cache[components] = tuple(
+                (attr, component)
+                for klass in cls.__mro__
+                for attr, component in klass.__dict__.items()
+                if isinstance(component, components)
+            )
+        return iter(attributes)
 
     def __repr__(self):
         pairs = [
@@ -1440,10 +1476,19 @@ class Resource(dict):
         base_path=None,
         *,
         microversion=None,
+        chunk_size=None,
+        bisect=False,
         **params,
     ):
         """Create multiple remote resources based on this class and data.
 
+        By default all resources are created with a single request. When
+        ``chunk_size`` is given, ``data`` is split into chunks of at most that
+        many resources, which are created with one request each. Requests
+        for different chunks are sent concurrently using the executor of the
+        connection, and the created resources are still returned in the
+        order of ``data``.
+
         :param session: The session to use for making this request.
         :type session: :class:`~keystoneauth1.adapter.Adapter`
         :param data: list of dicts, which represent resources to create.
@@ -1453,11 +1498,20 @@ class Resource(dict):
         :param str base_path: Base part of the URI for creating resources, if
             different from :data:`~openstack.resource.Resource.base_path`.
         :param str microversion: API version to override the negotiated one.
+        :param int chunk_size: Maximum number of resources to create with a
+            single request.
+        :param bool bisect: When a chunk is rejected by the server, split it
+            in halves and retry each of them, repeatedly, to isolate the
+            offending items and still create all others. Only used together
+            with ``chunk_size``.
         :param dict params: Additional params to pass.
 
         :return: A generator of :class:`Resource` objects.
         :raises: :exc:`~openstack.exceptions.MethodNotSupported` if
             :data:`Resource.allow_create` is not set to ``True``.
+        :raises: :exc:`~openstack.exceptions.BulkCreateFailure` once all
+            other resources have been returned, if ``chunk_size`` is set and
+            some items could not be created.
         """
         if not cls.allow_create:
             raise exceptions.MethodNotSupported(cls, 'create')
@@ -1472,6 +1526,38 @@ class Resource(dict):
         session = cls._get_session(session)
         if microversion is None:
             microversion = cls._get_microversion(session, action='create')
+        if cls.create_method not in ('PUT', 'POST'):
+            raise exceptions.ResourceFailure(
+                f"Invalid create method: {cls.create_method}"
+            )
+
+        create = functools.partial(
+            cls._bulk_create_request,
+            session,
+            prepend_key=prepend_key,
+            base_path=base_path,
+            microversion=microversion,
+            params=params,
+        )
+        if not chunk_size:
+            return create(data)
+
+        def create_chunk(chunk):
+            if not bisect:
+                return list(create(chunk)), []
+            return cls._bulk_create_bisect(create, chunk)
+
+        executor = session._get_connection()._pool_executor
+        chunks = [
+            data[i : i + chunk_size] for i in range(0, len(data), chunk_size)
+        ]
+        futures = [executor.submit(create_chunk, chunk) for chunk in chunks]
+        return cls._bulk_create_results(chunks, futures)
+
+    @classmethod
+    def _bulk_create_request(
+        cls, session, data, *, prepend_key, base_path, microversion, params
+    ):
         requires_id = (
             cls.create_requires_id
             if cls.create_requires_id is not None
@@ -1479,12 +1565,8 @@ class Resource(dict):
         )
         if cls.create_method == 'PUT':
             method = session.put
-        elif cls.create_method == 'POST':
-            method = session.post
         else:
-            raise exceptions.ResourceFailure(
-                f"Invalid create method: {cls.create_method}"
-            )
+            method = session.post
 
         _body: list[ty.Any] = []
         resources = []
@@ -1540,6 +1622,56 @@ class Resource(dict):
                 for res_dict in data
             )
 
+    @classmethod
+    def _bulk_create_bisect(cls, create, data):
+        """Create resources, splitting ``data`` until failures are isolated.
+
+        :returns: A tuple of the list of created resources, in the order of
+            ``data``, and a list of ``(attrs, exception)`` tuples for items
+            which could not be created.
+        """
+        try:
+            return list(create(data)), []
+        except exceptions.HttpException as e:
+            # Only errors about the content of the request can be blamed on
+            # some of the items, others fail any part of it as well.
+            if e.status_code not in _BULK_CREATE_ITEM_ERRORS:
+                raise
+            if len(data) == 1:
+                return [], [(data[0], e)]
+        middle = len(data) // 2
+        first, first_failures = cls._bulk_create_bisect(create, data[:middle])
+        second, second_failures = cls._bulk_create_bisect(
+            create, data[middle:]
+        )
+        return first + second, first_failures + second_failures
+
+    @staticmethod
+    def _bulk_create_results(chunks, futures):
+        # Every chunk is waited for, even once one failed, so that all
+        # created resources are returned and can be cleaned up.
+        failures = []
+        all_created = []
+        try:
+            for chunk, future in zip(chunks, futures):
+                try:
+                    created, chunk_failures = future.result()
+                except Exception as e:
+                    created = []
+                    chunk_failures = [(attrs, e) for attrs in chunk]
+                failures.extend(chunk_failures)
+                all_created.extend(created)
+                yield from created
+        finally:
+            for future in futures:
+                future.cancel()
+        if failures:
+            raise exceptions.BulkCreateFailure(
+                f"Failed to create {len(failures)} resources",
+                failures=failures,
+                created=all_created,
+            )
+
     def fetch(
         self,
         session,
@@ -1928,6 +2060,55 @@ class Resource(dict):
         :raises: :exc:`~openstack.exceptions.InvalidResourceQuery` if query
             contains invalid params.
         """
+        return cls._list_pages(
+            session,
+            paginated,
+            base_path,
+            microversion=microversion,
+            headers=headers,
+            params=params,
+        )
+
+    @classmethod
+    def _list_bodies(
+        cls,
+        session,
+        paginated=True,
+        base_path=None,
+        *,
+        microversion=None,
+        headers=None,
+        **params,
+    ):
+        """Like :meth:`list`, but yield the bodies of the listed resources.
+
+        The bodies are dicts of the attributes returned by the server, keyed
+        by their server side names, with the URI attributes added. No
+        :class:`Resource` object is created, so this is meant for large
+        listings of which only a few attributes are used.
+        """
+        return cls._list_pages(
+            session,
+            paginated,
+            base_path,
+            microversion=microversion,
+            headers=headers,
+            params=params,
+            raw=True,
+        )
+
+    @classmethod
+    def _list_pages(
+        cls,
+        session,
+        paginated,
+        base_path,
+        *,
+        microversion,
+        headers,
+        params,
+        raw=False,
+    ):
         if not cls.allow_list:
             raise exceptions.MethodNotSupported(cls, 'list')
 
@@ -1936,6 +2117,57 @@ class Resource(dict):
         if microversion is None:
             microversion = cls._get_microversion(session, action='list')
 
+        uri, query_params, client_filters, uri_params = cls._prepare_list(
+            base_path, params
+        )
+        limit = query_params.get('limit')
+        if raw and client_filters:
+            # Bodies are keyed by the server side names of the attributes
+            body_names = {
+                attr: component.name
+                for attr, component in cls._attributes_iterator(fields.Body)
+            }
+            client_filters = {
+                body_names[k]: v for k, v in client_filters.items()
+            }
+
+        headers_final = {"Accept": "application/json"}
+        if headers:
+            headers_final = {**headers_final, **headers}
+
+        # Track the total number of resources yielded so we can paginate
+        # swift objects
+        total_yielded = 0
+        while uri:
+            # Copy query_params due to weird mock unittest interactions
+            response = session.get(
+                uri,
+                headers=headers_final,
+                params=query_params.copy(),
+                microversion=microversion,
+            )
+            uri, total_yielded = yield from cls._process_list_page(
+                session,
+                response,
+                uri,
+                query_params,
+                microversion=microversion,
+                client_filters=client_filters,
+                uri_params=uri_params,
+                limit=limit,
+                paginated=paginated,
+                total_yielded=total_yielded,
+                raw=raw,
+            )
+
+    @classmethod
+    def _prepare_list(cls, base_path, params):
+        """Split list parameters into the parts needed to send the request.
+
+        :returns: A tuple of the initial URI, the query parameters to send,
+            the filters to apply on the client side and the URI attributes to
+            set on every listed resource.
+        """
         if base_path is None:
             base_path = cls.base_path
 
@@ -1960,13 +2192,17 @@ class Resource(dict):
         uri = base_path % params
         uri_params = {}
 
-        limit = query_params.get('limit')
-
         for k, v in params.items():
             # We need to gather URI parts to set them on the resource later
             if hasattr(cls, k) and isinstance(getattr(cls, k), fields.URI):
                 uri_params[k] = v
 
+        return uri, query_params, client_filters, uri_params
+
+    @staticmethod
+    def _matches_client_filters(value, client_filters):
+        """Whether a listed resource matches all client side filters."""
+
         def _dict_filter(f, d):
             """Dict param based filtering"""
             if not d:
@@ -1979,88 +2215,103 @@ class Resource(dict):
                     return False
             return True
 
-        headers_final = {"Accept": "application/json"}
-        if headers:
-            headers_final = {**headers_final, **headers}
+        # Iterate over client filters and return only if matching
+        for key in client_filters.keys():
+            if isinstance(client_filters[key], dict):
+                if not _dict_filter(client_filters[key], value.get(key, None)):
+                    return False
+            elif value.get(key, None) != client_filters[key]:
+                return False
+        return True
 
-        # Track the total number of resources yielded so we can paginate
-        # swift objects
-        total_yielded = 0
-        while uri:
-            # Copy query_params due to weird mock unittest interactions
-            response = session.get(
-                uri,
-                headers=headers_final,
-                params=query_params.copy(),
-                microversion=microversion,
-            )
-            exceptions.raise_from_response(response)
-            data = response.json()
+    @classmethod
+    def _process_list_page(
+        cls,
+        session,
+        response,
+        uri,
+        query_params,
+        *,
+        microversion,
+        client_filters,
+        uri_params,
+        limit,
+        paginated,
+        total_yielded,
+        raw=False,
+    ):
+        """Yield the matching resources from one page of a list response.
 
-            # Discard any existing pagination keys
-            last_marker = query_params.pop('marker', None)
-            query_params.pop('limit', None)
+        ``query_params`` is updated in place with the parameters of the next
+        page, if any. With ``raw``, the bodies of the resources are yielded
+        instead of :class:`Resource` objects.
 
-            if cls.resources_key:
-                resources = data[cls.resources_key]
-            else:
-                resources = data
+        :returns: Once exhausted, a tuple of the URI of the next page or
+            ``None`` and the updated total number of resources seen so far.
+        """
+        exceptions.raise_from_response(response)
+        data = response.json()
 
-            if not isinstance(resources, list):
-                resources = [resources]
+        # Discard any existing pagination keys
+        last_marker = query_params.pop('marker', None)
+        query_params.pop('limit', None)
 
-            marker = None
-            for raw_resource in resources:
-                # Do not allow keys called "self" through. Glance chose
-                # to name a key "self", so we need to pop it out because
-                # we can't send it through cls.existing and into the
-                # Resource initializer. "self" is already the first
-                # argument and is practically a reserved word.
-                raw_resource.pop("self", None)
-                # We want that URI props are available on the resource
-                raw_resource.update(uri_params)
+        if cls.resources_key:
+            resources = data[cls.resources_key]
+        else:
+            resources = data
+
+        if not isinstance(resources, list):
+            resources = [resources]
+
+        marker = None
+        id_key = cls._alternate_id() or 'id'
+        for raw_resource in resources:
+            # Do not allow keys called "self" through. Glance chose
+            # to name a key "self", so we need to pop it out because
+            # we can't send it through cls.existing and into the
+            # Resource initializer. "self" is already the first
+            # argument and is practically a reserved word.
+            raw_resource.pop("self", None)
+            # We want that URI props are available on the resource
+            raw_resource.update(uri_params)
+
+            if raw:
+                marker = raw_resource.get('id', raw_resource.get(id_key))
+                if cls._matches_client_filters(raw_resource, client_filters):
+                    yield raw_resource
+                total_yielded += 1
+                continue
 
-                value = cls.existing(
-                    microversion=microversion,
-                    connection=session._get_connection(),
-                    **raw_resource,
-                )
-                marker = value.id
-                filters_matched = True
-                # Iterate over client filters and return only if matching
-                for key in client_filters.keys():
-                    if isinstance(client_filters[key], dict):
-                        if not _dict_filter(
-                            client_filters[key], value.get(key, None)
-                        ):
-                            filters_matched = False
-                            break
-                    elif value.get(key, None) != client_filters[key]:
-                        filters_matched = False
-                        break
+            value = cls.existing(
+                microversion=microversion,
+                connection=session._get_connection(),
+                **raw_resource,
+            )
+            marker = value.id
+            if cls._matches_client_filters(value, client_filters):
+                yield value
+            total_yielded += 1
 
-                if filters_matched:
-                    yield value
-                total_yielded += 1
+        if not (resources and paginated):
+            return None, total_yielded
 
-            if resources and paginated:
-                uri, next_params = cls._get_next_link(
-                    uri, response, data, marker, limit, total_yielded
+        uri, next_params = cls._get_next_link(
+            uri, response, data, marker, limit, total_yielded
+        )
+        try:
+            if next_params['marker'] == last_marker:
+                # If next page marker is same as what we were just
+                # asked something went terribly wrong. Some ancient
+                # services had bugs.
+                raise exceptions.SDKException(
+                    'Endless pagination loop detected, aborting'
                 )
-                try:
-                    if next_params['marker'] == last_marker:
-                        # If next page marker is same as what we were just
-                        # asked something went terribly wrong. Some ancient
-                        # services had bugs.
-                        raise exceptions.SDKException(
-                            'Endless pagination loop detected, aborting'
-                        )
-                except KeyError:
-                    # do nothing, exception handling is cheaper then "if"
-                    pass
-                query_params.update(next_params)
-            else:
-                return
+        except KeyError:
+            # do nothing, exception handling is cheaper then "if"
+            pass
+        query_params.update(next_params)
+        return uri, total_yielded
 
     @classmethod
     def _get_next_link(cls, uri, response, data, marker, limit, total_yielded):
@@ -2130,6 +2381,53 @@ class Resource(dict):
 
         return next_link, params
 
+    @classmethod
+    def _wait_for_status_queries(cls, resources, status, failures, attribute):
+        """Return list queries finding status changes of many resources.
+
+        Used by :func:`wait_for_status_many` to poll many resources with a
+        few list calls instead of fetching each of them. If the API supports
+        ``changes-since``, the resources which changed since the oldest
+        update among ``resources`` are listed. Otherwise, if the API can
+        filter on ``attribute``, resources in the desired and failure
+        statuses are listed. Resources are listed from
+        :data:`_details_base_path` if set.
+
+        Subclasses can override this method if the API has better filters.
+
+        :param resources: The resources still being waited for.
+        :param status: Desired status of the resources.
+        :param failures: Statuses indicating that the transition failed.
+        :param attribute: Name of the resource attribute with the status.
+        :returns: A list of dicts of parameters for :meth:`list`, one per
+            list call, or ``None`` if the resources should be fetched
+            individually instead.
+        """
+        if not cls.allow_list:
+            return None
+        queries: ty.Optional[list[dict[str, ty.Any]]] = None
+        mapping = cls._query_mapping._mapping
+        if 'changes_since' in mapping:
+            # Timestamps are compared on the server side, avoiding any clock
+            # skew between client and server.
+            updates = [
+                update
+                for update in (
+                    getattr(r, 'updated_at', None) for r in resources
+                )
+                if update
+            ]
+            if updates and len(updates) == len(resources):
+                queries = [{'changes_since': min(updates)}]
+        if queries is None and attribute in mapping:
+            queries = [
+                {attribute: s} for s in dict.fromkeys([status, *failures])
+            ]
+        if queries is not None and cls._details_base_path:
+            for query in queries:
+                query['base_path'] = cls._details_base_path
+        return queries
+
     @classmethod
     def _get_one_match(cls, name_or_id, results):
         """Given a list of results, return the match"""
@@ -2291,15 +2589,36 @@ def _normalize_status(status: ty.Optional[str]) -> ty.Optional[str]:
 ResourceT = ty.TypeVar('ResourceT', bound=Resource)
 
 
+def _get_status_source(session, source=None):
+    """Return the status source to use for a wait."""
+    if source is None:
+        source = getattr(session, 'status_source', None)
+        if not isinstance(source, status_source.StatusSource):
+            source = status_source.POLLING
+    return source
+
+
+def _wait_stats(session, resource, operation=None):
+    """Return a callback reporting the statistics of a wait, if any."""
+    report = getattr(session, '_report_wait_stats', None)
+    if not callable(report):
+        return None
+    name = resource.__class__.__name__.lower()
+    if operation:
+        name = f'{name}.{operation}'
+    return functools.partial(report, name)
+
+
 def wait_for_status(
     session: adapter.Adapter,
     resource: ResourceT,
     status: str,
     failures: ty.Optional[list[str]] = None,
-    interval: ty.Union[int, float, None] = 2,
+    interval: ty.Union[int, float, utils.WaitSchedule, None] = 2,
     wait: ty.Optional[int] = None,
     attribute: str = 'status',
     callback: ty.Optional[ty.Callable[[int], None]] = None,
+    source: ty.Optional[status_source.StatusSource] = None,
 ) -> ResourceT:
     """Wait for the resource to be in a particular status.
 
@@ -2309,14 +2628,19 @@ def wait_for_status(
     :param status: Desired status of the resource.
     :param failures: Statuses that would indicate the transition
         failed such as 'ERROR'. Defaults to ['ERROR'].
-    :param interval: Number of seconds to wait between checks. Set to ``None``
-        to use the default interval.
+    :param interval: Number of seconds to wait between checks, or a
+        :class:`~openstack.utils.WaitSchedule` such as
+        :class:`~openstack.utils.ExponentialBackoff`. Set to ``None`` to use
+        the default interval.
     :param wait: Maximum number of seconds to wait for transition.
         Set to ``None`` to wait forever.
     :param attribute: Name of the resource attribute that contains the status.
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param source: The :class:`~openstack.status_source.StatusSource`
+        providing the state of the resource. Defaults to the
+        ``status_source`` of ``session`` if set, else to polling the API.
 
     :return: The updated resource.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` if the transition
@@ -2337,10 +2661,14 @@ def wait_for_status(
     name = f"{resource.__class__.__name__}:{resource.id}"
     msg = f"Timeout waiting for {name} to transition to {status}"
 
+    source = _get_status_source(session, source)
     for count in utils.iterate_timeout(
-        timeout=wait, message=msg, wait=interval
+        timeout=wait,
+        message=msg,
+        wait=interval if source.polling else utils.FixedWait(0),
+        stats=_wait_stats(session, resource),
     ):
-        resource = resource.fetch(session, skip_cache=True)
+        resource = source.refresh(session, resource)
         if not resource:
             raise exceptions.ResourceFailure(
                 f"{name} went away while waiting for {status}"
@@ -2370,35 +2698,224 @@ def wait_for_status(
     raise RuntimeError('cannot reach this')
 
 
+def wait_for_status_many(
+    session: adapter.Adapter,
+    resources: ty.Iterable[ResourceT],
+    status: str,
+    failures: ty.Optional[list[str]] = None,
+    interval: ty.Union[int, float, utils.WaitSchedule, None] = 2,
+    wait: ty.Optional[int] = None,
+    attribute: str = 'status',
+) -> ty.Generator[
+    tuple[ResourceT, ty.Optional[exceptions.SDKException]], None, None
+]:
+    """Wait for many resources to be in a particular status.
+
+    Rather than fetching every resource in every interval, resources are
+    polled with as few list calls as the API allows, see
+    :meth:`Resource._wait_for_status_queries`. Resources of types which
+    cannot be polled that way are fetched concurrently using the executor of
+    the connection.
+
+    Results are yielded as soon as each resource reaches the desired status
+    or fails, so callers can act on resources while others are still in
+    progress. Resources which are deleted drop out of most listings, so the
+    resources which did not show up in the listings of a few polls are
+    fetched individually.
+
+    :param session: The session to use for making this request.
+    :param resources: The resources to wait on to reach the status.
+    :param status: Desired status of the resources.
+    :param failures: Statuses that would indicate the transition
+        failed such as 'ERROR'. Defaults to ['ERROR'].
+    :param interval: Number of seconds to wait between checks, or a
+        :class:`~openstack.utils.WaitSchedule`. Set to ``None`` to use the
+        default interval.
+    :param wait: Maximum number of seconds to wait for all transitions.
+        Set to ``None`` to wait forever.
+    :param attribute: Name of the resource attribute that contains the status.
+
+    :return: A generator of ``(resource, error)`` tuples, one per resource.
+        ``error`` is ``None`` if the resource reached the status, a
+        :class:`~openstack.exceptions.ResourceFailure` if it transitioned to
+        a failure status, to ``DELETED`` or went away, a
+        :class:`~openstack.exceptions.ResourceTimeout` if it did not reach
+        the status in ``wait`` seconds, or the exception raised while
+        fetching it.
+    """
+    if failures is None:
+        failures = ['ERROR']
+    target = _normalize_status(status)
+    failure_statuses = {f.lower() for f in failures}
+
+    pending: dict[tuple[type[ResourceT], ty.Any], ResourceT] = {}
+    for res in resources:
+        pending[(type(res), res.id)] = res
+    # Number of polls since each pending resource was last listed
+    unlisted: dict[tuple[type[ResourceT], ty.Any], int] = {}
+
+    def check(res):
+        name = f"{res.__class__.__name__}:{res.id}"
+        new_status = _normalize_status(getattr(res, attribute))
+        if new_status == target:
+            return True, None
+        if new_status in failure_statuses or new_status == 'deleted':
+            return True, exceptions.ResourceFailure(
+                f"{name} transitioned to failure state {new_status}"
+            )
+        return False, None
+
+    def resolve(key, res, error=None):
+        if error is None:
+            done, error = check(res)
+            if not done:
+                pending[key] = res
+                return
+        del pending[key]
+        yield res, error
+
+    for key, res in list(pending.items()):
+        yield from resolve(key, res)
+
+    msg = f"Timeout waiting for resources to transition to {status}"
+    try:
+        for count in utils.iterate_timeout(
+            timeout=wait, message=msg, wait=interval
+        ):
+            if not pending:
+                return
+            by_type: dict[type[ResourceT], list[ResourceT]] = {}
+            for resource_type, _ in pending:
+                by_type.setdefault(resource_type, [])
+            for key, res in pending.items():
+                by_type[key[0]].append(res)
+
+            for resource_type, group in by_type.items():
+                queries = resource_type._wait_for_status_queries(
+                    group, status, failures, attribute
+                )
+                if queries is None:
+                    updates = _fetch_many(session, group)
+                else:
+                    updates = _list_many(
+                        session, resource_type, queries, pending, attribute
+                    )
+                listed = set()
+                for key, res, error in updates:
+                    listed.add(key)
+                    if key in pending:
+                        yield from resolve(key, res, error)
+                if queries is None:
+                    continue
+
+                unlisted_group = []
+                for res in group:
+                    key = (resource_type, res.id)
+                    if key in listed or key not in pending:
+                        unlisted.pop(key, None)
+                        continue
+                    unlisted[key] = unlisted.get(key, 0) + 1
+                    if unlisted[key] >= _UNLISTED_POLLS:
+                        del unlisted[key]
+                        unlisted_group.append(pending[key])
+                if unlisted_group:
+                    for key, res, error in _fetch_many(
+                        session, unlisted_group
+                    ):
+                        if key in pending:
+                            yield from resolve(key, res, error)
+
+            LOG.debug(
+                'Still waiting for %d resources to reach state %s',
+                len(pending),
+                status,
+            )
+    except exceptions.ResourceTimeout:
+        for key, res in list(pending.items()):
+            name = f"{res.__class__.__name__}:{res.id}"
+            yield from resolve(
+                key,
+                res,
+                exceptions.ResourceTimeout(
+                    f"Timeout waiting for {name} to transition to {status}"
+                ),
+            )
+
+
+def _list_many(session, resource_type, queries, pending, attribute):
+    # Some listings lack the status, then fetch the resources which changed
+    missing = {}
+    component = getattr(resource_type, attribute, None)
+    body_key = getattr(component, 'name', attribute)
+    for params in queries:
+        for res in resource_type.list(session, **params):
+            key = (resource_type, res.id)
+            if key not in pending:
+                continue
+            if body_key not in res._body.attributes:
+                missing[key] = pending[key]
+                continue
+            yield key, res, None
+    if missing:
+        yield from _fetch_many(session, list(missing.values()))
+
+
+def _fetch_many(session, resources):
+    def fetch(res):
+        try:
+            return res.fetch(session, skip_cache=True), None
+        except exceptions.NotFoundException:
+            name = f"{res.__class__.__name__}:{res.id}"
+            return res, exceptions.ResourceFailure(
+                f"{name} went away while waiting"
+            )
+        except exceptions.SDKException as e:
+            return res, e
+
+    executor = session._get_connection()._pool_executor
+    futures = {executor.submit(fetch, res): res for res in resources}
+    for future in concurrent.futures.as_completed(futures):
+        res = futures[future]
+        new, error = future.result()
+        yield (type(res), res.id), new, error
+
+
 def wait_for_delete(
     session: adapter.Adapter,
     resource: ResourceT,
-    interval: ty.Union[int, float, None] = 2,
+    interval: ty.Union[int, float, utils.WaitSchedule, None] = 2,
     wait: ty.Optional[int] = None,
     callback: ty.Optional[ty.Callable[[int], None]] = None,
+    source: ty.Optional[status_source.StatusSource] = None,
 ) -> ResourceT:
     """Wait for a resource to be deleted.
 
     :param session: The session to use for making this request.
     :param resource: The resource to wait on to be deleted.
-    :param interval: Number of seconds to wait between checks.
+    :param interval: Number of seconds to wait between checks, or a
+        :class:`~openstack.utils.WaitSchedule`.
     :param wait: Maximum number of seconds to wait for the delete.
     :param callback: A callback function. This will be called with a single
         value, progress. This is API specific but is generally a percentage
         value from 0-100.
+    :param source: The :class:`~openstack.status_source.StatusSource`
+        providing the state of the resource. Defaults to the
+        ``status_source`` of ``session`` if set, else to polling the API.
 
     :return: The original resource.
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
         to status failed to occur in wait seconds.
     """
     orig_resource = resource
+    source = _get_status_source(session, source)
     for count in utils.iterate_timeout(
         timeout=wait,
         message=f"Timeout waiting for {resource.__class__.__name__}:{resource.id} to delete",
-        wait=interval,
+        wait=interval if source.polling else utils.FixedWait(0),
+        stats=_wait_stats(session, resource, 'delete'),
     ):
         try:
-            resource = resource.fetch(session, skip_cache=True)
+            resource = source.refresh(session, resource)
             if not resource:
                 return orig_resource
             # Some resources like VolumeAttachment don't have status field.
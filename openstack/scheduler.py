@@ -0,0 +1,269 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+The :class:`~openstack.scheduler.WorkScheduler` runs the concurrent work of a
+connection, such as object segment uploads, project cleanup and bulk
+operations. Work is submitted to a category, each with its own concurrency
+limit, queue bound and priority, so that a large upload cannot starve
+interactive calls.
+
+A scheduler is created by default for every connection. A custom one, or any
+other ``concurrent.futures`` or futurist executor, can be passed as the
+``pool_executor`` of the :class:`~openstack.connection.Connection`:
+
+.. code-block:: python
+
+    from openstack import connection
+    from openstack import scheduler
+
+    executor = scheduler.WorkScheduler(
+        max_workers=20,
+        categories={'upload': scheduler.Category(priority=30, concurrency=8)},
+    )
+    conn = connection.Connection(cloud='example', pool_executor=executor)
+"""
+
+import collections
+import concurrent.futures
+import threading
+import typing as ty
+
+__all__ = ['Category', 'WorkScheduler', 'submit']
+
+#: Default number of worker threads of a scheduler.
+DEFAULT_MAX_WORKERS = 5
+
+#: Interactive calls made on behalf of the user, such as bulk operations.
+USER = 'user'
+#: Prefetching of the next pages of listings.
+PREFETCH = 'prefetch'
+#: Project cleanup.
+CLEANUP = 'cleanup'
+#: Object segment uploads.
+UPLOAD = 'upload'
+
+
+class Category(
+    collections.namedtuple(
+        'Category',
+        ['priority', 'concurrency', 'max_queue'],
+        defaults=(None, None),
+    )
+):
+    """Scheduling settings of a category of work.
+
+    :ivar ~.priority: Work of categories with a lower priority value runs
+        first.
+    :ivar ~.concurrency: Maximum number of tasks of the category running at
+        once, or ``None`` for no limit besides the number of workers.
+    :ivar ~.max_queue: Maximum number of tasks of the category waiting to
+        run, or ``None`` for no limit. Submitting more blocks until tasks
+        start, unless submitted from a worker of the scheduler itself.
+    """
+
+
+#: Categories of every scheduler, unless overridden.
+DEFAULT_CATEGORIES = {
+    USER: Category(priority=0),
+    PREFETCH: Category(priority=10, concurrency=2, max_queue=20),
+    CLEANUP: Category(priority=20, concurrency=3),
+    UPLOAD: Category(priority=30, concurrency=3, max_queue=10),
+}
+
+
+class _WorkItem:
+    __slots__ = ('future', 'fn', 'args', 'kwargs')
+
+    def __init__(self, future, fn, args, kwargs):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+class WorkScheduler(concurrent.futures.Executor):
+    """An executor running work by category and priority.
+
+    Worker threads are started on demand, up to ``max_workers``. Whenever a
+    worker is free, it runs the oldest task of the category with the lowest
+    priority value which is below its concurrency limit.
+
+    :meth:`submit` schedules work in the ``user`` category, so that the
+    scheduler can be used wherever an executor is expected.
+
+    :param int max_workers: Maximum number of worker threads.
+    :param dict categories: :class:`Category` settings by category name,
+        overriding or extending :data:`DEFAULT_CATEGORIES`.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, categories=None):
+        if max_workers <= 0:
+            raise ValueError('max_workers must be greater than 0')
+        self.max_workers = max_workers
+        self.categories = dict(DEFAULT_CATEGORIES)
+        self.categories.update(categories or {})
+        self._order = sorted(
+            self.categories, key=lambda name: self.categories[name].priority
+        )
+        self._queues: dict[str, collections.deque[_WorkItem]] = {
+            name: collections.deque() for name in self._order
+        }
+        self._running = dict.fromkeys(self._order, 0)
+        self._condition = threading.Condition()
+        self._threads = set()
+        self._idle = 0
+        self._shutdown = False
+        self._local = threading.local()
+
+    def submit_to(self, category, fn, /, *args, **kwargs):
+        """Schedule ``fn(*args, **kwargs)`` in a category.
+
+        :param str category: Name of the category of the work.
+        :returns: A :class:`concurrent.futures.Future`.
+        :raises: ValueError if the category is unknown.
+        :raises: RuntimeError if the scheduler was shut down.
+        """
+        if category not in self._queues:
+            raise ValueError(f'Unknown work category {category}')
+        queue = self._queues[category]
+        max_queue = self.categories[category].max_queue
+        future: concurrent.futures.Future[ty.Any] = concurrent.futures.Future()
+        with self._condition:
+            # Blocking a worker of this scheduler could deadlock it
+            if max_queue is not None and not self._is_worker():
+                while len(queue) >= max_queue and not self._shutdown:
+                    self._condition.wait()
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown'
+                )
+            queue.append(_WorkItem(future, fn, args, kwargs))
+            queued = sum(len(q) for q in self._queues.values())
+            if self._idle < queued and len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._condition.notify_all()
+        return future
+
+    def submit(self, fn, /, *args, **kwargs):
+        return self.submit_to(USER, fn, *args, **kwargs)
+
+    submit.__doc__ = concurrent.futures.Executor.submit.__doc__
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for queue in self._queues.values():
+                    while queue:
+                        queue.popleft().future.cancel()
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    shutdown.__doc__ = concurrent.futures.Executor.shutdown.__doc__
+
+    def stats(self):
+        """Return the queue depth and utilization of the scheduler.
+
+        :returns: A dict with the number of ``workers`` started, the
+            ``max_workers``, the number of ``busy`` workers, the
+            ``utilization`` as the ratio of busy workers to ``max_workers``
+            and, under ``categories``, the number of ``queued`` and
+            ``running`` tasks of every category.
+        """
+        with self._condition:
+            busy = sum(self._running.values())
+            return {
+                'workers': len(self._threads),
+                'max_workers': self.max_workers,
+                'busy': busy,
+                'utilization': busy / self.max_workers,
+                'categories': {
+                    name: {
+                        'queued': len(self._queues[name]),
+                        'running': self._running[name],
+                    }
+                    for name in self._order
+                },
+            }
+
+    def _is_worker(self):
+        return getattr(self._local, 'scheduler', None) is self
+
+    def _start_worker(self):
+        thread = threading.Thread(
+            target=self._work, name='openstacksdk-worker', daemon=True
+        )
+        self._threads.add(thread)
+        thread.start()
+
+    def _next_item(self):
+        for name in self._order:
+            queue = self._queues[name]
+            limit = self.categories[name].concurrency
+            if queue and (limit is None or self._running[name] < limit):
+                self._running[name] += 1
+                return name, queue.popleft()
+        return None, None
+
+    def _work(self):
+        self._local.scheduler = self
+        with self._condition:
+            try:
+                while True:
+                    name, item = self._next_item()
+                    if item is None:
+                        if self._shutdown and not any(self._queues.values()):
+                            return
+                        self._idle += 1
+                        self._condition.wait()
+                        self._idle -= 1
+                        continue
+                    # Wake up submitters waiting for room in the queue
+                    self._condition.notify_all()
+                    self._condition.release()
+                    try:
+                        item.run()
+                    finally:
+                        self._condition.acquire()
+                        self._running[name] -= 1
+                        self._condition.notify_all()
+                    del item
+            finally:
+                self._threads.discard(threading.current_thread())
+
+
+def submit(executor, category, fn, /, *args, **kwargs):
+    """Submit work to an executor, in a category if it supports them.
+
+    :param executor: A :class:`WorkScheduler` or any other executor, which
+        then runs the work regardless of its category.
+    :param str category: Name of the category of the work.
+    :returns: A :class:`concurrent.futures.Future`.
+    """
+    if isinstance(executor, WorkScheduler):
+        return executor.submit_to(category, fn, *args, **kwargs)
+    return executor.submit(fn, *args, **kwargs)
@@ -0,0 +1,273 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Status sources provide the current state of resources to
+:func:`~openstack.resource.wait_for_status` and
+:func:`~openstack.resource.wait_for_delete`.
+
+By default, waits poll the API with :class:`PollingStatusSource`. When
+resource state changes are published on a message stream, an
+:class:`EventStatusSource` resolves waits from that stream instead, without
+any API call:
+
+.. code-block:: python
+
+    from openstack import status_source
+
+    events = status_source.zaqar_events(conn.message, 'server-events')
+    with status_source.EventStatusSource(events) as source:
+        conn.compute.status_source = source
+        server = conn.compute.create_server(**attrs)
+        conn.compute.wait_for_server(server)
+
+The source set as the ``status_source`` attribute of a proxy is used by all
+waits of that proxy. It can also be passed as the ``source`` argument of the
+wait functions.
+"""
+
+import threading
+import time
+
+from openstack import _log
+from openstack import exceptions
+
+__all__ = [
+    'EventStatusSource',
+    'PollingStatusSource',
+    'StatusSource',
+    'zaqar_events',
+]
+
+#: Default maximum number of unclaimed states kept by
+#: :class:`EventStatusSource`.
+DEFAULT_MAX_PENDING = 10000
+
+_MISSING = object()
+
+
+class StatusSource:
+    """Base class for the providers of the state of waited for resources."""
+
+    #: Whether wait functions should sleep between two calls to
+    #: :meth:`refresh`. Sources which block until a state change is known
+    #: set this to ``False``.
+    polling = True
+
+    def refresh(self, session, resource):
+        """Return the resource with its current state.
+
+        :param session: The session to use for making requests, if any.
+        :param resource: The resource being waited for.
+        :returns: The updated resource, or ``None`` if it is gone.
+        :raises: :class:`~openstack.exceptions.NotFoundException` if the
+            resource is gone.
+        """
+        raise NotImplementedError
+
+
+class PollingStatusSource(StatusSource):
+    """Fetch the resource from the API on every refresh."""
+
+    def refresh(self, session, resource):
+        return resource.fetch(session, skip_cache=True)
+
+
+#: Shared instance used when no other source is configured.
+POLLING = PollingStatusSource()
+
+
+def _parse_event(event):
+    attrs = dict(event)
+    resource_id = attrs.pop('id')
+    if attrs.pop('deleted', False):
+        return resource_id, None
+    return resource_id, attrs
+
+
+class EventStatusSource(StatusSource):
+    """Resolve waits from a stream of resource state events.
+
+    The events are consumed in a background thread, started by
+    :meth:`start` or on first use, and the latest state of every resource is
+    kept until a wait claims it. The source should be started before the
+    operations being waited for are triggered, so that no event is missed.
+
+    By default, events are mappings holding the ``id`` of the resource and
+    the changed attributes, using the names of the API, with ``deleted`` set
+    to true once the resource is gone. Other formats, such as notification
+    payloads, are supported through ``parse``.
+
+    If the stream ends or fails, waits fall back to polling the API.
+
+    :param events: An iterable of events, such as the generator returned by
+        :func:`zaqar_events` or one fed by a notification consumer.
+    :param parse: Callable turning an event into a ``(resource_id, attrs)``
+        tuple, with ``attrs`` set to ``None`` if the resource was deleted. It
+        may return ``None`` to ignore an event.
+    :param float timeout: Maximum number of seconds a refresh waits for an
+        event before the wait function checks its own timeout again.
+    :param int max_pending: Maximum number of unclaimed states to keep. The
+        oldest ones are dropped first.
+    """
+
+    polling = False
+
+    def __init__(
+        self,
+        events,
+        parse=None,
+        timeout=2,
+        max_pending=DEFAULT_MAX_PENDING,
+    ):
+        self.log = _log.setup_logging('openstack')
+        self._events = events
+        self._parse = parse or _parse_event
+        self.timeout = timeout
+        self.max_pending = max_pending
+        self._states = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        self._done = False
+
+    def start(self):
+        """Start consuming events, if not done yet."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._consume,
+                name='openstacksdk-status-events',
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop consuming events.
+
+        The background thread exits after the next event, as iterating the
+        stream cannot be interrupted.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def push(self, event):
+        """Record an event, as if it was received from the stream."""
+        parsed = self._parse(event)
+        if parsed is None:
+            return
+        resource_id, attrs = parsed
+        with self._condition:
+            # Move the resource to the end, so that the oldest states are
+            # dropped first.
+            self._states.pop(resource_id, None)
+            self._states[resource_id] = attrs
+            while len(self._states) > self.max_pending:
+                del self._states[next(iter(self._states))]
+            self._condition.notify_all()
+
+    def _consume(self):
+        try:
+            for event in self._events:
+                if self._stopped:
+                    break
+                try:
+                    self.push(event)
+                except Exception:
+                    self.log.exception('Ignoring invalid event %r', event)
+        except Exception:
+            self.log.exception(
+                'Status event stream failed, falling back to polling'
+            )
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def refresh(self, session, resource):
+        self.start()
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                attrs = self._states.pop(resource.id, _MISSING)
+                if attrs is not _MISSING or self._done or self._stopped:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return resource
+                self._condition.wait(remaining)
+
+        if attrs is _MISSING:
+            # No more events will come, poll at the usual pace instead.
+            time.sleep(max(deadline - time.monotonic(), 0))
+            return resource.fetch(session, skip_cache=True)
+        if attrs is None:
+            return None
+
+        body_attrs = resource._consume_body_attrs(dict(attrs))
+        resource._body.attributes.update(body_attrs)
+        resource._clean_body_attrs(body_attrs)
+        return resource
+
+
+def _message_id(message):
+    # Claimed messages only have a reference to themselves, such as
+    # /v2/queues/<queue>/messages/<id>?claim_id=<claim>
+    return message['href'].split('?')[0].rsplit('/', 1)[-1]
+
+
+def zaqar_events(
+    message_proxy, queue_name, ttl=60, grace=60, limit=10, interval=2
+):
+    """Consume events posted to a Zaqar queue.
+
+    Messages are claimed in batches and deleted once read. This generator
+    never ends; it is meant to be passed to :class:`EventStatusSource`.
+
+    :param message_proxy: The :class:`~openstack.message.v2._proxy.Proxy`
+        to use, usually ``conn.message``.
+    :param str queue_name: Name of the queue events are posted to.
+    :param int ttl: Lifetime of each claim, in seconds.
+    :param int grace: Grace period of each claim, in seconds.
+    :param int limit: Maximum number of messages to claim at once.
+    :param float interval: Number of seconds to wait before claiming again
+        when the queue is empty.
+    :returns: A generator of message bodies.
+    """
+    while True:
+        claim = message_proxy.create_claim(
+            queue_name, ttl=ttl, grace=grace, limit=limit
+        )
+        messages = claim.messages or []
+        for message in messages:
+            try:
+                message_proxy.delete_message(
+                    queue_name, _message_id(message), claim=claim
+                )
+            except exceptions.SDKException:
+                message_proxy.log.warning(
+                    'Failed to delete message %s from queue %s',
+                    message.get('href'),
+                    queue_name,
+                )
+            yield message.get('body')
+        if not messages:
+            time.sleep(interval)
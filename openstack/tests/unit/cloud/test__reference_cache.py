@@ -0,0 +1,120 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+from openstack.cloud import _reference_cache
+from openstack.tests.unit import base
+
+
+class TestReferenceCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.submitted = []
+        self.sot = _reference_cache.ReferenceCache(
+            {'flavors': 60, 'images': -1},
+            submit=lambda fn, *args: self.submitted.append((fn, args)),
+        )
+        self.loader = mock.Mock(side_effect=[['old'], ['new']])
+
+    def _expire(self, kind, key=None):
+        self.sot._entries[(kind, key)].expires = 0
+
+    def _run_submitted(self):
+        for fn, args in self.submitted:
+            fn(*args)
+        self.submitted = []
+
+    def test_disabled(self):
+        self.assertFalse(self.sot.enabled('networks'))
+        self.assertEqual(['old'], self.sot.get('networks', None, self.loader))
+        self.assertEqual(['new'], self.sot.get('networks', None, self.loader))
+
+    def test_cached(self):
+        self.assertEqual(['old'], self.sot.get('flavors', None, self.loader))
+        self.assertEqual(['old'], self.sot.get('flavors', None, self.loader))
+        self.loader.assert_called_once_with()
+
+    def test_key(self):
+        self.sot.get('flavors', True, self.loader)
+        self.assertEqual(['new'], self.sot.get('flavors', False, self.loader))
+
+    def test_never_expires(self):
+        self.sot.get('images', None, self.loader)
+        self.assertEqual(
+            float('inf'), self.sot._entries[('images', None)].expires
+        )
+
+    def test_refresh_in_background(self):
+        self.sot.get('flavors', None, self.loader)
+        self._expire('flavors')
+
+        # The stale data is returned until refreshed, only once
+        self.assertEqual(['old'], self.sot.get('flavors', None, self.loader))
+        self.assertEqual(['old'], self.sot.get('flavors', None, self.loader))
+        self.assertEqual(1, len(self.submitted))
+        self._run_submitted()
+
+        self.assertEqual(['new'], self.sot.get('flavors', None, self.loader))
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_refresh_without_executor(self):
+        self.sot._submit = None
+        self.sot.get('flavors', None, self.loader)
+        self._expire('flavors')
+
+        self.assertEqual(['new'], self.sot.get('flavors', None, self.loader))
+
+    def test_refresh_failure(self):
+        self.loader.side_effect = [['old'], Exception('boom')]
+        self.sot.get('flavors', None, self.loader)
+        self._expire('flavors')
+        self.sot.get('flavors', None, self.loader)
+
+        self._run_submitted()
+
+        entry = self.sot._entries[('flavors', None)]
+        self.assertFalse(entry.refreshing)
+        self.assertGreater(entry.expires, 0)
+        self.assertEqual(['old'], self.sot.get('flavors', None, self.loader))
+        self.assertEqual([], self.submitted)
+
+    def test_invalidate(self):
+        self.sot.get('flavors', None, self.loader)
+        self.sot.get('images', None, lambda: ['image'])
+
+        self.sot.invalidate('flavors')
+
+        self.assertEqual(['new'], self.sot.get('flavors', None, self.loader))
+        self.assertIn(('images', None), self.sot._entries)
+
+    def test_invalidate_during_refresh(self):
+        self.loader.side_effect = [['old'], ['stale'], ['new']]
+        self.sot.get('flavors', None, self.loader)
+        self._expire('flavors')
+        self.sot.get('flavors', None, self.loader)
+
+        self.sot.invalidate()
+        self._run_submitted()
+
+        self.assertEqual(['new'], self.sot.get('flavors', None, self.loader))
+
+    def test_invalidate_for(self):
+        self.sot.get('flavors', None, self.loader)
+        self.sot.get('images', None, lambda: ['image'])
+
+        self.sot.invalidate_for('image.images')
+        self.assertNotIn(('images', None), self.sot._entries)
+        self.sot.invalidate_for('compute.servers')
+        self.assertIn(('flavors', None), self.sot._entries)
+        self.sot.invalidate_for('compute.flavor.os-extra_specs')
+        self.assertNotIn(('flavors', None), self.sot._entries)
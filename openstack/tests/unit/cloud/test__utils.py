@@ -164,6 +164,99 @@ class TestUtils(base.TestCase):
         )
         self.assertEqual([el2, el3], ret)
 
+    def test__filter_list_indexed(self):
+        data = [
+            dict(id=100, name='donald', status='ACTIVE', tags=['a']),
+            dict(id=200, name='pluto', status='ERROR', tags=[]),
+            dict(id=300, name='pluto[2]', status='ACTIVE', tags=['b']),
+            dict(id=400, name='200', status='ACTIVE', tags=[]),
+            dict(id=500, name='pluto', status='ACTIVE', tags=['a']),
+        ]
+        indexed = _utils.IndexedList(data, index_keys=['status', 'tags'])
+        for name_or_id, filters in [
+            (None, None),
+            ('donald', None),
+            ('200', None),
+            (300, None),
+            ('pluto*', None),
+            ('pluto[2]', None),
+            ('missing', None),
+            ('pluto', {'status': 'ACTIVE'}),
+            (None, {'status': 'ACTIVE', 'id': 300}),
+            (None, {'status': 'DELETED'}),
+            (None, {'tags': ['a']}),
+            ('pluto*', {'status': 'ACTIVE'}),
+        ]:
+            self.assertEqual(
+                _utils._filter_list(data, name_or_id, filters),
+                _utils._filter_list(indexed, name_or_id, filters),
+            )
+
+    def test__filter_list_indexed_candidates(self):
+        indexed = _utils.IndexedList(
+            [
+                dict(id=100, name='donald', status='ACTIVE'),
+                dict(id=200, name='pluto', status='ERROR'),
+                dict(id=300, name='pluto', status='ACTIVE'),
+            ],
+            index_keys=['status'],
+        )
+        self.assertEqual([1, 2], indexed._candidates('pluto', None))
+        self.assertEqual(
+            [0, 2], indexed._candidates(None, {'status': 'ACTIVE'})
+        )
+        self.assertEqual(
+            [2], indexed._candidates('pluto', {'status': 'ACTIVE', 'id': 300})
+        )
+        self.assertIsNone(indexed._candidates('pluto*', None))
+        self.assertIsNone(indexed._candidates(None, {'id': 300}))
+
+    def test__filter_list_indexed_missing_key(self):
+        indexed = _utils.IndexedList(
+            [dict(id=100, name='donald', status='ACTIVE'), dict(id=200)],
+            index_keys=['status'],
+        )
+        self.assertRaises(
+            AttributeError,
+            _utils._filter_list,
+            indexed,
+            None,
+            {'status': 'ERROR'},
+        )
+
+    def test__filter_list_indexed_modified(self):
+        el1 = dict(id=100, name='donald')
+        el2 = dict(id=200, name='pluto')
+        indexed = _utils.IndexedList([el1])
+        self.assertEqual([], _utils._filter_list(indexed, 'pluto', None))
+        indexed.append(el2)
+        self.assertEqual([el2], _utils._filter_list(indexed, 'pluto', None))
+        indexed.insert(0, el2)
+        self.assertEqual(
+            [el2, el2], _utils._filter_list(indexed, 'pluto', None)
+        )
+        indexed.remove(el1)
+        self.assertEqual([], _utils._filter_list(indexed, 'donald', None))
+
+    def test__filter_list_indexed_copy(self):
+        el1 = dict(id=100, name='donald', status='ACTIVE')
+        el2 = dict(id=200, name='pluto', status='ERROR')
+        indexed = _utils.IndexedList([el1, el2], index_keys=['status'])
+        self.assertEqual([el2], _utils._filter_list(indexed, 'pluto', None))
+
+        copy = indexed.copy()
+        self.assertIsInstance(copy, _utils.IndexedList)
+        self.assertEqual({'status'}, copy.index_keys)
+        self.assertEqual([el2], _utils._filter_list(copy, 'pluto', None))
+        copy.remove(el1)
+        self.assertEqual(
+            [el2], _utils._filter_list(copy, None, {'status': 'ERROR'})
+        )
+        self.assertEqual([el1, el2], indexed)
+        self.assertEqual(
+            [el2], _utils._filter_list(indexed, None, {'status': 'ERROR'})
+        )
+
     def test_safe_dict_min_ints(self):
         """Test integer comparison"""
         data = [{'f1': 3}, {'f1': 2}, {'f1': 1}]
@@ -316,6 +409,48 @@ class TestUtils(base.TestCase):
         ):
             _utils.range_filter(RANGE_DATA, "key1", "<>100")
 
+    def test_range_query(self):
+        data = RANGE_DATA + [dict(id=7, key1=None), dict(id=8, key2=1)]
+        indexed = _utils.IndexedList(data)
+        for filters, ids in (
+            ({"key1": "min", "key2": "20"}, [2]),
+            ({"key1": "<=2", "key2": ">10"}, [2, 4]),
+            ({"key1": ">=2", "key2": "<40"}, [3, 4]),
+            ({"key1": "max"}, [5, 6]),
+            ({"key1": "max", "key2": "min"}, []),
+            ({"key1": "min", "key2": "min"}, []),
+            ({"key1": "7", "key2": "min"}, []),
+            ({"key2": "min"}, [8]),
+            ({"key3": "max"}, []),
+        ):
+            query = _utils.compile_range_query(filters)
+            self.assertEqual(
+                ids, [d['id'] for d in query.search(data)], filters
+            )
+            self.assertEqual(
+                ids, [d['id'] for d in query.search(indexed)], filters
+            )
+        self.assertEqual(
+            ([1, 1, 2, 2, 3, 3], [0, 1, 2, 3, 4, 5]),
+            indexed._range_indexes['key1'],
+        )
+
+    def test_range_query_cached(self):
+        query = _utils.compile_range_query({"key1": "<3"})
+
+        self.assertIs(query, _utils.compile_range_query({"key1": "<3"}))
+        self.assertEqual([('key1', '<', 3)], query.ranges)
+
+    def test_range_query_not_int(self):
+        data = RANGE_DATA + [dict(id=7, key1='foo')]
+        for search_data in (data, _utils.IndexedList(data)):
+            for range_exp in ("min", "<3"):
+                with testtools.ExpectedException(
+                    exceptions.SDKException,
+                    ".*Value for key1 is not an integer: foo",
+                ):
+                    _utils.range_filter(search_data, "key1", range_exp)
+
     def test_get_entity_pass_object(self):
         obj = mock.Mock(id=uuid4().hex)
         self.cloud.use_direct_get = True
@@ -331,7 +466,7 @@ class TestUtils(base.TestCase):
         # if the use_direct_get flag is set to False(default).
         uuid = uuid4().hex
         resource = 'network'
-        func = f'search_{resource}s'
+        func = f'iter_search_{resource}s'
         filters = {}
         with mock.patch.object(self.cloud, func) as search:
             _utils._get_entity(self.cloud, resource, uuid, filters)
@@ -343,7 +478,7 @@ class TestUtils(base.TestCase):
         self.cloud.use_direct_get = True
         name = 'name_no_uuid'
         resource = 'network'
-        func = f'search_{resource}s'
+        func = f'iter_search_{resource}s'
         filters = {}
         with mock.patch.object(self.cloud, func) as search:
             _utils._get_entity(self.cloud, resource, name, filters)
@@ -383,11 +518,83 @@ class TestUtils(base.TestCase):
         filters = {}
         name = 'name_no_uuid'
         for r in resources:
-            f = f'search_{r}s'
+            f = f'iter_search_{r}s'
+            if not hasattr(self.cloud, f):
+                f = f'search_{r}s'
             with mock.patch.object(self.cloud, f) as search:
                 _utils._get_entity(self.cloud, r, name, {})
                 search.assert_called_once_with(name, filters)
 
+    def test_get_entity_stops_at_match(self):
+        uuid = uuid4().hex
+        seen = []
+
+        def search(name_or_id, filters):
+            entities = [
+                dict(id='other', name='other'),
+                dict(id=uuid, name='match'),
+                dict(id='never', name=uuid),
+            ]
+            for entity in _utils._iter_filter(entities, name_or_id, filters):
+                seen.append(entity['id'])
+                yield entity
+
+        self.assertEqual(
+            dict(id=uuid, name='match'),
+            _utils._get_entity(self.cloud, search, uuid, {}),
+        )
+        # The entity named after the ID is never reached
+        self.assertEqual([uuid], seen)
+
+    def test_get_entity_multiple_matches(self):
+        seen = []
+
+        def search(name_or_id, filters):
+            for i in range(5):
+                seen.append(i)
+                yield dict(id=str(i), name='dup')
+
+        self.assertRaises(
+            exceptions.SDKException,
+            _utils._get_entity,
+            self.cloud,
+            search,
+            'dup',
+            {},
+        )
+        # Every result is checked for an entity with the ID
+        self.assertEqual([0, 1, 2, 3, 4], seen)
+
+    def test_get_entity_prefers_id(self):
+        uuid = uuid4().hex
+
+        def search(name_or_id, filters):
+            entities = [
+                dict(id='other', name=uuid),
+                dict(id=uuid, name='match'),
+            ]
+            yield from _utils._iter_filter(entities, name_or_id, filters)
+
+        self.assertEqual(
+            dict(id=uuid, name='match'),
+            _utils._get_entity(self.cloud, search, uuid, {}),
+        )
+
+    def test_iter_filter_lazy(self):
+        data = iter(
+            [
+                dict(id='1', name='a'),
+                dict(id='2', name='b'),
+                dict(id='3', name='c'),
+            ]
+        )
+
+        filtered = _utils._iter_filter(data, 'b', {})
+
+        self.assertEqual(dict(id='2', name='b'), next(filtered))
+        # The rest of the data has not been consumed
+        self.assertEqual(dict(id='3', name='c'), next(data))
+
     def test_get_entity_get_and_search(self):
         resources = [
             'flavor',
@@ -97,6 +97,72 @@ class TestCloud(base.TestCase):
             self.assertEqual(c2.list_servers(), [])
         self.assert_calls()
 
+    def test_clone_as(self):
+        # The clone authenticates for the new project but reuses the
+        # discovery done by the parent connection
+        project_name = 'test_project'
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['servers', 'detail']
+                    ),
+                    json={'servers': []},
+                ),
+                self.get_keystone_v3_token(project_name=project_name),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['servers', 'detail']
+                    ),
+                    json={'servers': []},
+                ),
+            ]
+        )
+
+        self.assertEqual(self.cloud.list_servers(), [])
+        c2 = self.cloud.clone_as(project_name=project_name)
+        self.assertEqual(c2.list_servers(), [])
+        self.assert_calls()
+
+        self.assertEqual(
+            project_name, c2.config.config['auth']['project_name']
+        )
+        self.assertNotIn('project_id', c2.config.config['auth'])
+        self.assertEqual(
+            'admin', self.cloud.config.config['auth']['project_name']
+        )
+        self.assertIsNot(self.cloud.session.auth, c2.session.auth)
+        self.assertIs(self.cloud.session.session, c2.session.session)
+        self.assertIs(
+            self.cloud.session._discovery_cache, c2.session._discovery_cache
+        )
+        self.assertIs(self.cloud._pool_executor, c2._pool_executor)
+
+    def test_clone_as_close(self):
+        executor = self.cloud._pool_executor
+        c2 = self.cloud.connect_as_project('test_project', clone=True)
+        c2.close()
+        # The shared executor is still usable
+        self.assertEqual(1, executor.submit(lambda: 1).result())
+
+    def test_clone_as_token_refresh(self):
+        self.cloud.config.config['token_refresh_window'] = 60
+        self.addCleanup(self.cloud.stop_token_refresh)
+
+        with self.cloud.clone_as(project_name='test_project') as c2:
+            # Clones do not renew tokens unless asked to
+            self.assertIsNone(c2._token_refresher)
+
+        with self.cloud.clone_as(
+            token_refresh_window=60, project_name='test_project'
+        ) as c3:
+            refresher = c3._token_refresher
+            self.assertIsNotNone(refresher)
+        self.assertIsNone(c3._token_refresher)
+
     def test_global_request_id(self):
         request_id = uuid.uuid4().hex
         self.register_uris(
@@ -118,6 +118,91 @@ class TestServers(base.TestCase):
 
         self.assert_calls()
 
+    def test_list_servers_floating_ips(self):
+        servers = [
+            fakes.make_fake_server(
+                f'server-{i}',
+                f'name-{i}',
+                addresses={
+                    'private': [
+                        {
+                            'OS-EXT-IPS-MAC:mac_addr': f'fa:16:3e:00:00:0{i}',
+                            'version': 4,
+                            'addr': f'10.0.0.{i}',
+                            'OS-EXT-IPS:type': 'fixed',
+                        }
+                    ]
+                },
+            )
+            for i in (1, 2)
+        ]
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['servers', 'detail']
+                    ),
+                    json={'servers': servers},
+                ),
+                # Ports and floating IPs are listed once for all servers
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network',
+                        'public',
+                        append=['v2.0', 'ports'],
+                        qs_elements=[
+                            'device_id=server-1',
+                            'device_id=server-2',
+                        ],
+                    ),
+                    complete_qs=True,
+                    json={
+                        'ports': [
+                            {
+                                'id': f'port-{i}',
+                                'device_id': f'server-{i}',
+                                'mac_address': f'fa:16:3e:00:00:0{i}',
+                            }
+                            for i in (1, 2)
+                        ]
+                    },
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'floatingips']
+                    ),
+                    complete_qs=True,
+                    json={
+                        'floatingips': [
+                            {
+                                'id': 'fip-2',
+                                'port_id': 'port-2',
+                                'fixed_ip_address': '10.0.0.2',
+                                'floating_ip_address': '172.24.5.2',
+                            }
+                        ]
+                    },
+                ),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'networks']
+                    ),
+                    json={"networks": []},
+                ),
+            ]
+        )
+
+        r = self.cloud.list_servers()
+
+        self.assertEqual('', r[0]['public_v4'])
+        self.assertEqual('172.24.5.2', r[1]['public_v4'])
+        self.assert_calls()
+
     def test_list_server_private_ip(self):
         self.has_neutron = True
         server_id = "97fe35e9-756a-41a2-960a-1d057d2c9ee4"
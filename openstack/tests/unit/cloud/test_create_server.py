@@ -18,12 +18,17 @@ Tests for the `create_server` command.
 """
 
 import base64
+import threading
+import time
 from unittest import mock
 import uuid
 
+import fixtures
+
 from openstack.compute.v2 import server
 from openstack import connection
 from openstack import exceptions
+from openstack import scheduler
 from openstack.tests import fakes
 from openstack.tests.unit import base
 
@@ -1698,3 +1703,189 @@ class TestCreateServer(base.TestCase):
         )
 
         self.assert_calls()
+
+
+class TestCreateServers(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.useFixture(
+            fixtures.MockPatchObject(
+                connection.Connection,
+                '_get_server_create_kwargs',
+                side_effect=lambda **kwargs: kwargs,
+            )
+        )
+        self.create = self.useFixture(
+            fixtures.MockPatchObject(
+                self.cloud.compute, 'create_server', side_effect=self._create
+            )
+        ).mock
+
+    @staticmethod
+    def _create(name, **kwargs):
+        if name == 'broken':
+            raise exceptions.BadRequestException('invalid')
+        return server.Server(id=f'{name}-id', name=name, admin_password='pw')
+
+    def test_create_servers(self):
+        self.use_cinder()
+        specs = [
+            dict(name='broken', flavor='f', image='i'),
+            dict(name='failed', flavor='f', image='i'),
+            dict(name='ok', flavor='f', image='i', attach_volumes=['vol']),
+        ]
+
+        polled = set()
+
+        def wait_for_status_many(servers, status, **kwargs):
+            self.assertEqual('ACTIVE', status)
+            for s in servers:
+                polled.add(s.id)
+                if s.id == 'failed-id':
+                    yield (
+                        server.Server(id='failed-id', status='ERROR'),
+                        exceptions.ResourceFailure('failed'),
+                    )
+                else:
+                    yield server.Server(id=s.id, status='ACTIVE'), None
+
+        def get_active_server(server, **kwargs):
+            if server.status == 'ERROR':
+                raise exceptions.SDKException('fault')
+            return server
+
+        with (
+            mock.patch.object(
+                self.cloud.compute,
+                'wait_for_status_many',
+                side_effect=wait_for_status_many,
+            ),
+            mock.patch.object(
+                self.cloud, 'get_active_server', side_effect=get_active_server
+            ) as mock_active,
+            mock.patch.object(
+                self.cloud, '_expand_server', side_effect=lambda s, **kw: s
+            ),
+            mock.patch.object(
+                self.cloud.block_storage,
+                'find_volume',
+                return_value={'id': 'vol-id'},
+            ) as mock_find,
+            mock.patch.object(self.cloud, 'attach_volume') as mock_attach,
+            mock.patch.object(
+                self.cloud, '_submit_task', wraps=self.cloud._submit_task
+            ) as mock_submit,
+        ):
+            results = {
+                r.item['name']: r for r in self.cloud.create_servers(specs)
+            }
+
+        self.assertEqual(3, self.create.call_count)
+        self.assertEqual({'failed-id', 'ok-id'}, polled)
+        self.create.assert_any_call(name='ok', flavor='f', image='i')
+        self.assertIsNone(results['broken'].result)
+        self.assertIsInstance(
+            results['broken'].error, exceptions.BadRequestException
+        )
+        self.assertEqual('fault', results['failed'].error.message)
+        self.assertEqual('failed-id', results['failed'].result.id)
+        self.assertIsNone(results['ok'].error)
+        self.assertEqual('ok-id', results['ok'].result.id)
+        self.assertEqual('pw', results['ok'].result.admin_password)
+        mock_active.assert_called_with(
+            server=results['ok'].result,
+            auto_ip=True,
+            ips=None,
+            ip_pool=None,
+            reuse=True,
+            wait=True,
+            timeout=mock.ANY,
+            nat_destination=None,
+        )
+        mock_find.assert_called_once_with('vol', ignore_missing=False)
+        mock_attach.assert_called_once_with(
+            results['ok'].result, {'id': 'vol-id'}, wait=True, timeout=mock.ANY
+        )
+        # Three creations and one post-boot task, all as user work
+        self.assertEqual(4, mock_submit.call_count)
+        for call in mock_submit.call_args_list:
+            self.assertEqual(scheduler.USER, call.args[0])
+
+    def test_create_servers_pipeline(self):
+        specs = [
+            dict(name='fast', flavor='f', image='i'),
+            dict(name='slow', flavor='f', image='i'),
+        ]
+        fast_polled = threading.Event()
+        polls = []
+
+        def create(name, **kwargs):
+            if name == 'slow':
+                # Only created once the other server was polled
+                self.assertTrue(fast_polled.wait(timeout=5))
+            return self._create(name, **kwargs)
+
+        def wait_for_status_many(servers, status, **kwargs):
+            polls.append(sorted(s.id for s in servers))
+            for s in servers:
+                if s.id == 'fast-id':
+                    fast_polled.set()
+                yield server.Server(id=s.id, status='ACTIVE'), None
+
+        self.create.side_effect = create
+        with (
+            mock.patch.object(
+                self.cloud.compute,
+                'wait_for_status_many',
+                side_effect=wait_for_status_many,
+            ),
+            mock.patch.object(
+                self.cloud,
+                'get_active_server',
+                side_effect=lambda server, **kw: server,
+            ),
+            mock.patch.object(
+                self.cloud, '_expand_server', side_effect=lambda s, **kw: s
+            ),
+        ):
+            results = list(self.cloud.create_servers(specs))
+
+        self.assertEqual([None, None], [r.error for r in results])
+        self.assertEqual([['fast-id'], ['slow-id']], polls)
+
+    def test_create_servers_no_wait(self):
+        specs = [dict(name=f's{i}', flavor='f', image='i') for i in range(5)]
+
+        with mock.patch.object(
+            self.cloud.compute, 'wait_for_status_many'
+        ) as mock_wait:
+            results = list(self.cloud.create_servers(specs, wait=False))
+
+        self.assertEqual(
+            {f's{i}-id' for i in range(5)}, {r.result.id for r in results}
+        )
+        self.assertTrue(all(r.error is None for r in results))
+        mock_wait.assert_not_called()
+
+    def test_create_servers_concurrency(self):
+        specs = [dict(name=f's{i}', flavor='f', image='i') for i in range(6)]
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def create(name, **kwargs):
+            with lock:
+                running.append(name)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(name)
+            return self._create(name, **kwargs)
+
+        self.create.side_effect = create
+        results = list(
+            self.cloud.create_servers(specs, wait=False, create_concurrency=2)
+        )
+
+        self.assertEqual(6, len(results))
+        self.assertLessEqual(max(peak), 2)
@@ -10,6 +10,8 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from openstack.cloud import _reference_cache
+from openstack.cloud import _utils
 from openstack import exceptions
 from openstack.tests import fakes
 from openstack.tests.unit import base
@@ -150,6 +152,32 @@ class TestFlavors(base.TestCase):
             self.assertTrue(needed_keys.issubset(flavor.keys()))
         self.assert_calls()
 
+    def test_list_flavors_indexed(self):
+        self.use_compute_discovery()
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=f'{fakes.COMPUTE_ENDPOINT}/flavors/detail?is_public=None',
+                    json={'flavors': fakes.FAKE_FLAVOR_LIST},
+                ),
+            ]
+        )
+
+        flavors = self.cloud.list_flavors(get_extra=False)
+
+        # Flavors are indexed by the keys usually searched on
+        self.assertEqual({'is_public', 'ram', 'vcpus'}, flavors.index_keys)
+        self.assertEqual(
+            ['chocolate'],
+            [
+                f['name']
+                for f in _utils._filter_list(flavors, None, {'ram': 200})
+            ],
+        )
+        self.assertIn('ram', flavors._key_indexes)
+        self.assert_calls()
+
     def test_list_flavors_with_extra(self):
         self.use_compute_discovery()
         uris_to_mock = [
@@ -188,6 +216,69 @@ class TestFlavors(base.TestCase):
             self.assertTrue(needed_keys.issubset(flavor.keys()))
         self.assert_calls()
 
+    def test_get_flavor_reference_cache(self):
+        self.use_compute_discovery()
+        self.cloud._reference_cache = _reference_cache.ReferenceCache(
+            {'flavors': 60}
+        )
+        list_flavors = dict(
+            method='GET',
+            uri=f'{fakes.COMPUTE_ENDPOINT}/flavors/detail?is_public=None',
+            json={'flavors': fakes.FAKE_FLAVOR_LIST},
+        )
+        self.register_uris(
+            [
+                dict(list_flavors),
+                dict(
+                    method='POST',
+                    uri=f'{fakes.COMPUTE_ENDPOINT}/flavors',
+                    json={'flavor': fakes.FAKE_FLAVOR},
+                ),
+                dict(list_flavors),
+            ]
+        )
+
+        flavor = self.cloud.get_flavor('vanilla', get_extra=False)
+        self.assertEqual(fakes.FLAVOR_ID, flavor.id)
+        self.assertEqual(
+            'vanilla', self.cloud.get_flavor_name(fakes.FLAVOR_ID)
+        )
+        self.cloud.create_flavor('vanilla', ram=65536, disk=1600, vcpus=24)
+        flavor = self.cloud.get_flavor('vanilla', get_extra=False)
+        self.assertEqual(fakes.FLAVOR_ID, flavor.id)
+
+        self.assert_calls()
+
+    def test_list_flavors_reference_cache_copy(self):
+        self.use_compute_discovery()
+        self.cloud._reference_cache = _reference_cache.ReferenceCache(
+            {'flavors': 60}
+        )
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=f'{fakes.COMPUTE_ENDPOINT}/flavors/detail?is_public=None',
+                    json={'flavors': fakes.FAKE_FLAVOR_LIST},
+                ),
+            ]
+        )
+
+        flavors = self.cloud.list_flavors()
+        self.assertEqual(
+            'chocolate',
+            self.cloud.get_flavor('chocolate', get_extra=False)['name'],
+        )
+        flavors.clear()
+
+        # The cached flavors are left untouched, with their indexes
+        self.assertEqual(3, len(self.cloud.list_flavors()))
+        self.assertEqual(
+            'chocolate',
+            self.cloud.get_flavor('chocolate', get_extra=False)['name'],
+        )
+        self.assert_calls()
+
     def test_get_flavor_by_ram(self):
         self.use_compute_discovery()
         uris_to_mock = [
@@ -10,12 +10,24 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import io
+import json
+import os
+import threading
 from unittest import mock
 
+import fixtures
+import yaml
+
+from openstack.cloud.cmd import inventory as inventory_cmd
 from openstack.cloud import inventory
+from openstack.cloud import meta
+from openstack.compute.v2 import server as _server
 import openstack.config
+from openstack import exceptions
 from openstack.tests import fakes
 from openstack.tests.unit import base
+from openstack import utils
 
 
 class TestInventory(base.TestCase):
@@ -145,3 +157,256 @@ class TestInventory(base.TestCase):
 
         ret = inv.get_host('server_id')
         self.assertEqual(server, ret)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_concurrent(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = []
+        inv = inventory.OpenStackInventory()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def list_servers(server):
+            def _list(**kwargs):
+                # Both regions have to be listed at the same time
+                barrier.wait()
+                return [server]
+
+            return _list
+
+        inv.clouds = [mock.Mock(), mock.Mock()]
+        inv.clouds[0].list_servers.side_effect = list_servers('one')
+        inv.clouds[1].list_servers.side_effect = list_servers('two')
+
+        ret = inv.list_hosts()
+
+        self.assertEqual({'one', 'two'}, set(ret))
+        self.assertEqual(set(inv.clouds), {t.cloud for t in inv.cloud_timings})
+        for timing in inv.cloud_timings:
+            self.assertEqual(1, timing.count)
+            self.assertIsNone(timing.error)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_partial(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = []
+        inv = inventory.OpenStackInventory()
+        inv.clouds = [mock.Mock(), mock.Mock()]
+        error = exceptions.SDKException('region down')
+        inv.clouds[0].list_servers.side_effect = error
+        inv.clouds[1].list_servers.return_value = ['two']
+
+        ret = inv.list_hosts(fail_on_cloud_config=False)
+
+        self.assertEqual(['two'], ret)
+        timings = {t.cloud: t for t in inv.cloud_timings}
+        self.assertIs(error, timings[inv.clouds[0]].error)
+        self.assertIsNone(timings[inv.clouds[0]].count)
+        self.assertEqual(1, timings[inv.clouds[1]].count)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_fail(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = []
+        inv = inventory.OpenStackInventory()
+        inv.clouds = [mock.Mock()]
+        inv.clouds[0].list_servers.side_effect = exceptions.SDKException
+
+        self.assertRaises(exceptions.SDKException, inv.list_hosts)
+
+    @mock.patch("openstack.config.loader.OpenStackConfig")
+    @mock.patch("openstack.connection.Connection")
+    def test_list_hosts_timeout(self, mock_cloud, mock_config):
+        mock_config.return_value.get_all.return_value = []
+        inv = inventory.OpenStackInventory()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        inv.clouds = [mock.Mock(), mock.Mock()]
+        inv.clouds[0].list_servers.side_effect = lambda **kw: release.wait()
+        inv.clouds[1].list_servers.return_value = ['two']
+
+        ret = inv.list_hosts(fail_on_cloud_config=False, timeout=0.1)
+
+        self.assertEqual(['two'], ret)
+        timings = {t.cloud: t for t in inv.cloud_timings}
+        self.assertIsInstance(
+            timings[inv.clouds[0]].error, exceptions.ResourceTimeout
+        )
+
+        self.assertRaises(
+            exceptions.ResourceTimeout, inv.list_hosts, timeout=0.1
+        )
+
+
+class TestRefreshHosts(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        with mock.patch('openstack.config.loader.OpenStackConfig') as config:
+            config.return_value.get_all.return_value = []
+            self.inv = inventory.OpenStackInventory()
+        self.cloud = mock.Mock()
+        self.cloud.name = 'cloud'
+        self.cloud.config.region_name = 'region'
+        self.inv.clouds = [self.cloud]
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'snapshot.json.gz'
+        )
+        self.useFixture(
+            fixtures.MockPatchObject(
+                meta,
+                'get_hostvars_from_servers',
+                side_effect=lambda cloud, servers: [
+                    dict(id=s.id, name=s.name, status=s.status)
+                    for s in servers
+                ],
+            )
+        )
+
+    def _server(self, id, updated, status='ACTIVE'):
+        return _server.Server(
+            id=id, name=f'name-{id}', status=status, updated=updated
+        )
+
+    def test_refresh(self):
+        self.cloud.compute.servers.return_value = [
+            self._server('1', '2024-01-01T00:00:00Z'),
+            self._server('2', '2024-01-02T00:00:00Z'),
+        ]
+
+        hosts = self.inv.refresh_hosts(self.path)
+
+        self.assertEqual({'1', '2'}, {h['id'] for h in hosts})
+        self.cloud.compute.servers.assert_called_once_with(all_projects=False)
+
+        self.cloud.compute.servers.reset_mock()
+        self.cloud.compute.servers.return_value = [
+            self._server('2', '2024-01-03T00:00:00Z', status='DELETED'),
+            self._server('3', '2024-01-03T00:00:00Z'),
+        ]
+
+        hosts = self.inv.refresh_hosts(self.path)
+
+        self.assertEqual({'1', '3'}, {h['id'] for h in hosts})
+        self.cloud.compute.servers.assert_called_once_with(
+            all_projects=False, changes_since='2024-01-02T00:00:00Z'
+        )
+        # Only the changed server was expanded again
+        meta.get_hostvars_from_servers.assert_called_with(
+            self.cloud, [mock.ANY]
+        )
+        snapshot = inventory.InventorySnapshot.load(self.path)
+        region = snapshot.regions['cloud:region']
+        self.assertEqual('2024-01-03T00:00:00Z', region['since'])
+        self.assertEqual({'1', '3'}, set(region['hosts']))
+
+    def test_refresh_max_age(self):
+        self.cloud.compute.servers.return_value = [
+            self._server('1', '2024-01-01T00:00:00Z'),
+        ]
+        self.inv.refresh_hosts(self.path)
+
+        self.inv.refresh_hosts(self.path, max_age=0)
+
+        self.cloud.compute.servers.assert_called_with(all_projects=False)
+
+    def test_refresh_changed_options(self):
+        self.cloud.compute.servers.return_value = [
+            self._server('1', '2024-01-01T00:00:00Z'),
+        ]
+        self.inv.refresh_hosts(self.path)
+
+        self.inv.refresh_hosts(self.path, all_projects=True)
+
+        self.cloud.compute.servers.assert_called_with(all_projects=True)
+
+    def test_load_invalid(self):
+        with open(self.path, 'w') as f:
+            f.write('garbage')
+
+        self.assertEqual(
+            {}, inventory.InventorySnapshot.load(self.path).regions
+        )
+
+
+class TestInventoryOutput(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.hosts = [
+            utils.Munch(
+                id=f'id-{i}',
+                name=name,
+                metadata={'group': 'web'},
+                flavor={'name': 'small'},
+                image={},
+                location={'cloud': 'cloud', 'region_name': 'region'},
+            )
+            for i, name in enumerate(['one', 'two', 'one'])
+        ]
+        self.cloud = mock.Mock()
+        self.cloud.name = 'cloud'
+        self.cloud.config.get_region_name.return_value = 'region'
+        self.inv = mock.Mock(clouds=[self.cloud])
+
+    def _write_hosts(self, hosts, **kwargs):
+        stream = io.StringIO()
+        inventory_cmd.write_hosts(iter(hosts), stream, **kwargs)
+        return stream.getvalue()
+
+    def _write_ansible(self, hosts, **kwargs):
+        stream = io.StringIO()
+        inventory_cmd.write_ansible_inventory(
+            self.inv, iter(hosts), stream, **kwargs
+        )
+        return stream.getvalue()
+
+    def test_write_hosts_json(self):
+        for hosts in ([], self.hosts[:1], self.hosts):
+            self.assertEqual(
+                inventory_cmd.output_format_dict(hosts, False) + '\n',
+                self._write_hosts(hosts),
+            )
+
+    def test_write_hosts_compact(self):
+        for hosts in ([], self.hosts):
+            output = self._write_hosts(hosts, compact=True)
+            self.assertEqual(hosts, json.loads(output))
+            self.assertNotIn(' ', output)
+
+    def test_write_hosts_yaml(self):
+        for hosts in ([], self.hosts):
+            output = self._write_hosts(hosts, use_yaml=True)
+            self.assertEqual(hosts, yaml.safe_load(output))
+
+    def _assert_ansible(self, data):
+        hostvars = data.pop('_meta')['hostvars']
+        self.assertEqual({'one', 'two', 'id-2'}, set(hostvars))
+        self.assertEqual('id-2', hostvars['id-2']['id'])
+        self.assertEqual(
+            {'hosts': ['one', 'two', 'id-2']}, data['cloud_region']
+        )
+        self.assertEqual({'hosts': ['one', 'two', 'id-2']}, data['web'])
+        self.assertEqual({'hosts': ['two']}, data['instance-id-1'])
+        self.assertIn('flavor-small', data)
+
+    def test_write_ansible_json(self):
+        self._assert_ansible(json.loads(self._write_ansible(self.hosts)))
+
+    def test_write_ansible_compact(self):
+        self._assert_ansible(
+            json.loads(self._write_ansible(self.hosts, compact=True))
+        )
+
+    def test_write_ansible_yaml(self):
+        self._assert_ansible(
+            yaml.safe_load(self._write_ansible(self.hosts, use_yaml=True))
+        )
+
+    def test_write_ansible_empty(self):
+        for kwargs in ({}, {'compact': True}):
+            self.assertEqual(
+                {'_meta': {'hostvars': {}}},
+                json.loads(self._write_ansible([], **kwargs)),
+            )
+        self.assertEqual(
+            {'_meta': {'hostvars': {}}},
+            yaml.safe_load(self._write_ansible([], use_yaml=True)),
+        )
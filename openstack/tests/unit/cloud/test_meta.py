@@ -1418,3 +1418,313 @@ class TestMeta(base.TestCase):
         self.assertIn('foo', obj_dict)
         self.assertEqual(obj_dict['additional'], 1)
         self.assertEqual(obj_dict['foo'], 'bar')
+
+    def test_obj_to_munch_resource(self):
+        server = _server.Server(
+            **fakes.make_fake_server(
+                'test-id',
+                'test-name',
+                'ACTIVE',
+                flavor={'id': '101', 'original_name': 'm1.small'},
+                addresses={'private': [{'addr': PRIVATE_V4, 'version': 4}]},
+            )
+        )
+        server['public_v4'] = PUBLIC_V4
+
+        munch = meta.obj_to_munch(server)
+
+        # The same as introspecting the resource, except that nested
+        # resources are converted too
+        expected = meta._object_to_munch(server)
+        self.assertEqual(set(expected), set(munch))
+        for key, value in expected.items():
+            if not isinstance(value, dict):
+                self.assertEqual(value, munch[key], key)
+        self.assertEqual(PUBLIC_V4, munch.public_v4)
+        self.assertEqual('m1.small', munch.flavor.original_name)
+        self.assertEqual('/servers', munch['base_path'])
+
+
+class FakeListingCloud(FakeCloud):
+    """A cloud answering both per-server lookups and full listings."""
+
+    log = mock.Mock()
+
+    def __init__(self):
+        self.calls = []
+        self.group = {
+            'id': 'sg-1',
+            'name': 'web',
+            'description': None,
+            'project_id': 'project',
+            'security_group_rules': [
+                {
+                    'id': 'rule-1',
+                    'direction': 'ingress',
+                    'protocol': 'tcp',
+                    'port_range_min': 22,
+                    'port_range_max': 22,
+                    'remote_ip_prefix': '192.0.2.0/24',
+                    'remote_group_id': None,
+                    'security_group_id': 'sg-1',
+                    'project_id': 'project',
+                },
+                {
+                    'id': 'rule-2',
+                    'direction': 'ingress',
+                    'protocol': None,
+                    'port_range_min': None,
+                    'port_range_max': None,
+                    'remote_ip_prefix': None,
+                    'remote_group_id': 'sg-1',
+                    'security_group_id': 'sg-1',
+                    'project_id': 'project',
+                },
+                {
+                    'id': 'rule-3',
+                    'direction': 'egress',
+                    'protocol': None,
+                    'port_range_min': None,
+                    'port_range_max': None,
+                    'remote_ip_prefix': None,
+                    'remote_group_id': None,
+                    'security_group_id': 'sg-1',
+                    'project_id': 'project',
+                },
+            ],
+        }
+        self.ports = [
+            {
+                'id': 'port-1',
+                'device_id': 'server-1',
+                'mac_address': 'fa:16:3e:00:00:01',
+                'security_group_ids': ['sg-1'],
+            },
+            {
+                'id': 'port-2',
+                'device_id': 'server-2',
+                'mac_address': 'fa:16:3e:00:00:02',
+                'security_group_ids': [],
+            },
+        ]
+        self.fips = [
+            {
+                'id': 'fip-1',
+                'port_id': 'port-1',
+                'fixed_ip_address': '10.0.0.1',
+                'floating_ip_address': PUBLIC_V4,
+            }
+        ]
+        self.volumes = [
+            {
+                'id': 'volume-1',
+                'display_name': 'data',
+                'attachments': [{'server_id': 'server-2', 'device': '/dev/b'}],
+            }
+        ]
+
+    def _has_floating_ips(self):
+        return True
+
+    def _has_secgroups(self):
+        return True
+
+    def _use_neutron_secgroups(self):
+        return True
+
+    def get_flavor_name(self, id):
+        self.calls.append('get_flavor_name')
+        return 'test-flavor-name'
+
+    def get_image_name(self, id, exclude=None):
+        self.calls.append('get_image_name')
+        return 'test-image-name'
+
+    def get_volumes(self, server):
+        self.calls.append('get_volumes')
+        return [
+            v
+            for v in self.volumes
+            for a in v['attachments']
+            if a['server_id'] == server['id']
+        ]
+
+    def search_ports(self, name_or_id=None, filters=None):
+        self.calls.append('search_ports')
+        return [
+            p for p in self.ports if p['device_id'] == filters['device_id']
+        ]
+
+    def search_floating_ips(self, id=None, filters=None):
+        self.calls.append('search_floating_ips')
+        return [f for f in self.fips if f['port_id'] == filters['port_id']]
+
+    def list_server_security_groups(self, server):
+        self.calls.append('list_server_security_groups')
+        if server['id'] != 'server-1':
+            return []
+        # The format of nova
+        return [
+            {
+                'id': 'sg-1',
+                'name': 'web',
+                'description': '',
+                'tenant_id': 'project',
+                'rules': [
+                    {
+                        'id': 'rule-1',
+                        'parent_group_id': 'sg-1',
+                        'ip_protocol': 'tcp',
+                        'from_port': 22,
+                        'to_port': 22,
+                        'group': {},
+                        'ip_range': {'cidr': '192.0.2.0/24'},
+                    },
+                    {
+                        'id': 'rule-2',
+                        'parent_group_id': 'sg-1',
+                        'ip_protocol': None,
+                        'from_port': None,
+                        'to_port': None,
+                        'group': {'name': 'web', 'tenant_id': 'project'},
+                        'ip_range': {},
+                    },
+                ],
+            }
+        ]
+
+    def list_flavors(self):
+        self.calls.append('list_flavors')
+        return [{'id': '101', 'name': 'test-flavor-name'}]
+
+    def list_images(self):
+        self.calls.append('list_images')
+        return [{'id': 'image-1', 'name': 'test-image-name'}]
+
+    def list_ports(self, filters=None):
+        self.calls.append('list_ports')
+        if filters:
+            return [
+                p for p in self.ports if p['device_id'] in filters['device_id']
+            ]
+        return self.ports
+
+    def list_floating_ips(self):
+        self.calls.append('list_floating_ips')
+        return self.fips
+
+    def list_volumes(self):
+        self.calls.append('list_volumes')
+        return self.volumes
+
+    def list_security_groups(self):
+        self.calls.append('list_security_groups')
+        return [self.group]
+
+
+class TestHostvarsFromServers(base.TestCase):
+    def _servers(self):
+        return [
+            meta.obj_to_munch(
+                fakes.make_fake_server(
+                    server_id=f'server-{i}',
+                    name=f'server-{i}',
+                    status='ACTIVE',
+                    addresses={
+                        'private': [
+                            {
+                                'OS-EXT-IPS:type': 'fixed',
+                                'OS-EXT-IPS-MAC:mac_addr': (
+                                    f'fa:16:3e:00:00:0{i}'
+                                ),
+                                'addr': f'10.0.0.{i}',
+                                'version': 4,
+                            }
+                        ]
+                    },
+                    flavor={'id': '101'},
+                    image={'id': 'image-1'},
+                )
+            )
+            for i in (1, 2)
+        ]
+
+    def test_matches_per_server(self):
+        cloud = FakeListingCloud()
+        expected = [
+            meta.get_hostvars_from_server(cloud, server)
+            for server in self._servers()
+        ]
+        cloud.calls = []
+
+        hostvars = meta.get_hostvars_from_servers(cloud, self._servers())
+
+        self.assertEqual(expected, hostvars)
+        self.assertEqual(PUBLIC_V4, hostvars[0]['public_v4'])
+        self.assertEqual('web', hostvars[0]['security_groups'][0]['name'])
+        self.assertEqual('/dev/b', hostvars[1]['volumes'][0]['device'])
+        # Every listing is made once, and nothing per server
+        self.assertEqual(
+            sorted(
+                [
+                    'list_flavors',
+                    'list_images',
+                    'list_ports',
+                    'list_floating_ips',
+                    'list_volumes',
+                    'list_security_groups',
+                ]
+            ),
+            sorted(cloud.calls),
+        )
+
+    def test_ports_of_listed_servers(self):
+        cloud = FakeListingCloud()
+        cloud.list_ports = mock.Mock(wraps=cloud.list_ports)
+        servers = self._servers()
+
+        with mock.patch.object(meta, '_PORTS_FILTER_SIZE', 1):
+            meta.get_hostvars_from_servers(cloud, servers)
+
+        cloud.list_ports.assert_has_calls(
+            [
+                mock.call(filters={'device_id': ['server-1']}),
+                mock.call(filters={'device_id': ['server-2']}),
+            ]
+        )
+
+    def test_all_ports_of_many_servers(self):
+        cloud = FakeListingCloud()
+        cloud.list_ports = mock.Mock(wraps=cloud.list_ports)
+
+        with mock.patch.object(meta, '_PORTS_FILTER_MAX', 1):
+            meta.get_hostvars_from_servers(cloud, self._servers())
+
+        cloud.list_ports.assert_called_once_with()
+
+    def test_add_servers_interfaces(self):
+        cloud = FakeListingCloud()
+        expected = [
+            meta.add_server_interfaces(cloud, server)
+            for server in self._servers()
+        ]
+        cloud.calls = []
+        servers = self._servers()
+        servers.append(dict(servers[1], id='server-3', status='BUILD'))
+
+        result = meta.add_servers_interfaces(cloud, servers)
+
+        self.assertEqual(expected, result[:2])
+        self.assertEqual(PUBLIC_V4, result[0]['public_v4'])
+        self.assertEqual('', result[1]['public_v4'])
+        self.assertEqual(['list_ports', 'list_floating_ips'], cloud.calls)
+
+    def test_unknown_flavor_falls_back(self):
+        cloud = FakeListingCloud()
+        servers = self._servers()
+        servers[0]['flavor'] = {'id': 'private-flavor'}
+
+        hostvars = meta.get_hostvars_from_servers(cloud, servers)
+
+        self.assertEqual('test-flavor-name', hostvars[0]['flavor']['name'])
+        self.assertEqual(1, cloud.calls.count('get_flavor_name'))
@@ -15,6 +15,7 @@ from unittest import mock
 
 import testtools
 
+from openstack.cloud import _reference_cache
 from openstack import exceptions
 from openstack.network.v2 import network as _network
 from openstack.tests.unit import base
@@ -682,3 +683,112 @@ class TestNetworks(base.TestCase):
         )
         self.assertTrue(self.cloud.get_network_by_id(network_id))
         self.assert_calls()
+
+
+class TestInterestingNetworks(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cloud._reference_cache = _reference_cache.ReferenceCache(
+            {'networks': 60}
+        )
+        self.submitted = []
+        self.cloud._submit_task = lambda category, fn: self.submitted.append(
+            fn
+        )
+        self.public = {
+            'id': 'public-id',
+            'name': 'public',
+            'router:external': True,
+            'revision_number': 1,
+        }
+        self.private = {
+            'id': 'private-id',
+            'name': 'private',
+            'router:external': False,
+            'revision_number': 1,
+        }
+
+    def _list_networks(self, *networks):
+        return dict(
+            method='GET',
+            uri=self.get_mock_url(
+                'network', 'public', append=['v2.0', 'networks']
+            ),
+            json={'networks': list(networks)},
+        )
+
+    def _list_subnets(self):
+        return dict(
+            method='GET',
+            uri=self.get_mock_url(
+                'network', 'public', append=['v2.0', 'subnets']
+            ),
+            json={'subnets': []},
+        )
+
+    def _expire(self):
+        self.cloud._network_list_stamp -= 120
+
+    def _names(self, networks):
+        return [network['name'] for network in networks]
+
+    def test_refresh_stale(self):
+        private = dict(self.private, revision_number=2)
+        self.register_uris(
+            [
+                self._list_networks(self.public),
+                self._list_subnets(),
+                self._list_networks(self.public, private),
+                self._list_subnets(),
+            ]
+        )
+        self.assertEqual(
+            ['public'],
+            self._names(self.cloud.get_external_ipv4_networks()),
+        )
+        self._expire()
+
+        # The previous classification is used until refreshed
+        self.assertEqual([], self.cloud.get_internal_ipv4_networks())
+        self.assertEqual([], self.cloud.get_internal_ipv4_networks())
+        self.assertEqual(1, len(self.submitted))
+        self.submitted.pop()()
+
+        self.assertEqual(
+            ['private'],
+            self._names(self.cloud.get_internal_ipv4_networks()),
+        )
+        self.assert_calls()
+
+    def test_refresh_unchanged(self):
+        self.register_uris(
+            [
+                self._list_networks(self.public),
+                self._list_subnets(),
+                # Subnets are not listed again
+                self._list_networks(self.public),
+            ]
+        )
+        self.cloud.get_external_ipv4_networks()
+        self._expire()
+        self.cloud.get_external_ipv4_networks()
+        self.submitted.pop()()
+
+        self.assertEqual(
+            ['public'],
+            self._names(self.cloud.get_external_ipv4_networks()),
+        )
+        self.assertEqual([], self.submitted)
+        self.assert_calls()
+
+    def test_no_refresh_without_ttl(self):
+        self.cloud._reference_cache = _reference_cache.ReferenceCache()
+        self.register_uris(
+            [self._list_networks(self.public), self._list_subnets()]
+        )
+        self.cloud.get_external_ipv4_networks()
+        self._expire()
+        self.cloud.get_external_ipv4_networks()
+
+        self.assertEqual([], self.submitted)
+        self.assert_calls()
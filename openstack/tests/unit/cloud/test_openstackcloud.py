@@ -12,6 +12,8 @@
 
 from unittest import mock
 
+from openstack.cloud import openstackcloud
+from openstack import connection
 from openstack import exceptions
 from openstack import proxy
 from openstack import resource
@@ -113,3 +115,61 @@ class TestSearch(base.TestCase):
         self.assertEqual(
             self.FakeResource(foo="bar").to_dict(), ret[0].to_dict()
         )
+
+
+class TestAfterFork(base.TestCase):
+    def test_after_fork(self):
+        executor = self.cloud._pool_executor
+        self.cloud._proxies['fake'] = mock.Mock()
+        networks_lock = self.cloud._networks_lock
+        session = self.cloud.session
+        auth_ref = session.auth.auth_ref
+        auth_lock = session.auth._lock
+        discovery_cache = session._discovery_cache
+        adapter = session.session.adapters['https://']
+        pool_manager = adapter.poolmanager
+
+        self.cloud._after_fork()
+
+        self.assertIsNot(executor, self.cloud._pool_executor)
+        self.assertEqual({}, self.cloud._proxies)
+        self.assertIsNot(networks_lock, self.cloud._networks_lock)
+        self.assertIsNot(auth_lock, session.auth._lock)
+        self.assertIsNot(pool_manager, adapter.poolmanager)
+        # Warm state is kept
+        self.assertIs(session, self.cloud.session)
+        self.assertIs(auth_ref, session.auth.auth_ref)
+        self.assertIs(discovery_cache, session._discovery_cache)
+        executor.shutdown()
+
+    def test_after_fork_keeps_given_executor(self):
+        executor = mock.Mock()
+        conn = connection.Connection(
+            config=self.cloud.config, pool_executor=executor
+        )
+        self.addCleanup(conn.close)
+
+        conn._after_fork()
+
+        self.assertIs(executor, conn._pool_executor)
+
+    def test_after_fork_restarts_token_refresh(self):
+        self.cloud.start_token_refresh()
+        refresher = self.cloud._token_refresher
+        self.addCleanup(self.cloud.stop_token_refresh)
+        thread = refresher._thread
+        stopped = refresher._stopped
+
+        with mock.patch('os.getpid', return_value=-1):
+            self.cloud._after_fork()
+
+        self.assertIsNot(thread, refresher._thread)
+        self.assertTrue(refresher.running)
+        # Stop the thread which would not have survived a real fork
+        stopped.set()
+        thread.join()
+
+    def test_registered_for_fork(self):
+        with mock.patch.object(self.cloud, '_after_fork') as after_fork:
+            openstackcloud._after_fork_in_child()
+        after_fork.assert_called_once_with()
@@ -424,6 +424,39 @@ class TestPort(base.TestCase):
         self.assertEqual(0, len(ports))
         self.assert_calls()
 
+    def test_iter_search_ports_stops_early(self):
+        port_id = 'f71a6703-d6de-4be1-a91a-a570ede1d159'
+        first_page = dict(
+            self.mock_neutron_port_list_rep,
+            ports_links=[
+                {
+                    'rel': 'next',
+                    'href': self.get_mock_url(
+                        'network',
+                        'public',
+                        append=['v2.0', 'ports'],
+                        qs_elements=['marker=last'],
+                    ),
+                }
+            ],
+        )
+        # Only the first page is requested
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'network', 'public', append=['v2.0', 'ports']
+                    ),
+                    json=first_page,
+                )
+            ]
+        )
+        ports = self.cloud.iter_search_ports(name_or_id=port_id)
+
+        self.assertEqual('fa:16:3e:bb:3c:e4', next(ports)['mac_address'])
+        self.assert_calls()
+
     def test_delete_port(self):
         port_id = 'd80b1a3b-4fc1-49f3-952e-1e2ab7081d8b'
         self.register_uris(
@@ -0,0 +1,168 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import json
+import os
+from unittest import mock
+
+import fixtures
+from keystoneauth1 import access
+from keystoneauth1 import fixture as ks_fixture
+
+from openstack.config import auth_cache
+from openstack.config import cloud_region
+from openstack import exceptions
+from openstack.tests.unit.config import base
+
+
+def _make_state(expires_in):
+    expires = datetime.datetime.now(datetime.timezone.utc) + (
+        datetime.timedelta(seconds=expires_in)
+    )
+    token = ks_fixture.V3Token(expires=expires)
+    return json.dumps({'auth_token': 'token', 'body': token})
+
+
+class TestFileAuthCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = self.useFixture(fixtures.TempDir()).path
+        self.cache = auth_cache.FileAuthCache(self.path)
+
+    def test_roundtrip(self):
+        self.assertIsNone(self.cache.get('cache-id'))
+        self.cache.set('cache-id', 'state')
+        self.assertEqual('state', self.cache.get('cache-id'))
+
+    def test_state_is_encrypted(self):
+        self.cache.set('cache-id', 'secret-state')
+        for name in os.listdir(self.path):
+            with open(os.path.join(self.path, name), 'rb') as f:
+                self.assertNotIn(b'secret-state', f.read())
+
+    def test_key_shared_between_instances(self):
+        self.cache.set('cache-id', 'state')
+        other = auth_cache.FileAuthCache(self.path)
+        self.assertEqual('state', other.get('cache-id'))
+
+    def test_wrong_key_is_a_miss(self):
+        self.cache.set('cache-id', 'state')
+        other = auth_cache.FileAuthCache(self.path, key=b'A' * 43 + b'=')
+        self.assertIsNone(other.get('cache-id'))
+
+    def test_lock(self):
+        with self.cache.lock('cache-id'):
+            self.cache.set('cache-id', 'state')
+        self.assertEqual('state', self.cache.get('cache-id'))
+
+    def test_get_auth_cache(self):
+        self.assertIsInstance(
+            auth_cache.get_auth_cache(), auth_cache.KeyringAuthCache
+        )
+        file_cache = auth_cache.get_auth_cache(
+            'file', path=self.path, refresh_window='60'
+        )
+        self.assertIsInstance(file_cache, auth_cache.FileAuthCache)
+        self.assertEqual(60, file_cache.refresh_window)
+        self.assertIs(file_cache, auth_cache.get_auth_cache(file_cache))
+        self.assertRaises(
+            exceptions.ConfigException, auth_cache.get_auth_cache, 'foo'
+        )
+
+
+class TestCloudRegionFileAuthCache(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = self.useFixture(fixtures.TempDir()).path
+        self.cache = auth_cache.FileAuthCache(self.path, refresh_window=300)
+        self.auth = mock.Mock()
+        self.auth.get_cache_id.return_value = 'cache-id'
+        self.auth.auth_ref = None
+
+        def set_auth_state(state):
+            if not state:
+                self.auth.auth_ref = None
+                return
+            data = json.loads(state)
+            self.auth.auth_ref = access.create(
+                body=data['body'], auth_token=data['auth_token']
+            )
+
+        self.auth.set_auth_state.side_effect = set_auth_state
+
+    def _make_region(self):
+        return cloud_region.CloudRegion(
+            'test',
+            'region',
+            {},
+            auth_plugin=self.auth,
+            cache_auth=True,
+            auth_cache=self.cache,
+        )
+
+    def test_load_fresh_token(self):
+        state = _make_state(3600)
+        self.cache.set('cache-id', state)
+        self._make_region()
+        self.auth.set_auth_state.assert_called_once_with(state)
+        self.assertIsNotNone(self.auth.auth_ref)
+
+    def test_load_expiring_token(self):
+        self.cache.set('cache-id', _make_state(60))
+        self._make_region()
+        self.assertIsNone(self.auth.auth_ref)
+
+    def test_authenticate_reuses_token_from_other_process(self):
+        region = self._make_region()
+        self.assertIsNone(self.auth.auth_ref)
+        state = _make_state(3600)
+        self.cache.set('cache-id', state)
+
+        region.authenticate_with_cache(mock.Mock())
+
+        self.auth.set_auth_state.assert_called_with(state)
+        self.auth.get_auth_ref.assert_not_called()
+
+    def test_authenticate_stores_new_token(self):
+        region = self._make_region()
+        state = _make_state(3600)
+        self.auth.get_auth_state.return_value = state
+        session = mock.Mock()
+
+        region.authenticate_with_cache(session)
+
+        self.auth.get_auth_ref.assert_called_once_with(session)
+        self.assertEqual(
+            self.auth.get_auth_ref.return_value, self.auth.auth_ref
+        )
+        self.assertEqual(state, self.cache.get('cache-id'))
+
+    def test_renew_keeps_token_until_new_one_is_fetched(self):
+        state = _make_state(3600)
+        self.cache.set('cache-id', state)
+        region = self._make_region()
+        current = self.auth.auth_ref
+        new_state = _make_state(7200)
+        self.auth.get_auth_state.return_value = new_state
+
+        def get_auth_ref(session):
+            # The old token must remain in place while authenticating
+            self.assertIs(current, self.auth.auth_ref)
+            return access.create(body=json.loads(new_state)['body'])
+
+        self.auth.get_auth_ref.side_effect = get_auth_ref
+
+        region.renew_auth(mock.Mock())
+
+        self.assertIsNot(current, self.auth.auth_ref)
+        self.assertEqual(new_state, self.cache.get('cache-id'))
@@ -572,7 +572,7 @@ class TestConfig(base.TestCase):
             region_name='region1',
         )
 
-    @mock.patch('openstack.config.cloud_region.keyring')
+    @mock.patch('openstack.config.auth_cache.keyring')
     @mock.patch(
         'keystoneauth1.identity.base.BaseIdentityPlugin.set_auth_state'
     )
@@ -590,7 +590,7 @@ class TestConfig(base.TestCase):
         )
         ks_mock.assert_not_called()
 
-    @mock.patch('openstack.config.cloud_region.keyring')
+    @mock.patch('openstack.config.auth_cache.keyring')
     @mock.patch(
         'keystoneauth1.identity.base.BaseIdentityPlugin.set_auth_state'
     )
@@ -609,7 +609,7 @@ class TestConfig(base.TestCase):
         )
         ks_mock.assert_called_with(fake_auth)
 
-    @mock.patch('openstack.config.cloud_region.keyring')
+    @mock.patch('openstack.config.auth_cache.keyring')
     def test_set_auth_cache_empty_auth(self, kr_mock):
         c = config.OpenStackConfig(
             config_files=[self.cloud_yaml], secure_files=[]
@@ -624,7 +624,7 @@ class TestConfig(base.TestCase):
         region.set_auth_cache()
         kr_mock.set_password.assert_not_called()
 
-    @mock.patch('openstack.config.cloud_region.keyring')
+    @mock.patch('openstack.config.auth_cache.keyring')
     def test_set_auth_cache(self, kr_mock):
         c = config.OpenStackConfig(
             config_files=[self.cloud_yaml], secure_files=[]
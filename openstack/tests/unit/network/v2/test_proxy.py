@@ -927,6 +927,27 @@ class TestNetworkPool(TestNetworkProxy):
 
         bc.assert_called_once_with(port.Port, data)
 
+    @mock.patch('openstack.network.v2._proxy.Proxy._bulk_create')
+    def test_ports_create_chunked(self, bc):
+        data = mock.sentinel
+
+        self.proxy.create_ports(data, chunk_size=10, bisect=True)
+
+        bc.assert_called_once_with(port.Port, data, chunk_size=10, bisect=True)
+
+    @mock.patch('openstack.network.v2._proxy.Proxy._bulk_create')
+    def test_ports_bulk(self, bc):
+        data = [{'name': 'a'}, {'name': 'b'}]
+        bc.return_value = iter([mock.sentinel.a, mock.sentinel.b])
+        self.proxy._connection = self.cloud
+
+        results = list(self.proxy.bulk('create', data, port.Port))
+
+        bc.assert_called_once_with(port.Port, data)
+        self.assertEqual(
+            [mock.sentinel.a, mock.sentinel.b], [r.result for r in results]
+        )
+
 
 class TestNetworkQosBandwidth(TestNetworkProxy):
     def test_qos_bandwidth_limit_rule_create_attrs(self):
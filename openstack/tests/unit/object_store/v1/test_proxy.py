@@ -20,6 +20,7 @@ from unittest import mock
 import requests_mock
 from testscenarios import load_tests_apply_scenarios as load_tests  # noqa
 
+from openstack import exceptions
 from openstack.object_store.v1 import account
 from openstack.object_store.v1 import container
 from openstack.object_store.v1 import obj
@@ -78,6 +79,57 @@ class TestObjectStoreProxy(test_proxy_base.TestProxyBase):
             expected_kwargs={'name': 'container_name', "x": 1, "y": 2, "z": 3},
         )
 
+    def test_bulk_delete_objects(self):
+        objects = [
+            obj.Object(name=f'obj{i}', container='cnt') for i in range(3)
+        ]
+        responses = [
+            FakeResponse({'Errors': [['/cnt/obj1', '409 Conflict']]}),
+            FakeResponse({'Errors': []}),
+        ]
+        info = {'bulk_delete': {'max_deletes_per_request': 2}}
+
+        with (
+            mock.patch.object(self.proxy, 'get_info', return_value=info),
+            mock.patch.object(
+                self.proxy, '_bulk_delete', side_effect=responses
+            ) as bulk_delete,
+        ):
+            results = list(self.proxy.bulk('delete', objects, concurrency=1))
+
+        bulk_delete.assert_has_calls(
+            [mock.call(['cnt/obj0', 'cnt/obj1']), mock.call(['cnt/obj2'])]
+        )
+        errors = {r.item.name: r.error for r in results}
+        self.assertIsNone(errors['obj0'])
+        self.assertIsNotNone(errors['obj1'])
+        self.assertIsNone(errors['obj2'])
+
+    def test_bulk_delete_objects_not_ignore_missing(self):
+        objects = [
+            obj.Object(name=f'obj{i}', container='cnt') for i in range(2)
+        ]
+        info = {'bulk_delete': {'max_deletes_per_request': 2}}
+
+        with (
+            mock.patch.object(self.proxy, 'get_info', return_value=info),
+            mock.patch.object(self.proxy, '_bulk_delete') as bulk_delete,
+            mock.patch.object(
+                obj.Object,
+                'delete',
+                autospec=True,
+                side_effect=exceptions.NotFoundException(),
+            ),
+        ):
+            results = list(
+                self.proxy.bulk('delete', objects, ignore_missing=False)
+            )
+
+        bulk_delete.assert_not_called()
+        self.assertEqual(2, len(results))
+        for result in results:
+            self.assertIsInstance(result.error, exceptions.NotFoundException)
+
     def test_object_metadata_get(self):
         self._verify(
             "openstack.proxy.Proxy._head",
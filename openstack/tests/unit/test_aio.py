@@ -0,0 +1,223 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import json
+from unittest import mock
+
+from openstack import aio
+from openstack import exceptions
+from openstack import resource
+from openstack.tests.unit import base
+
+ENDPOINT = 'https://compute.example.com/v2.1'
+
+
+class Thing(resource.Resource):
+    resource_key = 'thing'
+    resources_key = 'things'
+    base_path = '/things'
+
+    allow_create = True
+    allow_fetch = True
+    allow_commit = True
+    allow_delete = True
+    allow_list = True
+
+    _query_mapping = resource.QueryParameters('name')
+
+    name = resource.Body('name')
+    status = resource.Body('status')
+
+
+class FakeClient(aio.AsyncHTTPClient):
+    def __init__(self, responses):
+        self.requests = []
+        self._responses = list(responses)
+
+    async def send(self, request):
+        self.requests.append(request)
+        status_code, body = self._responses.pop(0)
+        content = json.dumps(body).encode() if body is not None else b''
+        return aio.make_response(
+            request,
+            status_code,
+            {'content-type': 'application/json'},
+            content,
+        )
+
+
+class TestAsyncProxy(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.proxy = mock.Mock()
+        self.proxy.service_type = 'compute'
+        self.proxy.default_microversion = None
+        self.proxy.retriable_status_codes = None
+        self.proxy.status_code_retries = 0
+        self.proxy.status_code_retry_delay = 0
+        self.proxy.additional_headers = {}
+        self.proxy.user_agent = None
+        self.proxy.global_request_id = None
+        self.proxy.auth = None
+        self.proxy.session.additional_headers = {}
+        self.proxy.session.user_agent = None
+        self.proxy.session.auth.auth_ref = None
+        self.proxy.get_endpoint.return_value = ENDPOINT
+        self.proxy.get_auth_headers.return_value = {'X-Auth-Token': 'token'}
+        self.proxy._get_connection.return_value.cache_enabled = False
+        self.proxy._get_connection.return_value._global_request_id = None
+
+    def _make(self, responses, **kwargs):
+        self.client = FakeClient(responses)
+        return aio.AsyncProxy(self.proxy, client=self.client, **kwargs)
+
+    def test_request(self):
+        session = self._make([(200, {'version': 1}), (200, {})])
+
+        response = asyncio.run(
+            session.get('/servers', params={'name': 'a'}, microversion='2.5')
+        )
+
+        self.assertEqual({'version': 1}, response.json())
+        request = self.client.requests[0]
+        self.assertEqual(f'{ENDPOINT}/servers?name=a', request.url)
+        self.assertEqual('token', request.headers['X-Auth-Token'])
+        self.assertEqual(
+            'compute 2.5', request.headers['OpenStack-API-Version']
+        )
+        self.proxy._report_stats.assert_called_once_with(response)
+        # The endpoint is only discovered once
+        asyncio.run(session.get('/servers'))
+        self.proxy.get_endpoint.assert_called_once_with()
+
+    def test_request_retries_and_reauthenticates(self):
+        self.proxy.status_code_retries = 1
+        session = self._make([(401, None), (503, None), (200, {})])
+
+        response = asyncio.run(
+            session.get('/servers', retriable_status_codes=[503])
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, len(self.client.requests))
+        self.proxy.session.auth.invalidate.assert_called_once_with()
+
+    def test_request_raise_exc(self):
+        session = self._make([(404, {'itemNotFound': {'message': 'nope'}})])
+
+        self.assertRaises(
+            exceptions.NotFoundException,
+            asyncio.run,
+            session.get('/servers/1', raise_exc=True),
+        )
+
+    def test_create_fetch_commit_delete(self):
+        session = self._make(
+            [
+                (201, {'thing': {'id': '1', 'name': 'a'}}),
+                (200, {'thing': {'id': '1', 'name': 'a', 'status': 'OK'}}),
+                (200, {'thing': {'id': '1', 'name': 'b'}}),
+                (204, None),
+            ]
+        )
+
+        async def run():
+            thing = await aio.create(session, Thing(name='a'))
+            self.assertEqual('1', thing.id)
+            await aio.fetch(session, thing)
+            self.assertEqual('OK', thing.status)
+            thing.name = 'b'
+            await aio.commit(session, thing)
+            self.assertEqual('b', thing.name)
+            await aio.delete(session, thing)
+
+        asyncio.run(run())
+
+        self.assertEqual(
+            ['POST', 'GET', 'PUT', 'DELETE'],
+            [r.method for r in self.client.requests],
+        )
+        self.assertEqual(
+            {'thing': {'name': 'b'}}, json.loads(self.client.requests[2].body)
+        )
+
+    def test_list(self):
+        session = self._make(
+            [
+                (
+                    200,
+                    {
+                        'things': [{'id': '1'}, {'id': '2'}],
+                        'things_links': [
+                            {'rel': 'next', 'href': '/things?marker=2'}
+                        ],
+                    },
+                ),
+                (200, {'things': [{'id': '3'}]}),
+            ]
+        )
+
+        async def run():
+            return [t.id async for t in aio.list(session, Thing, name='x')]
+
+        self.assertEqual(['1', '2', '3'], asyncio.run(run()))
+        self.assertEqual(
+            f'{ENDPOINT}/things?name=x&marker=2', self.client.requests[1].url
+        )
+
+    def test_wait_for_status(self):
+        session = self._make(
+            [
+                (200, {'thing': {'id': '1', 'status': 'BUILD'}}),
+                (200, {'thing': {'id': '1', 'status': 'ACTIVE'}}),
+            ]
+        )
+        thing = Thing.existing(id='1', status='BUILD')
+
+        result = asyncio.run(
+            aio.wait_for_status(session, thing, 'ACTIVE', interval=0)
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertEqual(2, len(self.client.requests))
+
+    def test_wait_for_status_failure(self):
+        session = self._make(
+            [(200, {'thing': {'id': '1', 'status': 'ERROR'}})]
+        )
+        thing = Thing.existing(id='1', status='BUILD')
+
+        self.assertRaises(
+            exceptions.ResourceFailure,
+            asyncio.run,
+            aio.wait_for_status(session, thing, 'ACTIVE', interval=0),
+        )
+
+    def test_wait_for_status_many(self):
+        count = 100
+        session = self._make(
+            [(200, {'thing': {'id': 'x', 'status': 'ACTIVE'}})] * count
+        )
+
+        async def run():
+            things = [
+                Thing.existing(id=str(i), status='BUILD') for i in range(count)
+            ]
+            return await asyncio.gather(
+                *(
+                    aio.wait_for_status(session, t, 'ACTIVE', interval=0)
+                    for t in things
+                )
+            )
+
+        self.assertEqual(count, len(asyncio.run(run())))
@@ -0,0 +1,202 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from openstack import columnar
+from openstack.compute.v2 import flavor as _flavor
+from openstack.compute.v2 import server as _server
+from openstack import resource
+from openstack.tests import fakes
+from openstack.tests.unit import base
+
+
+class Thing(resource.Resource):
+    base_path = '/things'
+    resources_key = 'things'
+    allow_list = True
+
+    _query_mapping = resource.QueryParameters('status')
+
+    name = resource.Body('name')
+    status = resource.Body('status')
+    host = resource.Body('OS-EXT:host')
+    size = resource.Body('size', type=int)
+
+
+BODIES = [
+    {'id': '1', 'name': 'a', 'status': 'ACTIVE', 'OS-EXT:host': 'h1'},
+    {'id': '2', 'name': 'b', 'status': 'ERROR', 'OS-EXT:host': 'h2'},
+    {'id': '3', 'name': 'c', 'status': 'ACTIVE', 'OS-EXT:host': 'h1'},
+]
+
+
+class TestColumnarResult(base.TestCase):
+    use_numpy = False
+
+    def setUp(self):
+        super().setUp()
+        bodies = [dict(body, size=str(i)) for i, body in enumerate(BODIES)]
+        self.sot = columnar.ColumnarResult.from_bodies(
+            Thing,
+            bodies,
+            ['id', 'status', 'host', 'size'],
+            use_numpy=self.use_numpy,
+        )
+
+    def test_columns(self):
+        self.assertEqual(3, len(self.sot))
+        self.assertEqual(['id', 'status', 'host', 'size'], self.sot.columns)
+        self.assertEqual(
+            {
+                'id': ['1', '2', '3'],
+                'status': ['ACTIVE', 'ERROR', 'ACTIVE'],
+                'host': ['h1', 'h2', 'h1'],
+                'size': [0, 1, 2],
+            },
+            self.sot.to_dict(),
+        )
+
+    def test_unknown_column(self):
+        self.assertRaises(
+            ValueError,
+            columnar.ColumnarResult.from_bodies,
+            Thing,
+            BODIES,
+            ['id', 'foo'],
+        )
+
+    def test_row(self):
+        row = self.sot[-1]
+
+        self.assertIsInstance(row, Thing)
+        self.assertEqual('3', row.id)
+        self.assertEqual('h1', row.host)
+        self.assertEqual(2, row.size)
+        self.assertIsNone(row.name)
+        self.assertEqual(['1', '2', '3'], [row.id for row in self.sot])
+        self.assertRaises(IndexError, self.sot.row, 3)
+
+    def test_filter(self):
+        result = self.sot.filter(status='ACTIVE', host=['h1', 'h2'])
+
+        self.assertEqual(['1', '3'], result.to_dict()['id'])
+        self.assertEqual(
+            ['3'], result.filter(mask=[False, True]).to_dict()['id']
+        )
+        self.assertEqual(0, len(self.sot.filter(status='DELETED')))
+
+    def test_group_by(self):
+        groups = self.sot.group_by('host')
+
+        self.assertEqual(['h1', 'h2'], list(groups))
+        self.assertEqual(['1', '3'], groups['h1'].to_dict()['id'])
+        self.assertEqual([1], groups['h2'].to_dict()['size'])
+
+
+@testtools.skipIf(columnar.numpy is None, 'NumPy is not installed')
+class TestNumpyColumnarResult(TestColumnarResult):
+    use_numpy = True
+
+    def test_arrays(self):
+        self.assertEqual('int64', self.sot['size'].dtype.name)
+        self.assertEqual(
+            ['3'], self.sot.filter(mask=self.sot['size'] > 1).to_dict()['id']
+        )
+
+
+class TestProxyColumns(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.use_compute_discovery()
+
+    def test_list_columns(self):
+        servers = [
+            fakes.make_fake_server('1', 'a', status='ACTIVE'),
+            fakes.make_fake_server('2', 'b', status='ERROR'),
+        ]
+        servers[0]['OS-EXT-SRV-ATTR:host'] = 'h1'
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['status=ACTIVE'],
+                    ),
+                    json={'servers': servers},
+                ),
+            ]
+        )
+
+        result = self.cloud.compute._list(
+            _server.Server,
+            base_path='/servers/detail',
+            status='ACTIVE',
+            columns=['id', 'status', 'compute_host'],
+        )
+
+        self.assertIsInstance(result, columnar.ColumnarResult)
+        self.assertEqual(
+            {
+                'id': ['1', '2'],
+                'status': ['ACTIVE', 'ERROR'],
+                'compute_host': ['h1', None],
+            },
+            result.to_dict(),
+        )
+        self.assertIs(self.cloud, result[0]._connection)
+        self.assert_calls()
+
+    def test_list_columns_client_filters(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri='https://example.com/things',
+                    json={'things': BODIES},
+                ),
+            ]
+        )
+        sot = self.cloud.compute
+
+        result = sot._list(
+            Thing,
+            base_path='https://example.com/things',
+            host='h1',
+            columns=['id'],
+        )
+
+        self.assertEqual({'id': ['1', '3']}, result.to_dict())
+
+    def test_list_columns_overridden_list(self):
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['flavors', 'detail']
+                    ),
+                    json={'flavors': [fakes.make_fake_flavor('1', 'f1', 512)]},
+                ),
+            ]
+        )
+
+        result = self.cloud.compute._list(
+            _flavor.Flavor,
+            base_path='/flavors/detail',
+            columns=['name', 'ram'],
+        )
+
+        self.assertEqual({'name': ['f1'], 'ram': [512]}, result.to_dict())
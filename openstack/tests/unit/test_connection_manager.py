@@ -0,0 +1,225 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import threading
+from unittest import mock
+import uuid
+
+from openstack import connection_manager
+from openstack import exceptions
+from openstack.tests import fakes
+from openstack.tests.unit import base
+
+
+class TestConnectionManager(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.region_one = self.config.get_one(
+            '_test_cloud_', region_name='RegionOne'
+        )
+        self.region_two = self.config.get_one(
+            '_test_cloud_', region_name='RegionOne'
+        )
+        self.region_two.config['region_name'] = 'RegionTwo'
+        self.manager = connection_manager.ConnectionManager(
+            cloud_regions=[self.region_one, self.region_two],
+            max_workers=2,
+        )
+        self.addCleanup(self.manager.close)
+
+    def test_lazy_connections(self):
+        self.assertEqual(
+            [('_test_cloud_', 'RegionOne'), ('_test_cloud_', 'RegionTwo')],
+            self.manager.region_keys,
+        )
+        self.assertEqual({}, self.manager._connections)
+        conn = self.manager.get_connection('_test_cloud_', 'RegionOne')
+        self.assertIs(
+            conn, self.manager.get_connection('_test_cloud_', 'RegionOne')
+        )
+        self.assertEqual(1, len(self.manager._connections))
+
+    def test_get_connection_concurrent(self):
+        original = connection_manager.connection.Connection
+        barrier = threading.Barrier(4, timeout=5)
+        conns = []
+
+        def get_connection():
+            barrier.wait()
+            conns.append(
+                self.manager.get_connection('_test_cloud_', 'RegionOne')
+            )
+
+        with mock.patch.object(
+            connection_manager.connection,
+            'Connection',
+            side_effect=original,
+        ) as mock_connection:
+            threads = [
+                threading.Thread(target=get_connection) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_connection.assert_called_once()
+        self.assertEqual(4, len(conns))
+        self.assertEqual(1, len({id(conn) for conn in conns}))
+
+    def test_get_connection_requires_region(self):
+        self.assertRaises(
+            KeyError, self.manager.get_connection, '_test_cloud_'
+        )
+        self.assertRaises(
+            KeyError, self.manager.get_connection, 'missing', 'RegionOne'
+        )
+
+    def test_shared_resources(self):
+        one, two = self.manager.connections
+        self.assertIs(one._pool_executor, two._pool_executor)
+        self.assertIs(one.session, two.session)
+        self.assertIs(
+            self.manager._discovery_cache, one.config._discovery_cache
+        )
+        self.assertIs(self.manager._get_http_session(), one.session.session)
+
+    def test_close_connection_keeps_executor(self):
+        one, two = self.manager.connections
+
+        one.close()
+
+        self.assertEqual(2, two._pool_executor.submit(lambda: 2).result())
+        self.assertEqual(
+            [1, 1],
+            [result for _, result in self.manager.map(lambda conn: 1)],
+        )
+
+    def test_after_fork(self):
+        one, two = self.manager.connections
+        executor = self.manager.pool_executor
+        lock = self.manager._lock
+        adapter = self.manager._get_http_session().adapters['https://']
+        pool_manager = adapter.poolmanager
+
+        self.manager._after_fork()
+
+        new_executor = self.manager.pool_executor
+        self.assertIsNot(executor, new_executor)
+        self.assertIs(new_executor, one._pool_executor)
+        self.assertIs(new_executor, two._pool_executor)
+        self.assertIsNot(lock, self.manager._lock)
+        self.assertIsNot(pool_manager, adapter.poolmanager)
+        self.assertEqual(
+            [1, 1],
+            [result for _, result in self.manager.map(lambda conn: 1)],
+        )
+        executor.shutdown()
+
+    def test_after_fork_keeps_given_executor(self):
+        executor = mock.Mock()
+        manager = connection_manager.ConnectionManager(
+            cloud_regions=[self.region_one], pool_executor=executor
+        )
+        conn = manager.connections[0]
+
+        manager._after_fork()
+        conn._after_fork()
+
+        self.assertIs(executor, manager.pool_executor)
+        self.assertIs(executor, conn._pool_executor)
+        manager.close()
+
+    def test_registered_for_fork(self):
+        with mock.patch.object(self.manager, '_after_fork') as after_fork:
+            connection_manager._after_fork_in_child()
+        after_fork.assert_called_once_with()
+
+    def test_cache_namespaced_per_region(self):
+        for region in (self.region_one, self.region_two):
+            region._cache_class = 'dogpile.cache.memory'
+            region._cache_expiration_time = 60
+        one, two = self.manager.connections
+        one._cache.set('key', 'one')
+        two._cache.set('key', 'two')
+        self.assertEqual('one', one._cache.get('key'))
+        self.assertEqual('two', two._cache.get('key'))
+        self.assertEqual(2, len(self.manager._caches['dogpile.cache.memory']))
+
+    def test_map(self):
+        results = list(
+            self.manager.map(lambda c: [c.config.region_name, c.name])
+        )
+        self.assertEqual(4, len(results))
+        self.assertEqual(
+            {'RegionOne', 'RegionTwo', '_test_cloud_'},
+            {item for _, item in results},
+        )
+
+    def test_map_single_value(self):
+        results = list(self.manager.map(lambda c: c.config.region_name))
+        self.assertEqual(
+            ['RegionOne', 'RegionTwo'], sorted(item for _, item in results)
+        )
+
+    def test_map_uses_shared_executor(self):
+        # Every region waits on the shared executor, which has less
+        # workers than there are regions.
+        self.manager._max_workers = 1
+        results = self.manager.map(
+            lambda conn: conn._pool_executor.submit(
+                lambda: conn.config.region_name
+            ).result(timeout=5)
+        )
+        self.assertEqual(
+            ['RegionOne', 'RegionTwo'], sorted(item for _, item in results)
+        )
+
+    def test_map_error(self):
+        def func(conn):
+            if conn.config.region_name == 'RegionTwo':
+                raise exceptions.SDKException('broken region')
+            return [1, 2]
+
+        self.assertRaises(
+            exceptions.SDKException, list, self.manager.map(func)
+        )
+        results = list(self.manager.map(func, ignore_errors=True))
+        self.assertEqual([1, 2], sorted(item for _, item in results))
+
+    def test_map_proxy_generator(self):
+        server_id = str(uuid.uuid4())
+        fake_server = fakes.make_fake_server(server_id, 'name')
+        self.register_uris(
+            [
+                self.get_nova_discovery_mock_dict(),
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute', 'public', append=['servers', 'detail']
+                    ),
+                    json={'servers': [fake_server]},
+                ),
+            ]
+        )
+
+        results = list(
+            self.manager.map(
+                lambda c: c.compute.servers(),
+                keys=[('_test_cloud_', 'RegionOne')],
+            )
+        )
+
+        self.assertEqual(1, len(results))
+        conn, server = results[0]
+        self.assertEqual('RegionOne', conn.config.region_name)
+        self.assertEqual(server_id, server.id)
@@ -12,8 +12,10 @@
 
 import copy
 import queue
+import time
 from unittest import mock
 
+import fixtures
 from keystoneauth1 import session
 from testscenarios import load_tests_apply_scenarios as load_tests  # noqa
 
@@ -351,6 +353,133 @@ class TestProxyBulkCreate(base.TestCase):
         )
 
 
+class TestProxyBulk(base.TestCase):
+    class Res(resource.Resource):
+        base_path = '/fakes'
+
+        allow_create = True
+        allow_commit = True
+        allow_delete = True
+
+        name = resource.Body('name')
+
+    def setUp(self):
+        super().setUp()
+
+        self.session = mock.Mock()
+        self.session._sdk_connection = self.cloud
+        self.sot = proxy.Proxy(self.session)
+        self.sot._connection = self.cloud
+        self.sleep = self.useFixture(fixtures.MockPatch('time.sleep')).mock
+
+    def _http_error(self, status_code):
+        return exceptions.HttpException(
+            response=fakes.FakeResponse(status_code=status_code, data={})
+        )
+
+    def test_bulk_create(self):
+        with mock.patch.object(
+            self.Res, 'create', autospec=True, side_effect=lambda r, s, **kw: r
+        ):
+            results = list(
+                self.sot.bulk(
+                    'create', [{'name': 'a'}, {'name': 'b'}], self.Res
+                )
+            )
+
+        self.assertEqual(['a', 'b'], sorted(r.result.name for r in results))
+        self.assertTrue(all(r.error is None for r in results))
+
+    def test_bulk_delete_reports_errors(self):
+        error = self._http_error(500)
+
+        def delete(res, session):
+            if res.id == '2':
+                raise error
+            return res
+
+        with mock.patch.object(
+            self.Res, 'delete', autospec=True, side_effect=delete
+        ):
+            results = {
+                r.item: r
+                for r in self.sot.bulk('delete', ['1', '2'], self.Res)
+            }
+
+        self.assertIsNone(results['1'].error)
+        self.assertIs(error, results['2'].error)
+        self.assertIsNone(results['2'].result)
+
+    def test_bulk_update(self):
+        res = self.Res.existing(id='1', name='a')
+
+        with mock.patch.object(
+            self.Res, 'commit', autospec=True, side_effect=lambda r, s, **kw: r
+        ):
+            (result,) = self.sot.bulk('update', [res], name='b')
+
+        self.assertEqual('b', result.result.name)
+
+    def test_bulk_retries_conflict(self):
+        func = mock.Mock(side_effect=[self._http_error(409), 'done'])
+
+        (result,) = self.sot.bulk(func, ['item'])
+
+        self.assertEqual(('item', 'done', None), tuple(result))
+        self.assertEqual(2, func.call_count)
+        self.assertEqual(1, self.sleep.call_count)
+
+    def test_bulk_retries_exhausted(self):
+        error = self._http_error(503)
+        func = mock.Mock(side_effect=error)
+
+        (result,) = self.sot.bulk(func, ['item'], retries=2)
+
+        self.assertIs(error, result.error)
+        self.assertEqual(3, func.call_count)
+
+    def test_bulk_concurrency(self):
+        running = []
+        peak = []
+
+        def func(item):
+            running.append(item)
+            peak.append(len(running))
+            time.sleep(0)
+            running.remove(item)
+            return item
+
+        results = list(self.sot.bulk(func, range(20), concurrency=2))
+
+        self.assertEqual(list(range(20)), sorted(r.result for r in results))
+        self.assertLessEqual(max(peak), 2)
+
+    def test_bulk_native(self):
+        def call():
+            return [proxy.BulkResult(item, item, None) for item in items]
+
+        items = [{'name': 'a'}, {'name': 'b'}]
+        with mock.patch.object(
+            self.sot, '_bulk_native', return_value=[(items, call)]
+        ) as native:
+            results = list(self.sot.bulk('create', items, self.Res))
+
+        native.assert_called_once_with('create', self.Res, items, True)
+        self.assertEqual(items, [r.result for r in results])
+
+    def test_bulk_invalid_operation(self):
+        self.assertRaises(ValueError, self.sot.bulk, 'frobnicate', [])
+
+    def test_bulk_requires_resource_type(self):
+        self.assertRaises(ValueError, self.sot.bulk, 'create', [{'name': 'a'}])
+        self.assertRaises(
+            ValueError,
+            self.sot.bulk,
+            'delete',
+            [self.Res.existing(id='1'), '2'],
+        )
+
+
 class TestProxyGet(base.TestCase):
     def setUp(self):
         super().setUp()
@@ -572,6 +701,48 @@ class TestExtractName(base.TestCase):
         self.assertEqual(self.parts, results)
 
 
+class TestProxyWaitStats(base.TestCase):
+    def test_statsd(self):
+        statsd = mock.MagicMock()
+        pipe = statsd.pipeline.return_value.__enter__.return_value
+        sot = proxy.Proxy(
+            mock.Mock(),
+            statsd_client=statsd,
+            statsd_prefix='prefix',
+            service_type='compute',
+        )
+
+        sot._report_wait_stats('server', 4, 1.5, False)
+
+        pipe.timing.assert_called_once_with(
+            'prefix.compute.wait.server.done', 1500
+        )
+        pipe.incr.assert_has_calls(
+            [
+                mock.call('prefix.compute.wait.server.done'),
+                mock.call('prefix.compute.wait.server.polls', 4),
+            ]
+        )
+
+    def test_influxdb(self):
+        influxdb = mock.Mock()
+        sot = proxy.Proxy(
+            mock.Mock(), influxdb_client=influxdb, service_type='compute'
+        )
+
+        sot._report_wait_stats('server', 4, 1.5, True)
+
+        influxdb.write_points.assert_called_once_with(
+            [
+                dict(
+                    measurement='openstack_api.compute.wait',
+                    tags=dict(name='server', result='timeout'),
+                    fields=dict(polls=4, duration=1500),
+                )
+            ]
+        )
+
+
 class TestProxyCache(base.TestCase):
     class Res(resource.Resource):
         base_path = 'fake'
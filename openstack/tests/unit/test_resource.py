@@ -18,6 +18,8 @@ from unittest import mock
 from keystoneauth1 import adapter
 import requests
 
+from openstack.block_storage.v3 import volume as _volume
+from openstack.compute.v2 import server as _server
 from openstack import dns
 from openstack import exceptions
 from openstack import fields
@@ -573,6 +575,25 @@ class TestResource(base.TestCase):
                 expected.remove(attr)
         self.assertEqual([], expected)
 
+    def test__attributes_iterator_cached_per_class(self):
+        class Parent(resource.Resource):
+            foo = resource.Body('foo')
+
+        class Child(Parent):
+            bar = resource.Body('bar')
+
+        parent = dict(Parent._attributes_iterator((fields.Body,)))
+        child = dict(Child._attributes_iterator((fields.Body,)))
+
+        self.assertIn('foo', parent)
+        self.assertNotIn('bar', parent)
+        self.assertIn('bar', child)
+        # The subclass does not reuse the cache of its parent
+        self.assertIsNot(
+            Parent.__dict__['_attributes_cache'],
+            Child.__dict__['_attributes_cache'],
+        )
+
     def test_to_dict(self):
         class Test(resource.Resource):
             foo = resource.Header('foo')
@@ -3059,6 +3080,86 @@ class TestResourceActions(base.TestCase):
 
         self._test_bulk_create(Test, self.session.post, base_path='dummy')
 
+    def _test_bulk_create_chunked(self, data, bisect=False, status_code=400):
+        class Test(resource.Resource):
+            service = self.service_name
+            base_path = self.base_path
+            create_method = 'POST'
+            allow_create = True
+            resources_key = 'tests'
+
+            name = resource.Body('name')
+
+        def post(url, json, **kwargs):
+            items = json['tests']
+            if any(item['name'].startswith('bad') for item in items):
+                response = FakeResponse({}, status_code=status_code)
+                response.content = None
+                response.reason = 'Rejected'
+                return response
+            return FakeResponse(
+                {'tests': [dict(item, id=item['name']) for item in items]}
+            )
+
+        self.session.post.side_effect = post
+        return Test.bulk_create(
+            self.session,
+            [{'name': name} for name in data],
+            chunk_size=2,
+            bisect=bisect,
+        )
+
+    def test_bulk_create_chunked(self):
+        names = [f'res{i}' for i in range(5)]
+
+        res = list(self._test_bulk_create_chunked(names))
+
+        self.assertEqual(names, [r.id for r in res])
+        self.assertEqual(3, self.session.post.call_count)
+
+    def test_bulk_create_chunked_fail(self):
+        res = self._test_bulk_create_chunked(['res0', 'bad1', 'res2', 'res3'])
+
+        # The chunks following the failed one are still returned
+        self.assertEqual('res2', next(res).id)
+        self.assertEqual('res3', next(res).id)
+        exc = self.assertRaises(exceptions.BulkCreateFailure, next, res)
+        self.assertEqual(
+            [{'name': 'res0'}, {'name': 'bad1'}],
+            [attrs for attrs, _ in exc.failures],
+        )
+        self.assertIsInstance(
+            exc.failures[0][1], exceptions.BadRequestException
+        )
+        self.assertEqual(['res2', 'res3'], [r.id for r in exc.created])
+
+    def test_bulk_create_chunked_bisect(self):
+        names = ['res0', 'bad1', 'res2', 'res3', 'bad4']
+        res = self._test_bulk_create_chunked(names, bisect=True)
+
+        self.assertEqual(
+            ['res0', 'res2', 'res3'], [next(res).id for _ in range(3)]
+        )
+        exc = self.assertRaises(exceptions.BulkCreateFailure, next, res)
+        self.assertEqual(
+            [{'name': 'bad1'}, {'name': 'bad4'}],
+            [attrs for attrs, _ in exc.failures],
+        )
+
+    def test_bulk_create_chunked_bisect_forbidden(self):
+        names = ['res0', 'bad1', 'res2', 'res3']
+        res = self._test_bulk_create_chunked(
+            names, bisect=True, status_code=403
+        )
+
+        self.assertEqual(['res2', 'res3'], [next(res).id for _ in range(2)])
+        exc = self.assertRaises(exceptions.BulkCreateFailure, next, res)
+        self.assertIsInstance(
+            exc.failures[0][1], exceptions.ForbiddenException
+        )
+        # A forbidden chunk is not split, since no item is to blame
+        self.assertEqual(2, self.session.post.call_count)
+
     def test_bulk_create_fail(self):
         class Test(resource.Resource):
             service = self.service_name
@@ -3536,6 +3637,275 @@ class TestWaitForStatus(TestWait):
         # status and final status don't result in calls
         callback.assert_has_calls([mock.call(0)] * 3)
 
+    @mock.patch('time.sleep')
+    def test_schedule_and_stats(self, mock_sleep):
+        statuses = ['building', 'building', 'building', 'active']
+        res = self._fake_resource(statuses=statuses)
+        session = mock.Mock()
+        schedule = utils.ExponentialBackoff(initial=1, first_wait=0.1)
+
+        result = resource.wait_for_status(
+            session, res, 'active', None, interval=schedule, wait=60
+        )
+
+        self.assertEqual(result, res)
+        self.assertEqual(
+            [mock.call(0.1), mock.call(1.0)], mock_sleep.call_args_list
+        )
+        session._report_wait_stats.assert_called_once_with(
+            'mock', 3, mock.ANY, False
+        )
+
+
+class TestWaitForStatusMany(TestWait):
+    class Listable(resource.Resource):
+        base_path = '/things'
+        allow_list = True
+        allow_fetch = True
+
+        _query_mapping = resource.QueryParameters(
+            changes_since='changes-since'
+        )
+
+        status = resource.Body('status')
+        updated_at = resource.Body('updated')
+
+    class Fetchable(resource.Resource):
+        base_path = '/things'
+        allow_fetch = True
+
+        status = resource.Body('status')
+
+    def test_list_per_interval(self):
+        things = [
+            self.Listable.existing(id=str(i), status='BUILD', updated=f't{i}')
+            for i in range(3)
+        ]
+        pages = [
+            [self.Listable.existing(id='1', status='ACTIVE')],
+            [
+                self.Listable.existing(id='0', status='ERROR'),
+                self.Listable.existing(id='2', status='ACTIVE'),
+                self.Listable.existing(id='other', status='ACTIVE'),
+            ],
+        ]
+
+        with mock.patch.object(
+            self.Listable, 'list', side_effect=pages
+        ) as mock_list:
+            results = list(
+                resource.wait_for_status_many(
+                    self.cloud.compute, things, 'active', interval=1
+                )
+            )
+
+        self.assertEqual(['1', '0', '2'], [r.id for r, _ in results])
+        self.assertIsNone(results[0][1])
+        self.assertIsInstance(results[1][1], exceptions.ResourceFailure)
+        self.assertIsNone(results[2][1])
+        mock_list.assert_has_calls(
+            [
+                mock.call(self.cloud.compute, changes_since='t0'),
+                mock.call(self.cloud.compute, changes_since='t0'),
+            ]
+        )
+
+    def test_fetch_fallback(self):
+        things = [
+            self.Fetchable.existing(id=str(i), status='BUILD')
+            for i in range(2)
+        ]
+        statuses = {'0': ['BUILD', 'ACTIVE'], '1': ['ACTIVE']}
+
+        def fetch(res, session, **kwargs):
+            res.status = statuses[res.id].pop(0)
+            return res
+
+        with mock.patch.object(
+            self.Fetchable, 'fetch', autospec=True, side_effect=fetch
+        ) as mock_fetch:
+            results = list(
+                resource.wait_for_status_many(
+                    self.cloud.compute, things, 'ACTIVE', interval=1
+                )
+            )
+
+        self.assertEqual(['1', '0'], [r.id for r, _ in results])
+        self.assertEqual(3, mock_fetch.call_count)
+
+    def test_immediate_and_timeout(self):
+        done = self.Fetchable.existing(id='done', status='ACTIVE')
+        stuck = self.Fetchable.existing(id='stuck', status='BUILD')
+
+        with mock.patch.object(
+            self.Fetchable,
+            'fetch',
+            autospec=True,
+            side_effect=lambda r, s, **kw: r,
+        ):
+            results = list(
+                self.cloud.compute.wait_for_status_many(
+                    [done, stuck], 'ACTIVE', interval=0.01, wait=0.05
+                )
+            )
+
+        self.assertEqual([(done, None)], results[:1])
+        self.assertIs(stuck, results[1][0])
+        self.assertIsInstance(results[1][1], exceptions.ResourceTimeout)
+
+    def test_servers_listed_with_details(self):
+        self.use_compute_discovery()
+        servers = [
+            _server.Server.existing(id=str(i), status='BUILD', updated=f't{i}')
+            for i in range(2)
+        ]
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'compute',
+                        'public',
+                        append=['servers', 'detail'],
+                        qs_elements=['changes-since=t0'],
+                    ),
+                    json={
+                        'servers': [
+                            {'id': '0', 'status': 'ACTIVE'},
+                            {'id': '1', 'status': 'ERROR'},
+                        ]
+                    },
+                ),
+            ]
+        )
+
+        results = list(
+            self.cloud.compute.wait_for_status_many(
+                servers, 'ACTIVE', interval=0.01, wait=5
+            )
+        )
+
+        self.assertEqual(['0', '1'], [r.id for r, _ in results])
+        self.assertIsNone(results[0][1])
+        self.assertIsInstance(results[1][1], exceptions.ResourceFailure)
+        self.assert_calls()
+
+    def test_volumes_listed_with_details(self):
+        self.use_cinder()
+        volume = _volume.Volume.existing(id='0', status='creating')
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=self.get_mock_url(
+                        'volumev3',
+                        'public',
+                        append=['volumes', 'detail'],
+                        qs_elements=[f'status={status}'],
+                    ),
+                    json={'volumes': volumes},
+                )
+                for status, volumes in (
+                    ('available', [{'id': '0', 'status': 'available'}]),
+                    ('error', []),
+                )
+            ]
+        )
+
+        results = list(
+            self.cloud.block_storage.wait_for_status_many(
+                [volume],
+                'available',
+                failures=['error'],
+                interval=0.01,
+                wait=5,
+            )
+        )
+
+        self.assertEqual('available', results[0][0].status)
+        self.assertIsNone(results[0][1])
+        self.assert_calls()
+
+    def test_deleted(self):
+        things = [
+            self.Listable.existing(id=str(i), status='BUILD', updated=f't{i}')
+            for i in range(2)
+        ]
+        listed = [
+            self.Listable.existing(id='0', status='DELETED'),
+            self.Listable.existing(id='1', status='ACTIVE'),
+        ]
+
+        with mock.patch.object(self.Listable, 'list', return_value=listed):
+            results = list(
+                resource.wait_for_status_many(
+                    self.cloud.compute, things, 'ACTIVE', interval=1
+                )
+            )
+
+        self.assertEqual(['0', '1'], [r.id for r, _ in results])
+        self.assertIsInstance(results[0][1], exceptions.ResourceFailure)
+        self.assertIsNone(results[1][1])
+
+    def test_fetch_unlisted(self):
+        things = [
+            self.Listable.existing(id=str(i), status='BUILD', updated=f't{i}')
+            for i in range(2)
+        ]
+        listed = [self.Listable.existing(id='1', status='BUILD', updated='t1')]
+
+        with (
+            mock.patch.object(
+                self.Listable, 'list', return_value=listed
+            ) as mock_list,
+            mock.patch.object(
+                self.Listable,
+                'fetch',
+                autospec=True,
+                side_effect=exceptions.NotFoundException(),
+            ) as mock_fetch,
+        ):
+            results = resource.wait_for_status_many(
+                self.cloud.compute, things, 'ACTIVE', interval=0.01
+            )
+            res, error = next(results)
+
+        self.assertEqual('0', res.id)
+        self.assertIsInstance(error, exceptions.ResourceFailure)
+        self.assertEqual(resource._UNLISTED_POLLS, mock_list.call_count)
+        mock_fetch.assert_called_once_with(
+            things[0], self.cloud.compute, skip_cache=True
+        )
+
+    def test_listing_without_status(self):
+        thing = self.Listable.existing(id='0', status='BUILD', updated='t0')
+        things_uri = self.get_mock_url('compute', 'public', append=['things'])
+        self.register_uris(
+            [
+                dict(
+                    method='GET',
+                    uri=f'{things_uri}?changes-since=t0',
+                    complete_qs=True,
+                    json=[{'id': '0', 'name': 'thing'}],
+                ),
+                dict(
+                    method='GET',
+                    uri=f'{things_uri}/0',
+                    json={'id': '0', 'status': 'ACTIVE'},
+                ),
+            ]
+        )
+
+        results = list(
+            self.cloud.compute.wait_for_status_many(
+                [thing], 'ACTIVE', interval=0.01, wait=5
+            )
+        )
+
+        self.assertEqual('ACTIVE', results[0][0].status)
+        self.assertIsNone(results[0][1])
+        self.assert_calls()
+
 
 class TestWaitForDelete(TestWait):
     def test_success_not_found(self):
@@ -0,0 +1,145 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import concurrent.futures
+import threading
+from unittest import mock
+
+from openstack import scheduler
+from openstack.tests.unit import base
+
+
+class TestWorkScheduler(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.sot = scheduler.WorkScheduler(max_workers=2)
+        self.addCleanup(self.sot.shutdown, cancel_futures=True)
+
+    def _block(self, category, count=1):
+        """Occupy workers until the returned event is set."""
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def blocker():
+            started.release()
+            release.wait()
+
+        futures = [self.sot.submit_to(category, blocker) for _ in range(count)]
+        for _ in range(count):
+            started.acquire()
+        self.addCleanup(release.set)
+        return release, futures
+
+    def test_submit(self):
+        future = self.sot.submit(lambda a, b=0: a + b, 1, b=2)
+        self.assertEqual(3, future.result())
+
+    def test_exception(self):
+        future = self.sot.submit(mock.Mock(side_effect=ValueError))
+        self.assertRaises(ValueError, future.result)
+
+    def test_unknown_category(self):
+        self.assertRaises(ValueError, self.sot.submit_to, 'foo', print)
+
+    def test_priority(self):
+        self.sot = scheduler.WorkScheduler(max_workers=1)
+        self.addCleanup(self.sot.shutdown, cancel_futures=True)
+        release, _ = self._block(scheduler.USER)
+        order = []
+        upload = self.sot.submit_to(scheduler.UPLOAD, order.append, 'upload')
+        user = self.sot.submit(order.append, 'user')
+
+        release.set()
+        concurrent.futures.wait([upload, user])
+
+        self.assertEqual(['user', 'upload'], order)
+
+    def test_concurrency_limit(self):
+        sot = scheduler.WorkScheduler(
+            max_workers=3,
+            categories={
+                scheduler.UPLOAD: scheduler.Category(30, concurrency=1)
+            },
+        )
+        self.addCleanup(sot.shutdown, cancel_futures=True)
+        self.sot = sot
+        release, _ = self._block(scheduler.UPLOAD)
+
+        queued = sot.submit_to(scheduler.UPLOAD, lambda: 'upload')
+        user = sot.submit(lambda: 'user')
+
+        # The upload has to wait for the first one, a user call does not
+        self.assertEqual('user', user.result(timeout=5))
+        self.assertFalse(queued.done())
+        stats = sot.stats()
+        self.assertEqual(1, stats['categories']['upload']['queued'])
+        self.assertEqual(1, stats['categories']['upload']['running'])
+
+        release.set()
+        self.assertEqual('upload', queued.result(timeout=5))
+
+    def test_backpressure(self):
+        sot = scheduler.WorkScheduler(
+            max_workers=1,
+            categories={scheduler.UPLOAD: scheduler.Category(30, max_queue=1)},
+        )
+        self.addCleanup(sot.shutdown, cancel_futures=True)
+        self.sot = sot
+        release, _ = self._block(scheduler.USER)
+        sot.submit_to(scheduler.UPLOAD, lambda: None)
+
+        submitted = threading.Event()
+
+        def submit():
+            sot.submit_to(scheduler.UPLOAD, lambda: None)
+            submitted.set()
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        self.assertFalse(submitted.wait(0.1))
+
+        release.set()
+        self.assertTrue(submitted.wait(5))
+        thread.join()
+
+    def test_stats(self):
+        release, _ = self._block(scheduler.USER)
+
+        stats = self.sot.stats()
+
+        self.assertEqual(2, stats['max_workers'])
+        self.assertEqual(1, stats['busy'])
+        self.assertEqual(0.5, stats['utilization'])
+        self.assertEqual(1, stats['categories']['user']['running'])
+
+    def test_shutdown_cancel_futures(self):
+        release, _ = self._block(scheduler.USER, 2)
+        future = self.sot.submit(lambda: None)
+
+        self.sot.shutdown(wait=False, cancel_futures=True)
+
+        self.assertTrue(future.cancelled())
+        self.assertRaises(RuntimeError, self.sot.submit, lambda: None)
+
+    def test_submit_helper(self):
+        executor = mock.Mock()
+        scheduler.submit(executor, scheduler.UPLOAD, print, 1)
+        executor.submit.assert_called_once_with(print, 1)
+
+
+class TestConnectionScheduler(base.TestCase):
+    def test_default_executor(self):
+        self.assertIsInstance(
+            self.cloud._pool_executor, scheduler.WorkScheduler
+        )
+        future = self.cloud._submit_task(scheduler.UPLOAD, lambda: 42)
+        self.assertEqual(42, future.result())
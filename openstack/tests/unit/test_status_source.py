@@ -0,0 +1,194 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import itertools
+import queue
+import threading
+from unittest import mock
+
+from openstack import exceptions
+from openstack import proxy
+from openstack import resource
+from openstack import status_source
+from openstack.tests.unit import base
+
+
+class Thing(resource.Resource):
+    base_path = '/things'
+    allow_fetch = True
+
+    status = resource.Body('status')
+    task_state = resource.Body('OS-EXT-STS:task_state')
+
+
+class TestEventStatusSource(base.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.events = queue.Queue()
+        self.source = status_source.EventStatusSource(
+            iter(self.events.get, None), timeout=1
+        )
+        self.addCleanup(self.events.put, None)
+        self.session = mock.Mock(spec=['get'])
+        self.thing = Thing.existing(id='1', status='BUILD')
+        self.thing.fetch = mock.Mock()
+
+    def test_wait_for_status(self):
+        self.events.put({'id': '2', 'status': 'ACTIVE'})
+        self.events.put({'id': '1', 'status': 'BUILD'})
+        self.events.put(
+            {'id': '1', 'status': 'ACTIVE', 'OS-EXT-STS:task_state': None}
+        )
+
+        result = resource.wait_for_status(
+            self.session, self.thing, 'ACTIVE', wait=10, source=self.source
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.assertIsNone(result.task_state)
+        self.assertFalse(result._body.dirty)
+        self.thing.fetch.assert_not_called()
+
+    def test_wait_for_status_event_after_start(self):
+        timer = threading.Timer(
+            0.1, self.events.put, [{'id': '1', 'status': 'ACTIVE'}]
+        )
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        result = resource.wait_for_status(
+            self.session, self.thing, 'ACTIVE', wait=10, source=self.source
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+
+    def test_wait_for_status_failure(self):
+        self.events.put({'id': '1', 'status': 'ERROR'})
+
+        self.assertRaises(
+            exceptions.ResourceFailure,
+            resource.wait_for_status,
+            self.session,
+            self.thing,
+            'ACTIVE',
+            wait=10,
+            source=self.source,
+        )
+
+    def test_wait_for_status_timeout(self):
+        self.source.timeout = 0.01
+
+        self.assertRaises(
+            exceptions.ResourceTimeout,
+            resource.wait_for_status,
+            self.session,
+            self.thing,
+            'ACTIVE',
+            wait=0.05,
+            source=self.source,
+        )
+        self.thing.fetch.assert_not_called()
+
+    def test_wait_for_delete(self):
+        self.events.put({'id': '1', 'deleted': True})
+
+        result = resource.wait_for_delete(
+            self.session, self.thing, wait=10, source=self.source
+        )
+
+        self.assertIs(self.thing, result)
+        self.thing.fetch.assert_not_called()
+
+    def test_proxy_status_source(self):
+        sot = proxy.Proxy(mock.Mock())
+        sot.status_source = self.source
+        self.events.put({'id': '1', 'status': 'ACTIVE'})
+
+        result = resource.wait_for_status(sot, self.thing, 'ACTIVE', wait=10)
+
+        self.assertEqual('ACTIVE', result.status)
+        self.thing.fetch.assert_not_called()
+
+    def test_custom_parse(self):
+        def parse(event):
+            if event['event_type'] != 'thing.update':
+                return None
+            return event['payload']['id'], event['payload']['attrs']
+
+        source = status_source.EventStatusSource(
+            [
+                {'event_type': 'other', 'payload': {}},
+                {
+                    'event_type': 'thing.update',
+                    'payload': {'id': '1', 'attrs': {'status': 'ACTIVE'}},
+                },
+            ],
+            parse=parse,
+        )
+
+        result = resource.wait_for_status(
+            self.session, self.thing, 'ACTIVE', wait=10, source=source
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+
+    def test_stream_end_falls_back_to_polling(self):
+        source = status_source.EventStatusSource([], timeout=0)
+        self.thing.fetch.return_value = Thing.existing(id='1', status='ACTIVE')
+
+        result = resource.wait_for_status(
+            self.session, self.thing, 'ACTIVE', wait=10, source=source
+        )
+
+        self.assertEqual('ACTIVE', result.status)
+        self.thing.fetch.assert_called_once_with(self.session, skip_cache=True)
+
+    def test_max_pending(self):
+        self.source.max_pending = 2
+        for i in range(3):
+            self.source.push({'id': str(i), 'status': 'ACTIVE'})
+
+        self.assertEqual(['1', '2'], list(self.source._states))
+
+
+class TestZaqarEvents(base.TestCase):
+    def test_events(self):
+        message_proxy = mock.Mock()
+        message_proxy.create_claim.side_effect = [
+            mock.Mock(messages=[]),
+            mock.Mock(
+                messages=[
+                    {
+                        'href': '/v2/queues/q/messages/m1?claim_id=c',
+                        'body': {'id': '1', 'status': 'ACTIVE'},
+                    },
+                    {
+                        'href': '/v2/queues/q/messages/m2?claim_id=c',
+                        'body': {'id': '2', 'status': 'ERROR'},
+                    },
+                ]
+            ),
+        ]
+
+        events = status_source.zaqar_events(message_proxy, 'q', interval=0)
+
+        self.assertEqual(
+            [{'id': '1', 'status': 'ACTIVE'}, {'id': '2', 'status': 'ERROR'}],
+            list(itertools.islice(events, 2)),
+        )
+        message_proxy.create_claim.assert_called_with(
+            'q', ttl=60, grace=60, limit=10
+        )
+        self.assertEqual(
+            ['m1', 'm2'],
+            [c.args[1] for c in message_proxy.delete_message.call_args_list],
+        )
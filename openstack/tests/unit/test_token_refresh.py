@@ -0,0 +1,117 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+from unittest import mock
+
+from openstack import _token_refresh
+from openstack import connection
+from openstack.tests.unit import base
+
+
+def _make_auth(expires_in, lifetime=3600):
+    auth = mock.Mock()
+    auth.auth_ref.expires = datetime.datetime.now(
+        datetime.timezone.utc
+    ) + datetime.timedelta(seconds=expires_in)
+    auth.auth_ref.issued = auth.auth_ref.expires - datetime.timedelta(
+        seconds=lifetime
+    )
+    return auth
+
+
+class TestTokenRefresher(base.TestCase):
+    def test_next_refresh_delay(self):
+        refresher = _token_refresh.TokenRefresher(
+            _make_auth(3600), mock.Mock(), window=300
+        )
+        self.assertAlmostEqual(3300, refresher.next_refresh_delay(), delta=5)
+
+    def test_next_refresh_delay_short_lived_token(self):
+        refresher = _token_refresh.TokenRefresher(
+            _make_auth(200, lifetime=200), mock.Mock(), window=300
+        )
+        self.assertAlmostEqual(100, refresher.next_refresh_delay(), delta=5)
+
+    def test_next_refresh_delay_no_token(self):
+        auth = mock.Mock()
+        auth.auth_ref = None
+        refresher = _token_refresh.TokenRefresher(auth, mock.Mock())
+        self.assertEqual(
+            _token_refresh.RETRY_INTERVAL, refresher.next_refresh_delay()
+        )
+
+    def test_refresh_not_needed(self):
+        renew = mock.Mock()
+        refresher = _token_refresh.TokenRefresher(
+            _make_auth(3600), renew, window=300
+        )
+        self.assertFalse(refresher.refresh())
+        renew.assert_not_called()
+
+    def test_refresh(self):
+        renew = mock.Mock()
+        refresher = _token_refresh.TokenRefresher(
+            _make_auth(100), renew, window=300
+        )
+        self.assertTrue(refresher.refresh())
+        renew.assert_called_once_with()
+
+    def test_acquire_release(self):
+        refresher = _token_refresh.TokenRefresher(
+            _make_auth(3600), mock.Mock()
+        )
+        refresher.acquire()
+        refresher.acquire()
+        self.assertTrue(refresher.running)
+        refresher.release()
+        self.assertTrue(refresher.running)
+        refresher.release()
+        self.assertFalse(refresher.running)
+
+
+class TestConnectionTokenRefresh(base.TestCase):
+    def test_start_stop(self):
+        self.cloud.start_token_refresh(window=600)
+        refresher = self.cloud._token_refresher
+        self.assertTrue(refresher.running)
+        self.assertEqual(600, refresher.window)
+        self.assertIs(refresher, self.cloud.session._sdk_token_refresher)
+
+        self.cloud.stop_token_refresh()
+        self.assertIsNone(self.cloud._token_refresher)
+        self.assertFalse(refresher.running)
+
+    def test_shared_by_connections_with_same_session(self):
+        self.cloud.start_token_refresh()
+        other = self.cloud.global_request('req-id')
+        other.start_token_refresh()
+        self.assertIs(self.cloud._token_refresher, other._token_refresher)
+
+        other.close()
+        self.assertTrue(self.cloud._token_refresher.running)
+        refresher = self.cloud._token_refresher
+        self.cloud.close()
+        self.assertFalse(refresher.running)
+
+    def test_renew_uses_config(self):
+        with mock.patch.object(self.cloud.config, 'renew_auth') as renew:
+            self.cloud.start_token_refresh()
+            self.cloud._token_refresher._renew()
+        self.cloud.stop_token_refresh()
+        renew.assert_called_once_with(self.cloud.session)
+
+    def test_started_from_config(self):
+        self.cloud_config.config['token_refresh_window'] = '400'
+        conn = connection.Connection(config=self.cloud_config)
+        self.addCleanup(conn.close)
+        self.assertEqual(400, conn._token_refresher.window)
@@ -131,6 +131,80 @@ class Test_urljoin(base.TestCase):
         self.assertEqual(result, "http://www.example.com/ascii/extra_chars-™")
 
 
+class TestWaitSchedule(base.TestCase):
+    @staticmethod
+    def _take(schedule, count):
+        delays = schedule.delays()
+        return [next(delays) for _ in range(count)]
+
+    def test_fixed(self):
+        self.assertEqual([3.0] * 3, self._take(utils.FixedWait(3), 3))
+
+    def test_exponential_backoff(self):
+        schedule = utils.ExponentialBackoff(initial=1, factor=2, max_wait=5)
+        self.assertEqual([1, 2, 4, 5, 5], self._take(schedule, 5))
+
+    def test_exponential_backoff_first_wait(self):
+        schedule = utils.ExponentialBackoff(initial=2, first_wait=0.5)
+        self.assertEqual([0.5, 2, 4], self._take(schedule, 3))
+
+    def test_decorrelated_jitter(self):
+        schedule = utils.DecorrelatedJitter(base=1, max_wait=10)
+        delays = self._take(schedule, 50)
+        self.assertTrue(all(1 <= d <= 10 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_decorrelated_jitter_first_wait(self):
+        schedule = utils.DecorrelatedJitter(first_wait=0.2)
+        self.assertEqual(0.2, self._take(schedule, 1)[0])
+
+
+class TestIterateTimeout(base.TestCase):
+    @mock.patch('time.sleep')
+    def test_schedule(self, mock_sleep):
+        schedule = utils.ExponentialBackoff(initial=1, first_wait=0.1)
+        for count in utils.iterate_timeout(10, 'timeout', wait=schedule):
+            if count == 4:
+                break
+        self.assertEqual(
+            [mock.call(0.1), mock.call(1.0), mock.call(2.0)],
+            mock_sleep.call_args_list,
+        )
+
+    @mock.patch('time.sleep')
+    def test_stats(self, mock_sleep):
+        stats = mock.Mock()
+
+        def wait():
+            for count in utils.iterate_timeout(10, 'timeout', stats=stats):
+                if count == 3:
+                    return
+
+        wait()
+
+        stats.assert_called_once_with(3, mock.ANY, False)
+
+    @mock.patch('time.sleep')
+    def test_stats_timeout(self, mock_sleep):
+        stats = mock.Mock()
+
+        self.assertRaises(
+            exceptions.ResourceTimeout,
+            list,
+            utils.iterate_timeout(0, 'timeout', stats=stats),
+        )
+
+        stats.assert_called_once_with(0, mock.ANY, True)
+
+    @mock.patch('time.sleep')
+    def test_stats_error_ignored(self, mock_sleep):
+        stats = mock.Mock(side_effect=RuntimeError)
+
+        self.assertEqual(
+            1, next(iter(utils.iterate_timeout(10, 'timeout', stats=stats)))
+        )
+
+
 class TestSupportsMicroversion(base.TestCase):
     def setUp(self):
         super().setUp()
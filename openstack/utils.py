@@ -14,6 +14,7 @@ import collections.abc
 import hashlib
 import io
 import queue
+import random
 import string
 import threading
 import time
@@ -37,10 +38,106 @@ def urljoin(*args: ty.Optional[str]) -> str:
     return '/'.join(str(a or '').strip('/') for a in args)
 
 
+class WaitSchedule:
+    """Base class for the delays used between checks by
+    :func:`iterate_timeout`.
+
+    Subclasses implement :meth:`delays`, a generator of the number of seconds
+    to sleep after each check. A new generator is created for every wait, so
+    schedules may be shared between callers.
+    """
+
+    def delays(self) -> ty.Iterator[float]:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        args = ', '.join(f'{k}={v!r}' for k, v in vars(self).items())
+        return f'{self.__class__.__name__}({args})'
+
+
+class FixedWait(WaitSchedule):
+    """Wait the same number of seconds between all checks.
+
+    :param interval: Number of seconds to wait between checks.
+    """
+
+    def __init__(self, interval: float = 2) -> None:
+        self.interval = float(interval)
+
+    def delays(self) -> ty.Iterator[float]:
+        while True:
+            yield self.interval
+
+
+class ExponentialBackoff(WaitSchedule):
+    """Wait exponentially longer between checks, up to a cap.
+
+    :param initial: Number of seconds to wait after the first check.
+    :param factor: Multiplier applied to the delay after each check.
+    :param max_wait: Maximum number of seconds to wait between checks.
+    :param first_wait: If set, number of seconds to wait after the first
+        check instead of ``initial``. A short first wait catches operations
+        which complete quickly without polling aggressively afterwards.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1,
+        factor: float = 2,
+        max_wait: float = 30,
+        first_wait: ty.Optional[float] = None,
+    ) -> None:
+        self.initial = float(initial)
+        self.factor = float(factor)
+        self.max_wait = float(max_wait)
+        self.first_wait = first_wait
+
+    def delays(self) -> ty.Iterator[float]:
+        if self.first_wait is not None:
+            yield float(self.first_wait)
+        delay = self.initial
+        while True:
+            yield min(delay, self.max_wait)
+            delay *= self.factor
+
+
+class DecorrelatedJitter(WaitSchedule):
+    """Wait a random, growing number of seconds between checks.
+
+    Each delay is drawn uniformly between ``base`` and three times the
+    previous delay, and capped at ``max_wait``. This spreads the checks of
+    many concurrent waits over time instead of polling in lockstep.
+
+    :param base: Minimum number of seconds to wait between checks.
+    :param max_wait: Maximum number of seconds to wait between checks.
+    :param first_wait: If set, number of seconds to wait after the first
+        check, before any jitter is applied.
+    """
+
+    def __init__(
+        self,
+        base: float = 1,
+        max_wait: float = 30,
+        first_wait: ty.Optional[float] = None,
+    ) -> None:
+        self.base = float(base)
+        self.max_wait = float(max_wait)
+        self.first_wait = first_wait
+
+    def delays(self) -> ty.Iterator[float]:
+        if self.first_wait is not None:
+            yield float(self.first_wait)
+        delay = self.base
+        while True:
+            delay = min(self.max_wait, random.uniform(self.base, delay * 3))
+            yield delay
+
+
 def iterate_timeout(
     timeout: ty.Optional[int],
     message: str,
-    wait: ty.Union[int, float, None] = 2,
+    wait: ty.Union[int, float, WaitSchedule, None] = 2,
+    stats: ty.Optional[ty.Callable[[int, float, bool], None]] = None,
 ) -> ty.Generator[int, None, None]:
     """Iterate and raise an exception on timeout.
 
@@ -52,40 +149,59 @@ def iterate_timeout(
         ``None`` to wait forever.
     :param message: The message to use for the exception if the timeout is
         reached.
-    :param wait: Number of seconds to wait between checks. Set to ``None``
-        to use the default interval.
+    :param wait: Number of seconds to wait between checks, or a
+        :class:`WaitSchedule` such as :class:`ExponentialBackoff`. Set to
+        ``None`` to use the default interval.
+    :param stats: Optional callable invoked once the iteration ends, with the
+        number of checks made, the number of seconds waited and whether the
+        wait timed out.
 
     :returns: None
     :raises: :class:`~openstack.exceptions.ResourceTimeout` transition
     :raises: :class:`~openstack.exceptions.SDKException` if ``wait`` is not a
-        valid float, integer or None.
+        valid float, integer, schedule or None.
     """
     log = _log.setup_logging('openstack.iterate_timeout')
 
-    try:
-        # None as a wait winds up flowing well in the per-resource cache
-        # flow. We could spread this logic around to all of the calling
-        # points, but just having this treat None as "I don't have a value"
-        # seems friendlier
-        if wait is None:
-            wait = 2
-        elif wait == 0:
-            # wait should be < timeout, unless timeout is None
-            wait = 0.1 if timeout is None else min(0.1, timeout)
-        wait = float(wait)
-    except ValueError:
-        raise exceptions.SDKException(
-            f"Wait value must be an int or float value. {wait!r} given instead"
-        )
+    if isinstance(wait, WaitSchedule):
+        schedule = wait
+    else:
+        try:
+            # None as a wait winds up flowing well in the per-resource cache
+            # flow. We could spread this logic around to all of the calling
+            # points, but just having this treat None as "I don't have a
+            # value" seems friendlier
+            if wait is None:
+                wait = 2
+            elif wait == 0:
+                # wait should be < timeout, unless timeout is None
+                wait = 0.1 if timeout is None else min(0.1, timeout)
+            schedule = FixedWait(wait)
+        except (TypeError, ValueError):
+            raise exceptions.SDKException(
+                f"Wait value must be an int or float value. {wait!r} given "
+                f"instead"
+            )
 
+    delays = schedule.delays()
     start = time.time()
     count = 0
-    while (timeout is None) or (time.time() < start + timeout):
-        count += 1
-        yield count
-        log.debug('Waiting %s seconds', wait)
-        time.sleep(wait)
-    raise exceptions.ResourceTimeout(message)
+    timed_out = False
+    try:
+        while (timeout is None) or (time.time() < start + timeout):
+            count += 1
+            yield count
+            delay = next(delays)
+            log.debug('Waiting %s seconds', delay)
+            time.sleep(delay)
+        timed_out = True
+        raise exceptions.ResourceTimeout(message)
+    finally:
+        if stats is not None:
+            try:
+                stats(count, time.time() - start, timed_out)
+            except Exception:
+                log.exception('Error reporting wait statistics')
 
 
 class _AccessSaver:
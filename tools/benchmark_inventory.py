@@ -0,0 +1,89 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""Benchmark the serialization of an inventory of synthetic servers.
+
+Compares converting servers with dir() introspection to the fast path of
+obj_to_munch for resources, then times the JSON output of the inventory.
+No cloud is needed::
+
+    python tools/benchmark_inventory.py --count 10000
+"""
+
+import argparse
+import json
+import time
+
+from openstack.cloud import meta
+from openstack.compute.v2 import server as _server
+from openstack.tests import fakes
+
+
+def make_servers(count):
+    servers = []
+    for i in range(count):
+        server = _server.Server(
+            **fakes.make_fake_server(
+                server_id=f'server-{i}',
+                name=f'server-{i}',
+                status='ACTIVE',
+                addresses={
+                    'private': [
+                        {
+                            'OS-EXT-IPS:type': 'fixed',
+                            'addr': f'10.{i // 65536}.{i // 256 % 256}.'
+                            f'{i % 256}',
+                            'version': 4,
+                        }
+                    ]
+                },
+                flavor={'id': '101', 'original_name': 'm1.small'},
+                image={'id': 'image-1'},
+            )
+        )
+        server['metadata'] = {'group': f'group-{i % 10}'}
+        server['public_v4'] = ''
+        server['private_v4'] = server.addresses['private'][0]['addr']
+        servers.append(server)
+    return servers
+
+
+def timed(func, servers):
+    start = time.perf_counter()
+    result = [func(server) for server in servers]
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--count', type=int, default=10000, help='Number of servers'
+    )
+    args = parser.parse_args()
+
+    servers = make_servers(args.count)
+
+    _, introspected = timed(meta._object_to_munch, servers)
+    hostvars, fast = timed(meta.obj_to_munch, servers)
+
+    start = time.perf_counter()
+    output = json.dumps(hostvars, sort_keys=True, indent=2)
+    dumped = time.perf_counter() - start
+
+    print(f'servers:             {args.count}')
+    print(f'dir() introspection: {introspected:.3f}s')
+    print(f'resource fast path:  {fast:.3f}s ({introspected / fast:.1f}x)')
+    print(f'json output:         {dumped:.3f}s ({len(output)} bytes)')
+
+
+if __name__ == '__main__':
+    main()